@@ -69,6 +69,7 @@ DJANGO_APPS = [
     "django.contrib.sites",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
     # "django.contrib.humanize", # Handy template tags
     "dal",
     "dal_select2",
@@ -559,6 +560,40 @@ SPECTACULAR_SETTINGS = {
 # Football Kit Archive API Settings
 FKA_API_IP = env("FKA_API_IP")
 API_KEY = env("API_KEY")
+# Shared keep-alive connection pool used by every FKAPIClient in a process.
+# POOL_MAXSIZE is the per-host connection limit; with POOL_BLOCK enabled, callers
+# wait for a free connection instead of opening extra ones past the limit.
+FKAPI_HTTP_POOL_CONNECTIONS = env.int("FKAPI_HTTP_POOL_CONNECTIONS", default=10)
+FKAPI_HTTP_POOL_MAXSIZE = env.int("FKAPI_HTTP_POOL_MAXSIZE", default=20)
+FKAPI_HTTP_POOL_BLOCK = env.bool("FKAPI_HTTP_POOL_BLOCK", default=False)
+# Single-flight for identical cache misses: one worker fetches while the others
+# wait up to WAIT_TIMEOUT seconds for its result before fetching themselves.
+FKAPI_SINGLE_FLIGHT_LOCK_TIMEOUT = env.int("FKAPI_SINGLE_FLIGHT_LOCK_TIMEOUT", default=15)
+FKAPI_SINGLE_FLIGHT_WAIT_TIMEOUT = env.float("FKAPI_SINGLE_FLIGHT_WAIT_TIMEOUT", default=5.0)
+# Per-endpoint overrides of the FKAPI stale-while-revalidate cache lifetimes,
+# keyed by endpoint prefix. Defaults live in footycollect.api.cache_policy, e.g.
+# {"/kits/search": {"soft_ttl": 600, "hard_ttl": 86400}}
+FKAPI_CACHE_POLICIES: dict[str, dict[str, int]] = {}
+# FKAPI cache entries are stored as JSON and zlib-compressed from this size up.
+FKAPI_CACHE_COMPRESS_MIN_BYTES = env.int("FKAPI_CACHE_COMPRESS_MIN_BYTES", default=1024)
+# Outbound FKAPI quota shared by web and Celery workers (token bucket in Redis).
+# BURST is the bucket capacity; weights make heavier endpoints cost more tokens.
+FKAPI_RATE_LIMIT_PER_MINUTE = env.int("FKAPI_RATE_LIMIT_PER_MINUTE", default=100)
+FKAPI_RATE_LIMIT_BURST = env.int("FKAPI_RATE_LIMIT_BURST", default=20)
+FKAPI_RATE_LIMIT_WEIGHTS: dict[str, int] = {}
+# Autocomplete serves local matches first; FKAPI is queried inline only when
+# fewer than LOCAL_MIN_RESULTS match, otherwise in the background at most once
+# per ENRICH_INTERVAL seconds for the same query.
+AUTOCOMPLETE_LOCAL_MIN_RESULTS = env.int("AUTOCOMPLETE_LOCAL_MIN_RESULTS", default=5)
+AUTOCOMPLETE_ENRICH_INTERVAL = env.int("AUTOCOMPLETE_ENRICH_INTERVAL", default=3600)
+
+# Feed filter facet counts: cached per filter set for CACHE_TIMEOUT seconds;
+# item changes trigger one FeedFacetCount rebuild after REBUILD_DELAY seconds.
+FEED_FACET_CACHE_TIMEOUT = env.int("FEED_FACET_CACHE_TIMEOUT", default=600)
+FEED_FACET_REBUILD_DELAY = env.int("FEED_FACET_REBUILD_DELAY", default=60)
+# Anonymous feed pages and infinite scroll fragments are shared for
+# PAGE_CACHE_TIMEOUT seconds (0 disables); public item changes expire them.
+FEED_PAGE_CACHE_TIMEOUT = env.int("FEED_PAGE_CACHE_TIMEOUT", default=300)
 
 # Rotating Proxy Settings (for image downloads)
 ROTATING_PROXY_URL = env("ROTATING_PROXY_URL", default="")
@@ -42,11 +42,11 @@ TEMPLATES[0]["OPTIONS"]["debug"] = True  # type: ignore[index]
 #    - No network overhead
 #    - Faster test execution (crucial for CI/CD pipelines)
 #
-# 2. SIMPLICITY: No PostgreSQL-specific features used in this project
-#    - No PostgreSQL extensions (pg_trgm, unaccent, etc.)
-#    - No PostgreSQL-specific field types (ArrayField, JSONField, HStoreField, etc.)
-#    - No PostgreSQL-specific functions (TrigramSimilarity, SearchVector, etc.)
-#    - Only standard Django ORM queries with basic lookups (icontains, iexact)
+# 2. SIMPLICITY: PostgreSQL-specific features are optional
+#    - pg_trgm indexes are created by a migration only on PostgreSQL
+#    - core.search uses TrigramSimilarity only on PostgreSQL and falls back to
+#      icontains elsewhere
+#    - No PostgreSQL-specific field types (ArrayField, HStoreField, etc.)
 #
 # 3. COMPATIBILITY: All Django ORM features work identically
 #    - ForeignKey, ManyToManyField relationships
@@ -104,5 +104,10 @@ CELERY_TASK_EAGER_PROPAGATES = True
 CELERY_BROKER_URL = "memory://"
 CELERY_RESULT_BACKEND = "cache+memory://"
 
+# FEED
+# ------------------------------------------------------------------------------
+# The cache outlives each test's database; feed cache tests enable it explicitly
+FEED_PAGE_CACHE_TIMEOUT = 0
+
 # Your stuff...
 # ------------------------------------------------------------------------------
@@ -83,6 +83,15 @@ fi
 log_info "Running database migrations..."
 python manage.py migrate --noinput
 
+# Build the feed read model on first deploy; later changes to how entries are
+# built need a one-off "python manage.py rebuild_feed_entries"
+log_info "Building feed entries if missing..."
+python manage.py rebuild_feed_entries --if-empty
+
+# Index items saved before search documents existed
+log_info "Building missing search documents..."
+python manage.py rebuild_search_documents --missing-only
+
 # Collect static files
 log_info "Collecting static files..."
 python manage.py collectstatic --noinput --clear
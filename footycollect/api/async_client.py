@@ -0,0 +1,396 @@
+"""
+Asyncio client for the Football Kit Archive API.
+
+``AsyncFKAPIClient`` shares caching, circuit breaker and rate limiting with
+``FKAPIClient`` but performs HTTP calls with ``httpx.AsyncClient`` so that
+independent requests can run concurrently::
+
+    async with AsyncFKAPIClient() as client:
+        kits, clubs = await asyncio.gather(
+            client.asearch_kits(query),
+            client.asearch_clubs(query),
+        )
+
+Async methods follow Django's naming convention and carry an ``a`` prefix.
+
+The shared helpers are blocking: cache reads and writes (network round trips
+with django_redis), circuit breaker state, the Redis rate limiter script and
+Celery ``delay`` for background refreshes. The async client runs them in
+worker threads with ``sync_to_async`` so they never stall the event loop.
+"""
+
+import asyncio
+import json
+import logging
+from dataclasses import dataclass
+from http import HTTPStatus
+
+import httpx
+from asgiref.sync import async_to_sync, sync_to_async
+from django.conf import settings
+
+from .client import (
+    BULK_MAX_CONCURRENCY,
+    MAX_BULK_SLUGS,
+    MIN_BULK_SLUGS,
+    SINGLE_FLIGHT_POLL_INTERVAL,
+    FKAPIClient,
+    RequestContext,
+    RequestResult,
+)
+from .rate_limit import get_endpoint_weight
+from .transport import DEFAULT_POOL_MAXSIZE
+
+logger = logging.getLogger(__name__)
+
+
+def _in_thread(func):
+    """Wrap a blocking cache, circuit breaker or Celery helper to run off the event loop."""
+    return sync_to_async(func, thread_sensitive=False)
+
+
+class AsyncFKAPIClient(FKAPIClient):
+    """Async variant of FKAPIClient for concurrent fan-out of FKAPI calls."""
+
+    def __init__(self, *, rate_limit_timeout: float = 0):
+        super().__init__(rate_limit_timeout=rate_limit_timeout)
+        self._http: httpx.AsyncClient | None = None
+
+    async def __aenter__(self) -> "AsyncFKAPIClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    def _get_http(self) -> httpx.AsyncClient:
+        """Return the pooled httpx client, creating it on first use."""
+        if self._http is None:
+            pool_maxsize = getattr(settings, "FKAPI_HTTP_POOL_MAXSIZE", DEFAULT_POOL_MAXSIZE)
+            self._http = httpx.AsyncClient(
+                headers=self.headers,
+                timeout=self.request_timeout,
+                limits=httpx.Limits(
+                    max_connections=pool_maxsize,
+                    max_keepalive_connections=pool_maxsize,
+                ),
+            )
+        return self._http
+
+    async def aclose(self) -> None:
+        """Close pooled connections."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
+    async def _aget(
+        self,
+        endpoint: str,
+        params: dict | None = None,
+        *,
+        use_cache: bool = True,
+    ) -> dict | None:
+        """
+        Async counterpart of ``FKAPIClient._get``.
+
+        Cache lookups, single-flight locks, circuit breaker and rate limit
+        checks reuse the sync helpers, run in worker threads: each is a
+        blocking cache round trip.
+        """
+        self.last_content_hash = None
+        ctx = self._create_request_context(endpoint, params, use_cache=use_cache)
+        try:
+            hit, cached = await _in_thread(self._try_cache)(ctx)
+            if hit:
+                return cached
+
+            lock_token = await _in_thread(self._acquire_fetch_lock)(ctx)
+            if lock_token is None:
+                hit, shared = await self._await_inflight(ctx)
+                if hit:
+                    return shared
+
+            try:
+                return await self._afetch_and_cache(ctx)
+            finally:
+                await _in_thread(self._release_fetch_lock)(ctx, lock_token)
+        finally:
+            self.last_content_hash = ctx.content_hash
+
+    async def _afetch_and_cache(self, ctx: RequestContext) -> dict | None:
+        """Fetch from FKAPI after a cache miss, falling back to stale cache."""
+        if not await self._acheck_availability(ctx):
+            return await _in_thread(self._get_stale_cache)(ctx)
+
+        result = await self._amake_request_with_retries(ctx)
+        if result.success:
+            await _in_thread(self._cache_response)(ctx, result.data)
+            return result.data
+        if result.not_found:
+            await _in_thread(self._cache_not_found)(ctx)
+            return None
+
+        return await _in_thread(self._get_stale_cache)(ctx)
+
+    async def _acheck_availability(self, ctx: RequestContext) -> bool:
+        """Check circuit breaker and wait for rate limit tokens without blocking the loop."""
+        if not await _in_thread(self.circuit_breaker.allow_request)():
+            logger.warning("Circuit breaker is open for endpoint: %s", ctx.endpoint)
+            return False
+
+        cost = get_endpoint_weight(ctx.endpoint)
+        if not await self.rate_limiter.aacquire(cost, max_wait=self.rate_limit_timeout):
+            logger.warning("Rate limit exceeded for endpoint: %s", ctx.endpoint)
+            await _in_thread(self.circuit_breaker.release_probe)()
+            return False
+
+        return True
+
+    async def _await_inflight(self, ctx: RequestContext) -> tuple[bool, dict | None]:
+        """Wait for another worker's fetch to populate the cache without blocking the loop."""
+        if not ctx.use_cache:
+            return False, None
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.single_flight_wait_timeout
+        while loop.time() < deadline:
+            hit, data = await _in_thread(self._try_cache)(ctx, record_metrics=False)
+            if hit or not await _in_thread(self._fetch_in_flight)(ctx):
+                return hit, data
+            await asyncio.sleep(SINGLE_FLIGHT_POLL_INTERVAL)
+        logger.info("Timed out waiting for in-flight FKAPI fetch: %s", ctx.endpoint)
+        return False, None
+
+    async def _amake_request_with_retries(self, ctx: RequestContext) -> RequestResult:
+        """Make HTTP request with retry logic and non-blocking exponential backoff."""
+        full_url = f"{self.base_url}/api{ctx.endpoint}"
+        logger.info("Making async request to FKAPI: %s", full_url)
+
+        last_exception = None
+        for attempt in range(self.max_retries):
+            if attempt > 0:
+                await self._await_backoff(attempt)
+
+            result = await self._aexecute_request(full_url, ctx.params, ctx.endpoint, attempt)
+            if result.success or result.not_found:
+                await _in_thread(self.circuit_breaker.record_success)()
+                return result
+
+            last_exception = result.error
+            if result.should_stop:
+                break
+
+        await _in_thread(self._handle_all_retries_failed)(ctx.endpoint, last_exception)
+        return RequestResult(success=False, error=last_exception)
+
+    async def _await_backoff(self, attempt: int) -> None:
+        """Wait with exponential backoff before retry without blocking the event loop."""
+        wait_time = 2**attempt
+        logger.info(
+            "Retrying async request (attempt %d/%d) after %ds delay",
+            attempt + 1,
+            self.max_retries,
+            wait_time,
+        )
+        await asyncio.sleep(wait_time)
+
+    async def _aexecute_request(
+        self,
+        url: str,
+        params: dict | None,
+        endpoint: str,
+        attempt: int,
+    ) -> RequestResult:
+        """Execute a single async HTTP request."""
+        try:
+            response = await self._get_http().get(url, params=params)
+            logger.info("FKAPI response status: %s", response.status_code)
+            if response.status_code == HTTPStatus.NOT_FOUND:
+                return RequestResult(success=False, not_found=True)
+            response.raise_for_status()
+
+            data = self._normalize_response(response.json())
+            return RequestResult(success=True, data=data)
+
+        except httpx.TimeoutException:
+            logger.warning(
+                "Request timeout (attempt %d/%d) for endpoint: %s",
+                attempt + 1,
+                self.max_retries,
+                endpoint,
+            )
+            return RequestResult(
+                success=False,
+                error=httpx.TimeoutException(f"Request timeout after {self.request_timeout}s"),
+            )
+
+        except httpx.HTTPError as e:
+            logger.warning(
+                "Request error (attempt %d/%d) for endpoint %s: %s",
+                attempt + 1,
+                self.max_retries,
+                endpoint,
+                str(e),
+            )
+            return RequestResult(success=False, error=e)
+
+        except json.JSONDecodeError as e:
+            logger.exception(
+                "JSON decode error (attempt %d/%d) from FKAPI endpoint %s",
+                attempt + 1,
+                self.max_retries,
+                endpoint,
+            )
+            return RequestResult(success=False, error=e, should_stop=True)
+
+    # Public async API methods
+
+    async def asearch_clubs(self, query: str) -> list[dict]:
+        """Search clubs by name."""
+        result = await self._aget("/clubs/search", params={"keyword": query})
+        return self._extract_list_from_result(result)
+
+    async def aget_club_seasons(self, club_id: int) -> list[dict]:
+        """Get seasons for a club."""
+        result = await self._aget("/seasons", params={"id": club_id})
+        return self._extract_list_from_result(result)
+
+    async def aget_club_kits(self, club_id: int, season_id: int) -> list[dict]:
+        """Get kits for a club for a specific season."""
+        result = await self._aget(f"/clubs/{club_id}/kits", params={"season": season_id})
+        return self._extract_list_from_result(result)
+
+    async def aget_kit_details(self, kit_id: int, *, use_cache: bool = True) -> dict | None:
+        """Get complete details of a kit."""
+        return await self._aget(f"/kits/{kit_id}", use_cache=use_cache)
+
+    async def asearch_kits(self, query: str) -> list[dict]:
+        """Search kits by name."""
+        result = await self._aget("/kits/search", params={"keyword": query})
+        if result is None:
+            logger.warning("FKAPI unavailable, returning empty results for kit search")
+            return []
+        return self._extract_list_from_result(result)
+
+    async def asearch_brands(self, query: str) -> list[dict]:
+        """Search brands by name, falling back to brands found in kit results."""
+        result = await self._aget("/brands/search", params={"keyword": query})
+        if result is None:
+            logger.warning("FKAPI unavailable, trying alternative method for brand search")
+            return self._brands_from_kits(await self.asearch_kits(query))
+        return self._extract_list_from_result(result)
+
+    async def asearch_competitions(self, query: str) -> list[dict]:
+        """Search competitions by name, falling back to competitions found in kit results."""
+        result = await self._aget("/competitions/search", params={"keyword": query})
+        if result is None:
+            logger.warning("FKAPI unavailable, trying alternative method for competition search")
+            return self._competitions_from_kits(await self.asearch_kits(query))
+        return self._extract_list_from_result(result)
+
+    async def aget_kits_bulk(self, slugs: list[str]) -> list[dict]:
+        """Async counterpart of ``FKAPIClient.get_kits_bulk``."""
+        slugs = list(dict.fromkeys(slug for slug in slugs if slug))
+        if not slugs:
+            return []
+
+        kits_by_slug, missing = await _in_thread(self._get_cached_bulk_kits)(slugs)
+        unmatched: list[dict] = []
+        if missing:
+            fetched, unmatched = await self.afetch_kits_in_chunks(missing)
+            kits_by_slug.update(fetched)
+        return [kits_by_slug[slug] for slug in slugs if slug in kits_by_slug] + unmatched
+
+    async def afetch_kits_in_chunks(self, slugs: list[str]) -> tuple[dict[str, dict], list[dict]]:
+        """Fetch slugs in chunks of MAX_BULK_SLUGS, a few chunks at a time."""
+        semaphore = asyncio.Semaphore(BULK_MAX_CONCURRENCY)
+
+        async def fetch(chunk: list[str]) -> tuple[dict[str, dict], list[dict]]:
+            async with semaphore:
+                return await self._afetch_kit_chunk(chunk)
+
+        chunks = [slugs[i : i + MAX_BULK_SLUGS] for i in range(0, len(slugs), MAX_BULK_SLUGS)]
+        kits_by_slug: dict[str, dict] = {}
+        unmatched: list[dict] = []
+        for chunk_kits, chunk_unmatched in await asyncio.gather(*(fetch(chunk) for chunk in chunks)):
+            kits_by_slug.update(chunk_kits)
+            unmatched.extend(chunk_unmatched)
+        return kits_by_slug, unmatched
+
+    async def _afetch_kit_chunk(self, chunk: list[str]) -> tuple[dict[str, dict], list[dict]]:
+        """Fetch one chunk of slugs and cache each kit."""
+        if len(chunk) < MIN_BULK_SLUGS:
+            kit = await self._aget(f"/kits/{chunk[0]}")
+            kits = [kit] if kit else []
+        else:
+            result = await self._aget("/kits/bulk", params={"slugs": ",".join(chunk)})
+            kits = self._extract_list_from_result(result)
+        return await _in_thread(self._cache_bulk_kits)(chunk, kits)
+
+
+async def afetch_missing_kits(
+    slugs: list[str],
+    *,
+    rate_limit_timeout: float = 0,
+) -> tuple[dict[str, dict], list[dict]]:
+    """Fetch many kit slugs concurrently; used by the sync ``get_kits_bulk``."""
+    async with AsyncFKAPIClient(rate_limit_timeout=rate_limit_timeout) as client:
+        return await client.afetch_kits_in_chunks(slugs)
+
+
+async def afetch_kit_details(
+    kit_ids: list[int],
+    *,
+    rate_limit_timeout: float = 0,
+) -> dict[int, dict | None]:
+    """Fetch many kits by id concurrently; used by the sync ``get_kits_details``."""
+    semaphore = asyncio.Semaphore(BULK_MAX_CONCURRENCY)
+    async with AsyncFKAPIClient(rate_limit_timeout=rate_limit_timeout) as client:
+
+        async def fetch(kit_id: int) -> dict | None:
+            async with semaphore:
+                return await client.aget_kit_details(kit_id)
+
+        kits = await asyncio.gather(*(fetch(kit_id) for kit_id in kit_ids))
+    return dict(zip(kit_ids, kits, strict=True))
+
+
+@dataclass(frozen=True)
+class SeasonSources:
+    """FKAPI data a season lookup is built from."""
+
+    kits: list[dict]
+    club_seasons: list[list[dict]]  # one season list per club
+    complete: bool  # False when a request got no answer (error, open breaker, rate limit)
+
+
+async def afetch_season_sources(query: str, club_limit: int) -> SeasonSources:
+    """
+    Fetch everything needed to resolve seasons for a free-text query.
+
+    Kit search runs alongside club search; as soon as clubs are known, the
+    seasons of the first ``club_limit`` clubs are fetched concurrently.
+    Requests that get no answer contribute an empty list and mark the
+    sources incomplete.
+    """
+    async with AsyncFKAPIClient() as client:
+
+        async def fetch_list(endpoint: str, params: dict) -> list[dict] | None:
+            result = await client._aget(endpoint, params=params)
+            return None if result is None else client._extract_list_from_result(result)
+
+        kits_task = asyncio.ensure_future(fetch_list("/kits/search", {"keyword": query}))
+        try:
+            clubs = await fetch_list("/clubs/search", {"keyword": query})
+            club_ids = [club["id"] for club in (clubs or [])[:club_limit] if isinstance(club, dict) and club.get("id")]
+            club_seasons = await asyncio.gather(*(fetch_list("/seasons", {"id": club_id}) for club_id in club_ids))
+        finally:
+            kits = await kits_task
+    return SeasonSources(
+        kits=kits or [],
+        club_seasons=[seasons or [] for seasons in club_seasons],
+        complete=all(result is not None for result in (kits, clubs, *club_seasons)),
+    )
+
+
+def fetch_season_sources(query: str, club_limit: int) -> SeasonSources:
+    """Sync entry point for ``afetch_season_sources`` used by WSGI views."""
+    return async_to_sync(afetch_season_sources)(query, club_limit)
@@ -0,0 +1,75 @@
+"""
+Per-endpoint cache policies for FKAPI responses.
+
+Every cached response has two lifetimes:
+
+* ``soft_ttl``: how long the entry is served as fresh. After that it is still
+  served immediately, but a background refresh is queued.
+* ``hard_ttl``: how long the entry is kept at all. Stale entries feed the
+  circuit breaker and rate limit fallbacks until this expires.
+
+Empty results (e.g. a misspelled search) and 404s are cached for the shorter
+``empty_ttl`` / ``not_found_ttl`` so repeated lookups do not go upstream on
+every keystroke. Entries still larger than ``max_payload_bytes`` after
+serialization and compression are not cached.
+
+Policies are matched by longest endpoint prefix and can be overridden with the
+``FKAPI_CACHE_POLICIES`` setting, e.g.
+``{"/kits/search": {"soft_ttl": 600, "hard_ttl": 86400}}``.
+"""
+
+from dataclasses import dataclass, replace
+
+from django.conf import settings
+
+MINUTE = 60
+HOUR = 60 * MINUTE
+DAY = 24 * HOUR
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """Cache lifetimes for one FKAPI endpoint family."""
+
+    soft_ttl: int
+    hard_ttl: int
+    cache_empty: bool = True
+    empty_ttl: int = 5 * MINUTE
+    cache_not_found: bool = True
+    not_found_ttl: int = 10 * MINUTE
+    max_payload_bytes: int | None = 1024 * 1024
+
+
+DEFAULT_CACHE_POLICY = CachePolicy(soft_ttl=HOUR, hard_ttl=7 * DAY)
+
+# Kit details rarely change once archived; search results and season lists
+# change as the archive grows. Brand, club and competition names are added
+# rarely, so an empty search stays empty for a while.
+ENDPOINT_CACHE_POLICIES: dict[str, CachePolicy] = {
+    "/kits/": CachePolicy(soft_ttl=DAY, hard_ttl=30 * DAY, not_found_ttl=HOUR),
+    "/kits/bulk": CachePolicy(soft_ttl=DAY, hard_ttl=30 * DAY),
+    "/kits/search": CachePolicy(soft_ttl=15 * MINUTE, hard_ttl=DAY, empty_ttl=10 * MINUTE),
+    "/clubs/search": CachePolicy(soft_ttl=HOUR, hard_ttl=7 * DAY, empty_ttl=30 * MINUTE),
+    "/clubs/": CachePolicy(soft_ttl=6 * HOUR, hard_ttl=14 * DAY),
+    "/seasons": CachePolicy(soft_ttl=6 * HOUR, hard_ttl=14 * DAY),
+    "/brands/search": CachePolicy(soft_ttl=HOUR, hard_ttl=7 * DAY, empty_ttl=30 * MINUTE),
+    "/competitions/search": CachePolicy(soft_ttl=HOUR, hard_ttl=7 * DAY, empty_ttl=30 * MINUTE),
+}
+
+
+def _configured_policies() -> dict[str, CachePolicy]:
+    """Merge default policies with overrides from settings."""
+    policies = dict(ENDPOINT_CACHE_POLICIES)
+    for prefix, overrides in getattr(settings, "FKAPI_CACHE_POLICIES", {}).items():
+        base = policies.get(prefix, DEFAULT_CACHE_POLICY)
+        policies[prefix] = replace(base, **overrides)
+    return policies
+
+
+def get_cache_policy(endpoint: str, default: CachePolicy = DEFAULT_CACHE_POLICY) -> CachePolicy:
+    """Return the policy whose prefix is the longest match for ``endpoint``."""
+    policies = _configured_policies()
+    matches = [prefix for prefix in policies if endpoint.startswith(prefix)]
+    if not matches:
+        return default
+    return policies[max(matches, key=len)]
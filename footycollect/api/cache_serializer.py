@@ -0,0 +1,117 @@
+"""
+Compact serialization for cached FKAPI responses.
+
+FKAPI cache entries are plain JSON-compatible dicts. Instead of letting the
+cache backend pickle them, they are stored as orjson bytes, zlib-compressed
+once they reach ``FKAPI_CACHE_COMPRESS_MIN_BYTES``. Kit search results are
+highly repetitive (team, brand and logo URLs repeat on every kit), so
+compression shrinks them several times over.
+
+The first byte of every stored value tags its format. Values without a tag
+(entries pickled before this module existed) are returned unchanged.
+
+Hit/miss counts and raw vs stored byte totals are kept in the cache, like
+the item list metrics in ``collection.cache_utils``.
+"""
+
+import hashlib
+import logging
+import zlib
+
+import orjson
+from django.conf import settings
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+FORMAT_JSON = b"\x01"
+FORMAT_JSON_ZLIB = b"\x02"
+COMPRESS_MIN_BYTES = 1024
+COMPRESSION_LEVEL = 6
+
+FKAPI_CACHE_METRICS_HITS_KEY = "cache_metrics:fkapi:hits"
+FKAPI_CACHE_METRICS_MISSES_KEY = "cache_metrics:fkapi:misses"
+FKAPI_CACHE_METRICS_RAW_BYTES_KEY = "cache_metrics:fkapi:raw_bytes"
+FKAPI_CACHE_METRICS_STORED_BYTES_KEY = "cache_metrics:fkapi:stored_bytes"
+FKAPI_CACHE_METRICS_KEYS = (
+    FKAPI_CACHE_METRICS_HITS_KEY,
+    FKAPI_CACHE_METRICS_MISSES_KEY,
+    FKAPI_CACHE_METRICS_RAW_BYTES_KEY,
+    FKAPI_CACHE_METRICS_STORED_BYTES_KEY,
+)
+
+
+def encode(entry: dict) -> tuple[bytes, int]:
+    """
+    Serialize a cache entry to tagged, optionally compressed bytes.
+
+    Returns:
+        tuple: (value to store, uncompressed JSON size in bytes)
+    """
+    raw = orjson.dumps(entry)
+    if len(raw) < getattr(settings, "FKAPI_CACHE_COMPRESS_MIN_BYTES", COMPRESS_MIN_BYTES):
+        return FORMAT_JSON + raw, len(raw)
+    return FORMAT_JSON_ZLIB + zlib.compress(raw, COMPRESSION_LEVEL), len(raw)
+
+
+def content_hash(data) -> str:
+    """Return a stable hash of JSON-compatible data, independent of key order."""
+    return hashlib.sha256(orjson.dumps(data, option=orjson.OPT_SORT_KEYS)).hexdigest()[:32]
+
+
+def decode(value):
+    """Deserialize a value written by ``encode``; untagged values pass through."""
+    if not isinstance(value, bytes) or not value:
+        return value
+    tag, payload = value[:1], value[1:]
+    try:
+        if tag == FORMAT_JSON:
+            return orjson.loads(payload)
+        if tag == FORMAT_JSON_ZLIB:
+            return orjson.loads(zlib.decompress(payload))
+    except (orjson.JSONDecodeError, zlib.error):
+        logger.warning("Discarding unreadable FKAPI cache entry")
+        return None
+    return value
+
+
+def _incr(key: str, delta: int) -> None:
+    try:
+        cache.incr(key, delta)
+    except ValueError:
+        cache.set(key, delta, None)
+
+
+def record_lookups(*, hits: int = 0, misses: int = 0) -> None:
+    """Count FKAPI cache hits and misses."""
+    if hits:
+        _incr(FKAPI_CACHE_METRICS_HITS_KEY, hits)
+    if misses:
+        _incr(FKAPI_CACHE_METRICS_MISSES_KEY, misses)
+
+
+def record_write(raw_bytes: int, stored_bytes: int) -> None:
+    """Add the uncompressed and stored sizes of written entries to the byte totals."""
+    _incr(FKAPI_CACHE_METRICS_RAW_BYTES_KEY, raw_bytes)
+    _incr(FKAPI_CACHE_METRICS_STORED_BYTES_KEY, stored_bytes)
+
+
+def get_fkapi_cache_metrics() -> dict:
+    values = cache.get_many(list(FKAPI_CACHE_METRICS_KEYS))
+    hits = values.get(FKAPI_CACHE_METRICS_HITS_KEY, 0)
+    misses = values.get(FKAPI_CACHE_METRICS_MISSES_KEY, 0)
+    raw_bytes = values.get(FKAPI_CACHE_METRICS_RAW_BYTES_KEY, 0)
+    stored_bytes = values.get(FKAPI_CACHE_METRICS_STORED_BYTES_KEY, 0)
+    lookups = hits + misses
+    return {
+        "hits": hits,
+        "misses": misses,
+        "hit_rate": hits / lookups if lookups else 0.0,
+        "raw_bytes": raw_bytes,
+        "stored_bytes": stored_bytes,
+        "compression_ratio": raw_bytes / stored_bytes if stored_bytes else 0.0,
+    }
+
+
+def reset_fkapi_cache_metrics() -> None:
+    cache.delete_many(list(FKAPI_CACHE_METRICS_KEYS))
@@ -0,0 +1,131 @@
+"""
+Circuit breaker for FKAPI calls, shared across processes through the cache.
+"""
+
+import logging
+from datetime import UTC, datetime
+
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+CIRCUIT_BREAKER_KEY = "fkapi_circuit_breaker"
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker pattern to prevent cascading failures.
+
+    State lives in the cache backend so that every gunicorn and Celery worker
+    sees the same failure count. Once the breaker opens, all workers stop
+    calling FKAPI until ``timeout`` seconds have passed; then a single probe
+    request is let through (half-open) and its outcome closes or re-opens the
+    breaker.
+    """
+
+    def __init__(self, failure_threshold: int = 5, timeout: int = 60, key: str = CIRCUIT_BREAKER_KEY):
+        self.failure_threshold = failure_threshold
+        self.timeout = timeout
+        self.key = key
+
+    @property
+    def _failures_key(self) -> str:
+        return f"{self.key}:failures"
+
+    @property
+    def _state_key(self) -> str:
+        return f"{self.key}:state"
+
+    @property
+    def _last_failure_key(self) -> str:
+        return f"{self.key}:last_failure"
+
+    @property
+    def _probe_key(self) -> str:
+        return f"{self.key}:probe"
+
+    @property
+    def _state_ttl(self) -> int:
+        # Failures older than this are forgotten even without a success
+        return self.timeout * 10
+
+    @property
+    def failure_count(self) -> int:
+        return cache.get(self._failures_key) or 0
+
+    @failure_count.setter
+    def failure_count(self, value: int) -> None:
+        cache.set(self._failures_key, value, self._state_ttl)
+
+    @property
+    def state(self) -> str:
+        return cache.get(self._state_key) or "closed"  # closed, open, half_open
+
+    @state.setter
+    def state(self, value: str) -> None:
+        cache.set(self._state_key, value, self._state_ttl)
+
+    @property
+    def last_failure_time(self) -> datetime | None:
+        timestamp = cache.get(self._last_failure_key)
+        return datetime.fromtimestamp(timestamp, tz=UTC) if timestamp else None
+
+    @last_failure_time.setter
+    def last_failure_time(self, value: datetime | None) -> None:
+        if value is None:
+            cache.delete(self._last_failure_key)
+        else:
+            cache.set(self._last_failure_key, value.timestamp(), self._state_ttl)
+
+    def record_success(self):
+        """Record a successful request."""
+        # Most calls succeed with the breaker closed and no failures on record: skip the write then
+        if cache.get_many([self._failures_key, self._state_key]):
+            cache.delete_many([self._failures_key, self._state_key, self._last_failure_key, self._probe_key])
+
+    def record_failure(self):
+        """Record a failed request."""
+        try:
+            failure_count = cache.incr(self._failures_key)
+        except ValueError:
+            failure_count = 1
+            self.failure_count = failure_count
+        self.last_failure_time = datetime.now(UTC)
+        if failure_count >= self.failure_threshold or self.state == "half_open":
+            self.state = "open"
+            cache.delete(self._probe_key)
+            logger.warning(
+                "Circuit breaker opened after %d failures",
+                failure_count,
+            )
+
+    def is_open(self) -> bool:
+        """Check if circuit breaker is open."""
+        if self.state == "open":
+            last_failure_time = self.last_failure_time
+            if last_failure_time:
+                time_since_failure = datetime.now(UTC) - last_failure_time
+                if time_since_failure.total_seconds() >= self.timeout:
+                    self.state = "half_open"
+                    logger.info("Circuit breaker transitioning to half-open state")
+                    return False
+            return True
+        return False
+
+    def allow_request(self) -> bool:
+        """
+        Check if request should be allowed.
+
+        While half-open only the worker that claims the probe slot may call
+        FKAPI; everyone else keeps failing fast until the probe finishes.
+        """
+        if self.is_open():
+            return False
+        if self.state == "half_open":
+            return cache.add(self._probe_key, 1, self.timeout)
+        return True
+
+    def release_probe(self) -> None:
+        """Give back the half-open probe slot when the allowed request was not sent after all."""
+        if self.state == "half_open":
+            cache.delete(self._probe_key)
@@ -2,62 +2,36 @@ import hashlib
 import json
 import logging
 import time
+import uuid
 from dataclasses import dataclass
-from datetime import UTC, datetime
+from http import HTTPStatus
 
 import requests
+from asgiref.sync import async_to_sync
 from django.conf import settings
 from django.core.cache import cache
 
+from . import cache_serializer
+from .cache_policy import CachePolicy, get_cache_policy
+from .circuit_breaker import CircuitBreaker
+from .rate_limit import TokenBucketRateLimiter, get_endpoint_weight
+from .transport import get_http_session
+
 logger = logging.getLogger(__name__)
 
 # Bulk endpoint constraints
 MIN_BULK_SLUGS = 2
 MAX_BULK_SLUGS = 30
+BULK_MAX_CONCURRENCY = 4  # chunks fetched at the same time
 
+# Single-flight: concurrent cache misses for the same key wait for one fetch
+SINGLE_FLIGHT_LOCK_TIMEOUT = 15  # seconds, upper bound on how long a fetch holds the lock
+SINGLE_FLIGHT_WAIT_TIMEOUT = 5  # seconds a follower waits before fetching itself
+SINGLE_FLIGHT_POLL_INTERVAL = 0.05
 
-class CircuitBreaker:
-    """Circuit breaker pattern to prevent cascading failures."""
-
-    def __init__(self, failure_threshold: int = 5, timeout: int = 60):
-        self.failure_threshold = failure_threshold
-        self.timeout = timeout
-        self.failure_count = 0
-        self.last_failure_time: datetime | None = None
-        self.state = "closed"  # closed, open, half_open
-
-    def record_success(self):
-        """Record a successful request."""
-        self.failure_count = 0
-        self.state = "closed"
-        self.last_failure_time = None
-
-    def record_failure(self):
-        """Record a failed request."""
-        self.failure_count += 1
-        self.last_failure_time = datetime.now(UTC)
-        if self.failure_count >= self.failure_threshold:
-            self.state = "open"
-            logger.warning(
-                "Circuit breaker opened after %d failures",
-                self.failure_count,
-            )
-
-    def is_open(self) -> bool:
-        """Check if circuit breaker is open."""
-        if self.state == "open":
-            if self.last_failure_time:
-                time_since_failure = datetime.now(UTC) - self.last_failure_time
-                if time_since_failure.total_seconds() >= self.timeout:
-                    self.state = "half_open"
-                    logger.info("Circuit breaker transitioning to half-open state")
-                    return False
-            return True
-        return False
-
-    def allow_request(self) -> bool:
-        """Check if request should be allowed."""
-        return not self.is_open()
+# Stale-while-revalidate: cached responses are wrapped with their soft expiry
+CACHE_ENTRY_MARKER = "fkapi_entry"
+REFRESH_LOCK_TIMEOUT = 60  # seconds, avoids queueing duplicate refresh tasks
 
 
 @dataclass
@@ -68,15 +42,68 @@ class RequestContext:
     params: dict | None
     cache_key: str
     use_cache: bool
+    policy: CachePolicy
+    content_hash: str | None = None  # hash of the cached data the response came from
+
+    @property
+    def lock_key(self) -> str:
+        """Cache key of the single-flight lock guarding this request."""
+        return f"{self.cache_key}:lock"
+
+    @property
+    def refresh_key(self) -> str:
+        """Cache key marking a queued background refresh for this request."""
+        return f"{self.cache_key}:refresh"
+
+
+def wrap_cache_entry(data: dict | None, soft_ttl: int, *, not_found: bool = False) -> dict:
+    """Wrap response data with the time until which it is considered fresh and its content hash."""
+    entry = {CACHE_ENTRY_MARKER: 1, "data": data, "fresh_until": time.time() + soft_ttl}
+    if not_found:
+        entry["not_found"] = True
+    else:
+        entry["content_hash"] = cache_serializer.content_hash(data)
+    return entry
+
+
+def entry_content_hash(entry) -> str | None:
+    """Return the content hash stored with a cache entry, if it has one."""
+    if isinstance(entry, dict) and entry.get(CACHE_ENTRY_MARKER):
+        return entry.get("content_hash")
+    return None
+
+
+def is_not_found_entry(entry) -> bool:
+    """Return True for a cached 404 from FKAPI."""
+    return isinstance(entry, dict) and bool(entry.get(CACHE_ENTRY_MARKER)) and bool(entry.get("not_found"))
+
+
+def unwrap_cache_entry(entry) -> tuple[dict | None, bool]:
+    """
+    Return (data, is_fresh) for a cached entry.
+
+    Entries written before stale-while-revalidate hold the raw response and
+    are treated as fresh until they expire.
+    """
+    if isinstance(entry, dict) and entry.get(CACHE_ENTRY_MARKER):
+        return entry.get("data"), time.time() < entry.get("fresh_until", 0)
+    return entry, True
 
 
 class FKAPIClient:
     """Client to interact with the Football Kit Archive API."""
 
-    def __init__(self):
+    def __init__(self, *, rate_limit_timeout: float = 0):
+        """
+        Args:
+            rate_limit_timeout: Seconds to wait for rate limit tokens before
+                giving up. Interactive callers keep the default of 0 and fall
+                back to stale cache; batch commands pass a timeout so they
+                queue behind the shared quota instead of skipping requests.
+        """
         self.base_url = f"http://{settings.FKA_API_IP}"
         self.api_key = settings.API_KEY
-        self.cache_timeout = 3600  # 1 hour cache by default
+        self.cache_timeout = 3600  # soft TTL for endpoints without a cache policy
         self.request_timeout = 60
         self.max_retries = 3
         self.headers = {
@@ -84,9 +111,21 @@ class FKAPIClient:
             "Content-Type": "application/json",
         }
         self.circuit_breaker = CircuitBreaker(failure_threshold=5, timeout=60)
-        # Rate limiting: max 100 requests per minute
-        self.rate_limit_max = 100
-        self.rate_limit_window = 60  # seconds
+        # Rate limiting: token bucket shared by all workers (100 requests per minute by default)
+        self.rate_limiter = TokenBucketRateLimiter()
+        self.rate_limit_timeout = rate_limit_timeout
+        self.single_flight_lock_timeout = getattr(
+            settings,
+            "FKAPI_SINGLE_FLIGHT_LOCK_TIMEOUT",
+            SINGLE_FLIGHT_LOCK_TIMEOUT,
+        )
+        self.single_flight_wait_timeout = getattr(
+            settings,
+            "FKAPI_SINGLE_FLIGHT_WAIT_TIMEOUT",
+            SINGLE_FLIGHT_WAIT_TIMEOUT,
+        )
+        # Content hash of the cache entry behind the last _get result (None when unknown)
+        self.last_content_hash: str | None = None
 
     def _get(
         self,
@@ -101,21 +140,42 @@ class FKAPIClient:
         Returns:
             dict: Response data if successful, None if all retries fail
         """
+        self.last_content_hash = None
         ctx = self._create_request_context(endpoint, params, use_cache=use_cache)
+        try:
+            # Try cache first (cached empty results and 404s count as hits)
+            hit, cached = self._try_cache(ctx)
+            if hit:
+                return cached
+
+            # Coalesce identical misses: only the lock holder goes upstream
+            lock_token = self._acquire_fetch_lock(ctx)
+            if lock_token is None:
+                hit, shared = self._wait_for_inflight(ctx)
+                if hit:
+                    return shared
 
-        # Try cache first
-        if cached := self._try_cache(ctx):
-            return cached
-
+            try:
+                return self._fetch_and_cache(ctx)
+            finally:
+                self._release_fetch_lock(ctx, lock_token)
+        finally:
+            self.last_content_hash = ctx.content_hash
+
+    def _fetch_and_cache(self, ctx: RequestContext) -> dict | None:
+        """Fetch from FKAPI after a cache miss, falling back to stale cache."""
         # Check availability (circuit breaker + rate limit)
         if not self._check_availability(ctx):
             return self._get_stale_cache(ctx)
 
         # Make the actual request
-        data = self._make_request_with_retries(ctx)
-        if data is not None:
-            self._cache_response(ctx, data)
-            return data
+        result = self._make_request_with_retries(ctx)
+        if result.success:
+            self._cache_response(ctx, result.data)
+            return result.data
+        if result.not_found:
+            self._cache_not_found(ctx)
+            return None
 
         return self._get_stale_cache(ctx)
 
@@ -126,42 +186,174 @@ class FKAPIClient:
         *,
         use_cache: bool,
     ) -> RequestContext:
-        """Create request context with cache key."""
+        """Create request context with cache key and the endpoint's cache policy."""
         params_str = json.dumps(params, sort_keys=True) if params else ""
         hash_key = hashlib.sha256(f"{endpoint}:{params_str}".encode()).hexdigest()
         cache_key = f"fkapi_{hash_key}"
+        default_policy = CachePolicy(soft_ttl=self.cache_timeout, hard_ttl=self.cache_timeout * 24)
         return RequestContext(
             endpoint=endpoint,
             params=params,
             cache_key=cache_key,
             use_cache=use_cache,
+            policy=get_cache_policy(endpoint, default=default_policy),
         )
 
-    def _try_cache(self, ctx: RequestContext) -> dict | None:
-        """Try to get response from cache."""
+    def _try_cache(self, ctx: RequestContext, *, record_metrics: bool = True) -> tuple[bool, dict | None]:
+        """
+        Try to get response from cache.
+
+        Entries past their soft TTL are still returned immediately, and a
+        background refresh is queued so the next caller gets fresh data.
+
+        Returns:
+            tuple: (whether the cache answered, cached data). A cached 404 is
+            a hit with ``None`` data.
+        """
         if not ctx.use_cache:
-            return None
-        cached = cache.get(ctx.cache_key)
-        if cached:
+            return False, None
+        entry = cache_serializer.decode(cache.get(ctx.cache_key))
+        if is_not_found_entry(entry):
+            logger.debug("Cached not-found for endpoint: %s", ctx.endpoint)
+            if record_metrics:
+                cache_serializer.record_lookups(hits=1)
+            return True, None
+        cached, is_fresh = unwrap_cache_entry(entry)
+        if record_metrics:
+            cache_serializer.record_lookups(hits=int(cached is not None), misses=int(cached is None))
+        if cached is None:
+            return False, None
+        ctx.content_hash = entry_content_hash(entry)
+        if is_fresh:
             logger.debug("Cache hit for endpoint: %s", ctx.endpoint)
-            return cached
+        else:
+            logger.debug("Stale cache hit for endpoint: %s, scheduling refresh", ctx.endpoint)
+            self._schedule_refresh(ctx)
+        return True, cached
+
+    def _schedule_refresh(self, ctx: RequestContext) -> None:
+        """Queue a background refresh unless one is already pending."""
+        from .tasks import refresh_fkapi_cache_task
+
+        if not cache.add(ctx.refresh_key, 1, REFRESH_LOCK_TIMEOUT):
+            return
+        try:
+            refresh_fkapi_cache_task.delay(ctx.endpoint, ctx.params)
+        except Exception:
+            logger.exception("Could not queue FKAPI cache refresh for endpoint: %s", ctx.endpoint)
+            cache.delete(ctx.refresh_key)
+
+    def refresh_cache(self, endpoint: str, params: dict | None = None) -> dict | None:
+        """Fetch ``endpoint`` from FKAPI and overwrite its cache entry."""
+        ctx = self._create_request_context(endpoint, params, use_cache=True)
+        try:
+            return self._fetch_and_cache(ctx)
+        finally:
+            cache.delete(ctx.refresh_key)
+
+    def _acquire_fetch_lock(self, ctx: RequestContext) -> str | None:
+        """
+        Try to become the single fetcher for ``ctx.cache_key``.
+
+        Returns a lock token when acquired, or None when another worker is
+        already fetching. Uncached requests never coalesce because followers
+        would have no cache entry to wait for.
+        """
+        if not ctx.use_cache:
+            return None
+        token = uuid.uuid4().hex
+        if cache.add(ctx.lock_key, token, self.single_flight_lock_timeout):
+            return token
+        logger.debug("FKAPI fetch already in flight for endpoint: %s", ctx.endpoint)
         return None
 
+    def _release_fetch_lock(self, ctx: RequestContext, token: str | None) -> None:
+        """Release the fetch lock if this client still holds it."""
+        if token is not None and cache.get(ctx.lock_key) == token:
+            cache.delete(ctx.lock_key)
+
+    def _fetch_in_flight(self, ctx: RequestContext) -> bool:
+        """Return True while another worker holds the fetch lock."""
+        return cache.get(ctx.lock_key) is not None
+
+    def _wait_for_inflight(self, ctx: RequestContext) -> tuple[bool, dict | None]:
+        """
+        Wait for another worker's fetch to populate the cache.
+
+        Returns:
+            tuple: same as ``_try_cache``; a miss means the fetch failed or
+            timed out and the caller should fetch itself.
+        """
+        if not ctx.use_cache:
+            return False, None
+        deadline = time.monotonic() + self.single_flight_wait_timeout
+        while time.monotonic() < deadline:
+            hit, data = self._try_cache(ctx, record_metrics=False)
+            if hit or not self._fetch_in_flight(ctx):
+                return hit, data
+            time.sleep(SINGLE_FLIGHT_POLL_INTERVAL)
+        logger.info("Timed out waiting for in-flight FKAPI fetch: %s", ctx.endpoint)
+        return False, None
+
     def _get_stale_cache(self, ctx: RequestContext) -> dict | None:
         """Get stale cache as fallback."""
         if not ctx.use_cache:
             return None
-        stale = cache.get(ctx.cache_key)
-        if stale:
+        entry = cache_serializer.decode(cache.get(ctx.cache_key))
+        stale, _ = unwrap_cache_entry(entry)
+        if stale is not None:
+            ctx.content_hash = entry_content_hash(entry)
             logger.info("Returning stale cache as fallback for: %s", ctx.endpoint)
             return stale
         return None
 
     def _cache_response(self, ctx: RequestContext, data: dict) -> None:
-        """Cache the response."""
-        if ctx.use_cache:
-            cache.set(ctx.cache_key, data, self.cache_timeout)
-            logger.debug("Cached response for endpoint: %s", ctx.endpoint)
+        """Cache the response according to the endpoint's cache policy."""
+        if not ctx.use_cache:
+            return
+        policy = ctx.policy
+
+        if self._is_empty_response(data):
+            if not policy.cache_empty:
+                return
+            soft_ttl = hard_ttl = policy.empty_ttl
+        else:
+            soft_ttl, hard_ttl = policy.soft_ttl, policy.hard_ttl
+
+        entry = wrap_cache_entry(data, soft_ttl)
+        ctx.content_hash = entry["content_hash"]
+        value, raw_size = cache_serializer.encode(entry)
+        if policy.max_payload_bytes is not None and len(value) > policy.max_payload_bytes:
+            logger.info(
+                "Not caching %d byte response for endpoint %s (limit %d)",
+                len(value),
+                ctx.endpoint,
+                policy.max_payload_bytes,
+            )
+            return
+
+        cache.set(ctx.cache_key, value, hard_ttl)
+        cache_serializer.record_write(raw_size, len(value))
+        logger.debug("Cached response for endpoint: %s (%d of %d bytes)", ctx.endpoint, len(value), raw_size)
+
+    def _cache_not_found(self, ctx: RequestContext) -> None:
+        """Remember a 404 so the same lookup does not go upstream again."""
+        if ctx.use_cache and ctx.policy.cache_not_found:
+            ttl = ctx.policy.not_found_ttl
+            value, _ = cache_serializer.encode(wrap_cache_entry(None, ttl, not_found=True))
+            cache.set(ctx.cache_key, value, ttl)
+            logger.debug("Cached not-found for endpoint: %s", ctx.endpoint)
+
+    @staticmethod
+    def _is_empty_response(data: dict) -> bool:
+        """Return True for responses without any results."""
+        if not data:
+            return True
+        if "results" in data:
+            return not data["results"]
+        if data.keys() == {"data"}:
+            return not data["data"]
+        return False
 
     def _check_availability(self, ctx: RequestContext) -> bool:
         """Check if request should proceed (circuit breaker + rate limit)."""
@@ -169,29 +361,21 @@ class FKAPIClient:
             logger.warning("Circuit breaker is open for endpoint: %s", ctx.endpoint)
             return False
 
-        if not self._check_rate_limit():
+        if not self._check_rate_limit(ctx):
             logger.warning("Rate limit exceeded for endpoint: %s", ctx.endpoint)
+            self.circuit_breaker.release_probe()
             return False
 
         return True
 
-    def _check_rate_limit(self) -> bool:
-        """Check if request is within rate limit."""
-        rate_limit_key = "fkapi_rate_limit"
-        current_count = cache.get(rate_limit_key) or 0
-
-        if current_count >= self.rate_limit_max:
-            logger.warning(
-                "Rate limit exceeded: %d requests in the last %d seconds",
-                current_count,
-                self.rate_limit_window,
-            )
-            return False
-
-        cache.set(rate_limit_key, current_count + 1, self.rate_limit_window)
-        return True
+    def _check_rate_limit(self, ctx: RequestContext) -> bool:
+        """Take this endpoint's weight from the shared token bucket."""
+        return self.rate_limiter.acquire(
+            get_endpoint_weight(ctx.endpoint),
+            max_wait=self.rate_limit_timeout,
+        )
 
-    def _make_request_with_retries(self, ctx: RequestContext) -> dict | None:
+    def _make_request_with_retries(self, ctx: RequestContext) -> "RequestResult":
         """Make HTTP request with retry logic and exponential backoff."""
         full_url = f"{self.base_url}/api{ctx.endpoint}"
         logger.info("Making request to FKAPI: %s", full_url)
@@ -202,16 +386,17 @@ class FKAPIClient:
                 self._wait_with_backoff(attempt)
 
             result = self._execute_request(full_url, ctx.params, ctx.endpoint, attempt)
-            if result.success:
+            # A 404 is a valid answer: FKAPI is healthy, retrying will not help
+            if result.success or result.not_found:
                 self.circuit_breaker.record_success()
-                return result.data
+                return result
 
             last_exception = result.error
             if result.should_stop:
                 break
 
         self._handle_all_retries_failed(ctx.endpoint, last_exception)
-        return None
+        return RequestResult(success=False, error=last_exception)
 
     def _wait_with_backoff(self, attempt: int) -> None:
         """Wait with exponential backoff before retry."""
@@ -261,7 +446,7 @@ class FKAPIClient:
     ) -> "RequestResult":
         """Execute a single HTTP POST request."""
         try:
-            response = requests.post(
+            response = get_http_session().post(
                 url,
                 json=data,
                 headers=self.headers,
@@ -327,13 +512,15 @@ class FKAPIClient:
     ) -> "RequestResult":
         """Execute a single HTTP request."""
         try:
-            response = requests.get(
+            response = get_http_session().get(
                 url,
                 params=params,
                 headers=self.headers,
                 timeout=self.request_timeout,
             )
             logger.info("FKAPI response status: %s", response.status_code)
+            if response.status_code == HTTPStatus.NOT_FOUND:
+                return RequestResult(success=False, not_found=True)
             response.raise_for_status()
 
             data = self._normalize_response(response.json())
@@ -420,6 +607,50 @@ class FKAPIClient:
         # Use primary kit details endpoint (legacy /kit-json/{id} is still available but deprecated)
         return self._get(f"/kits/{kit_id}", use_cache=use_cache)
 
+    def get_kits_details(self, kit_ids: list[int]) -> dict[int, dict]:
+        """Get complete details of many kits by id.
+
+        Cached kits (including stale ones, which get a background refresh) are
+        read with a single cache round trip; the rest are fetched concurrently.
+        FKAPI's bulk endpoint only takes slugs, so misses use the per-kit
+        endpoint and share its cache entries with ``get_kit_details``.
+
+        Returns:
+            dict: Kit data by kit id; kits FKAPI does not know or could not
+            return are left out.
+        """
+        kit_ids = list(dict.fromkeys(kit_ids))
+        if not kit_ids:
+            return {}
+
+        contexts = {
+            kit_id: self._create_request_context(f"/kits/{kit_id}", None, use_cache=True) for kit_id in kit_ids
+        }
+        cached = cache.get_many([ctx.cache_key for ctx in contexts.values()])
+        kits: dict[int, dict] = {}
+        missing = []
+        for kit_id, ctx in contexts.items():
+            entry = cache_serializer.decode(cached.get(ctx.cache_key))
+            if is_not_found_entry(entry):
+                continue
+            kit, is_fresh = unwrap_cache_entry(entry)
+            if kit is None:
+                missing.append(kit_id)
+                continue
+            if not is_fresh:
+                self._schedule_refresh(ctx)
+            kits[kit_id] = kit
+        cache_serializer.record_lookups(hits=len(kit_ids) - len(missing))
+
+        if missing:
+            # Misses are counted by the per-kit lookups of the async client
+            from .async_client import afetch_kit_details
+
+            logger.info("Fetching %d kit details (%d served from cache)", len(missing), len(kit_ids) - len(missing))
+            fetched = async_to_sync(afetch_kit_details)(missing, rate_limit_timeout=self.rate_limit_timeout)
+            kits.update({kit_id: kit for kit_id, kit in fetched.items() if kit is not None})
+        return {kit_id: kits[kit_id] for kit_id in kit_ids if kit_id in kits}
+
     def search_kits(self, query: str) -> list[dict]:
         """Search kits by name."""
         logger.info("Searching kits with query: '%s'", query)
@@ -440,18 +671,7 @@ class FKAPIClient:
 
         if result is None:
             logger.warning("FKAPI unavailable, trying alternative method for brand search")
-            kits = self.search_kits(query)
-            brands = {}
-            for kit in kits:
-                brand = kit.get("brand") or kit.get("team", {}).get("brand")
-                if brand:
-                    brand_name = brand.get("name") if isinstance(brand, dict) else brand
-                    if brand_name and brand_name not in brands:
-                        brands[brand_name] = {
-                            "id": brand.get("id") if isinstance(brand, dict) else None,
-                            "name": brand_name,
-                        }
-            return list(brands.values())
+            return self._brands_from_kits(self.search_kits(query))
 
         results = self._extract_list_from_result(result)
         logger.info("Brand search returned %s results", len(results))
@@ -464,55 +684,163 @@ class FKAPIClient:
 
         if result is None:
             logger.warning("FKAPI unavailable, trying alternative method for competition search")
-            kits = self.search_kits(query)
-            competitions = {}
-            for kit in kits:
-                comps = kit.get("competition") or kit.get("competitions", [])
-                if not isinstance(comps, list):
-                    comps = [comps] if comps else []
-                for comp in comps:
-                    comp_name = comp.get("name") if isinstance(comp, dict) else comp
-                    if comp_name and comp_name not in competitions:
-                        competitions[comp_name] = {
-                            "id": comp.get("id") if isinstance(comp, dict) else None,
-                            "name": comp_name,
-                        }
-            return list(competitions.values())
+            return self._competitions_from_kits(self.search_kits(query))
 
         results = self._extract_list_from_result(result)
         logger.info("Competition search returned %s results", len(results))
         return results
 
+    @staticmethod
+    def _brands_from_kits(kits: list[dict]) -> list[dict]:
+        """Derive a de-duplicated brand list from kit search results."""
+        brands = {}
+        for kit in kits:
+            brand = kit.get("brand") or kit.get("team", {}).get("brand")
+            if brand:
+                brand_name = brand.get("name") if isinstance(brand, dict) else brand
+                if brand_name and brand_name not in brands:
+                    brands[brand_name] = {
+                        "id": brand.get("id") if isinstance(brand, dict) else None,
+                        "name": brand_name,
+                    }
+        return list(brands.values())
+
+    @staticmethod
+    def _competitions_from_kits(kits: list[dict]) -> list[dict]:
+        """Derive a de-duplicated competition list from kit search results."""
+        competitions = {}
+        for kit in kits:
+            comps = kit.get("competition") or kit.get("competitions", [])
+            if not isinstance(comps, list):
+                comps = [comps] if comps else []
+            for comp in comps:
+                comp_name = comp.get("name") if isinstance(comp, dict) else comp
+                if comp_name and comp_name not in competitions:
+                    competitions[comp_name] = {
+                        "id": comp.get("id") if isinstance(comp, dict) else None,
+                        "name": comp_name,
+                    }
+        return list(competitions.values())
+
     def get_kits_bulk(self, slugs: list[str]) -> list[dict]:
-        """Get multiple kits by their slugs in a single request.
+        """Get multiple kits by their slugs.
+
+        Accepts any number of slugs. Kits already cached individually are
+        served from cache; the rest are fetched in chunks of up to
+        MAX_BULK_SLUGS (concurrently when there is more than one chunk), and a
+        lone slug goes to the single-kit endpoint.
 
         Args:
-            slugs: List of kit slugs (2-30 slugs supported)
+            slugs: List of kit slugs
 
         Returns:
-            List of kit data with reduced response format:
+            List of kit data in slug order. Bulk results use the reduced format:
             - name, team (name, logo, country), season (year), brand (name, logo), main_img_url
         """
+        slugs = list(dict.fromkeys(slug for slug in slugs if slug))
         if not slugs:
             return []
 
-        if len(slugs) < MIN_BULK_SLUGS:
-            logger.warning("Bulk endpoint requires at least %d slugs, got %d", MIN_BULK_SLUGS, len(slugs))
-            return []
+        kits_by_slug, missing = self._get_cached_bulk_kits(slugs)
+        unmatched: list[dict] = []
+        if missing:
+            logger.info("Fetching %d kits (%d served from cache)", len(missing), len(slugs) - len(missing))
+            if len(missing) <= MAX_BULK_SLUGS:
+                fetched, unmatched = self._fetch_kit_chunk(missing)
+            else:
+                from .async_client import afetch_missing_kits
+
+                fetched, unmatched = async_to_sync(afetch_missing_kits)(
+                    missing,
+                    rate_limit_timeout=self.rate_limit_timeout,
+                )
+            kits_by_slug.update(fetched)
+
+        kits = [kits_by_slug[slug] for slug in slugs if slug in kits_by_slug]
+        logger.info("Bulk fetch returned %d kits", len(kits) + len(unmatched))
+        return kits + unmatched
+
+    def _fetch_kit_chunk(self, chunk: list[str]) -> tuple[dict[str, dict], list[dict]]:
+        """Fetch one chunk of slugs (at most MAX_BULK_SLUGS) and cache each kit."""
+        if len(chunk) < MIN_BULK_SLUGS:
+            kit = self._get(f"/kits/{chunk[0]}")
+            kits = [kit] if kit else []
+        else:
+            result = self._get("/kits/bulk", params={"slugs": ",".join(chunk)})
+            kits = self._extract_list_from_result(result)
+        return self._cache_bulk_kits(chunk, kits)
+
+    @staticmethod
+    def _bulk_kit_cache_key(slug: str) -> str:
+        return f"fkapi_kit_slug_{hashlib.sha256(slug.encode()).hexdigest()}"
+
+    def _get_cached_bulk_kits(self, slugs: list[str]) -> tuple[dict[str, dict], list[str]]:
+        """
+        Look up individually cached kits.
+
+        Returns:
+            tuple: (kits by slug that are still fresh, slugs that need fetching)
+        """
+        keys = {self._bulk_kit_cache_key(slug): slug for slug in slugs}
+        cached = cache.get_many(list(keys))
+        kits_by_slug = {}
+        for key, entry in cached.items():
+            kit, is_fresh = unwrap_cache_entry(cache_serializer.decode(entry))
+            if kit and is_fresh:
+                kits_by_slug[keys[key]] = kit
+        missing = [slug for slug in slugs if slug not in kits_by_slug]
+        cache_serializer.record_lookups(hits=len(kits_by_slug), misses=len(missing))
+        return kits_by_slug, missing
+
+    @staticmethod
+    def _kit_identifiers(kit: dict) -> list[str]:
+        """Values in a kit payload that may be the slug it was requested by: slug, last URL segment, id."""
+        identifiers = [kit.get("slug")]
+        url = kit.get("url")
+        if isinstance(url, str) and url.strip("/"):
+            identifiers.append(url.rstrip("/").rsplit("/", 1)[-1])
+        identifiers.append(kit.get("id"))
+        return [str(value) for value in identifiers if value not in (None, "")]
+
+    def _cache_bulk_kits(self, chunk: list[str], kits: list[dict]) -> tuple[dict[str, dict], list[dict]]:
+        """
+        Match fetched kits to their slugs and cache each one individually.
 
-        if len(slugs) > MAX_BULK_SLUGS:
-            logger.warning("Bulk endpoint supports max %d slugs, got %d. Truncating.", MAX_BULK_SLUGS, len(slugs))
-            slugs = slugs[:MAX_BULK_SLUGS]
+        Kits are matched by an identifier carried in the kit itself (``slug``,
+        ``url`` or ``id``), never by position: FKAPI does not promise to return
+        kits in request order. The one kit of a single-slug chunk comes from the
+        single-kit endpoint and is the requested kit. Kits that cannot be
+        identified are returned but not cached.
 
-        slugs_param = ",".join(slugs)
-        logger.info("Fetching %d kits in bulk", len(slugs))
-        result = self._get("/kits/bulk", params={"slugs": slugs_param})
-        logger.debug("Bulk API raw result type: %s", type(result))
-        if result:
-            logger.debug("Bulk API result keys: %s", result.keys() if isinstance(result, dict) else "N/A (list)")
-        extracted = self._extract_list_from_result(result)
-        logger.info("Bulk API extracted %d kits", len(extracted))
-        return extracted
+        Returns:
+            tuple: (kits by slug, kits that could not be matched to a slug)
+        """
+        requested = set(chunk)
+        kits_by_slug: dict[str, dict] = {}
+        unmatched: list[dict] = []
+        if len(chunk) < MIN_BULK_SLUGS and kits and isinstance(kits[0], dict):
+            kits_by_slug[chunk[0]] = kits[0]
+            kits = kits[1:]
+        for kit in kits:
+            slug = None
+            if isinstance(kit, dict):
+                slug = next((value for value in self._kit_identifiers(kit) if value in requested), None)
+            if slug is None or slug in kits_by_slug:
+                unmatched.append(kit)
+            else:
+                kits_by_slug[slug] = kit
+
+        if kits_by_slug:
+            policy = get_cache_policy("/kits/bulk")
+            values = {}
+            raw_bytes = 0
+            for slug, kit in kits_by_slug.items():
+                value, raw_size = cache_serializer.encode(wrap_cache_entry(kit, policy.soft_ttl))
+                values[self._bulk_kit_cache_key(slug)] = value
+                raw_bytes += raw_size
+            cache.set_many(values, policy.hard_ttl)
+            cache_serializer.record_write(raw_bytes, sum(len(value) for value in values.values()))
+        return kits_by_slug, unmatched
 
     def _extract_list_from_result(self, result: dict | list | None) -> list[dict]:
         """Extract list from API result, handling various response formats."""
@@ -553,3 +881,4 @@ class RequestResult:
     data: dict | None = None
     error: Exception | None = None
     should_stop: bool = False
+    not_found: bool = False
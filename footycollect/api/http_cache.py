@@ -0,0 +1,110 @@
+"""
+HTTP caching for the FKAPI proxy views.
+
+Responses carry a strong ETag and a ``Cache-Control`` header, so browsers and
+the reverse proxy can reuse them and revalidate cheaply.
+
+* The ETag is derived from the content hash of the FKAPI cache entry the
+  response was built from (see ``FKAPIClient.last_content_hash``). A matching
+  ``If-None-Match`` is answered with a 304 before the body is serialized.
+  Responses not backed by hashed cache entries fall back to hashing the body.
+* ``Cache-Control`` is ``public`` with a per-view ``max-age`` and
+  ``stale-while-revalidate``, following how often the upstream data changes.
+
+Policies can be overridden with the ``FKAPI_HTTP_CACHE_POLICIES`` setting, e.g.
+``{"search_kits": {"max_age": 60}}``.
+"""
+
+import hashlib
+from dataclasses import dataclass, replace
+
+from django.conf import settings
+from django.http import HttpResponse, JsonResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import quote_etag
+
+from .cache_policy import DAY, HOUR, MINUTE
+
+# Bump when the JSON shape of the views changes, so old ETags stop matching
+HTTP_CACHE_VERSION = 1
+
+
+@dataclass(frozen=True)
+class HttpCachePolicy:
+    """Browser and proxy cache lifetimes for one view."""
+
+    max_age: int
+    stale_while_revalidate: int
+
+
+DEFAULT_HTTP_CACHE_POLICY = HttpCachePolicy(max_age=5 * MINUTE, stale_while_revalidate=HOUR)
+
+# Kit details and club season lists barely change; searches pick up new kits.
+VIEW_HTTP_CACHE_POLICIES: dict[str, HttpCachePolicy] = {
+    "get_kit_details": HttpCachePolicy(max_age=HOUR, stale_while_revalidate=DAY),
+    "get_kits_details": HttpCachePolicy(max_age=HOUR, stale_while_revalidate=DAY),
+    "get_club_seasons": HttpCachePolicy(max_age=HOUR, stale_while_revalidate=DAY),
+    "get_club_kits": HttpCachePolicy(max_age=HOUR, stale_while_revalidate=DAY),
+    "search_kits": HttpCachePolicy(max_age=5 * MINUTE, stale_while_revalidate=HOUR),
+    "search_clubs": HttpCachePolicy(max_age=15 * MINUTE, stale_while_revalidate=HOUR),
+    "search_brands": HttpCachePolicy(max_age=15 * MINUTE, stale_while_revalidate=HOUR),
+    "search_competitions": HttpCachePolicy(max_age=15 * MINUTE, stale_while_revalidate=HOUR),
+    "search_seasons": HttpCachePolicy(max_age=15 * MINUTE, stale_while_revalidate=HOUR),
+}
+
+
+def get_http_cache_policy(view_name: str) -> HttpCachePolicy:
+    """Return the policy for ``view_name``, with overrides from settings."""
+    policy = VIEW_HTTP_CACHE_POLICIES.get(view_name, DEFAULT_HTTP_CACHE_POLICY)
+    overrides = getattr(settings, "FKAPI_HTTP_CACHE_POLICIES", {}).get(view_name)
+    return replace(policy, **overrides) if overrides else policy
+
+
+def _etag(view_name: str, content: str) -> str:
+    digest = hashlib.sha256(f"{HTTP_CACHE_VERSION}:{view_name}:{content}".encode()).hexdigest()[:32]
+    return quote_etag(digest)
+
+
+def _patch_headers(response: HttpResponse, view_name: str, etag: str) -> HttpResponse:
+    policy = get_http_cache_policy(view_name)
+    response["ETag"] = etag
+    patch_cache_control(
+        response,
+        public=True,
+        max_age=policy.max_age,
+        stale_while_revalidate=policy.stale_while_revalidate,
+    )
+    return response
+
+
+def cached_json_response(
+    request,
+    view_name: str,
+    data: dict,
+    content_hash: str | None = None,
+) -> HttpResponse:
+    """
+    Build a cacheable JSON response for a proxy view.
+
+    Args:
+        request: The incoming request, checked for ``If-None-Match``
+        view_name: Name of the view, selects the cache policy
+        data: Response body
+        content_hash: Content hash of the FKAPI cache entry ``data`` was
+            built from
+
+    Returns:
+        HttpResponse: 304 when the client's copy is current, otherwise the
+        JSON response with ETag and Cache-Control set
+    """
+    if isinstance(content_hash, str):
+        etag = _etag(view_name, content_hash)
+        not_modified = get_conditional_response(request, etag=etag)
+        if not_modified is not None:
+            return _patch_headers(not_modified, view_name, etag)
+        response = JsonResponse(data)
+    else:
+        response = JsonResponse(data)
+        etag = _etag(view_name, hashlib.sha256(response.content).hexdigest())
+    _patch_headers(response, view_name, etag)
+    return get_conditional_response(request, etag=etag, response=response)
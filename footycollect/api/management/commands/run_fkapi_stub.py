@@ -0,0 +1,70 @@
+"""
+Run a local stand-in for the Football Kit Archive API.
+
+Serves recorded fixtures for the endpoints FKAPIClient uses, with optional
+latency, error-rate and throttling, so FKAPI-dependent flows can be load
+tested without a live upstream. Point FKA_API_IP at the printed address.
+"""
+
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from footycollect.api.stub_server import DEFAULT_FIXTURES_PATH, FKAPIFixtures, FKAPIStubServer, StubBehavior
+
+
+class Command(BaseCommand):
+    help = "Serve recorded FKAPI fixtures on a local port with configurable latency, errors and throttling"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--host", default="127.0.0.1", help="Interface to bind (default: 127.0.0.1)")
+        parser.add_argument("--port", type=int, default=8765, help="Port to listen on (default: 8765)")
+        parser.add_argument(
+            "--fixtures",
+            type=Path,
+            default=DEFAULT_FIXTURES_PATH,
+            help="JSON file with recorded FKAPI data",
+        )
+        parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every response")
+        parser.add_argument("--jitter", type=float, default=0.0, help="Extra random latency, up to this many seconds")
+        parser.add_argument(
+            "--error-rate",
+            type=float,
+            default=0.0,
+            help="Fraction of requests answered with 503 (0-1)",
+        )
+        parser.add_argument(
+            "--rate-limit",
+            type=int,
+            default=0,
+            help="Requests per minute before answering 429 (0 disables)",
+        )
+        parser.add_argument("--seed", type=int, default=None, help="Random seed for reproducible runs")
+
+    def handle(self, *args, **options):
+        if not 0 <= options["error_rate"] <= 1:
+            msg = "--error-rate must be between 0 and 1"
+            raise CommandError(msg)
+        try:
+            fixtures = FKAPIFixtures.from_file(options["fixtures"])
+        except (OSError, ValueError) as e:
+            msg = f"Could not load fixtures from {options['fixtures']}: {e}"
+            raise CommandError(msg) from e
+
+        behavior = StubBehavior(
+            latency=options["latency"],
+            jitter=options["jitter"],
+            error_rate=options["error_rate"],
+            rate_limit_per_minute=options["rate_limit"],
+            seed=options["seed"],
+        )
+        server = FKAPIStubServer(options["host"], options["port"], fixtures=fixtures, behavior=behavior)
+        self.stdout.write(self.style.SUCCESS(f"FKAPI stub listening on {server.address} (set FKA_API_IP to this)"))
+        self.stdout.write(f"Behavior: {behavior}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            self.stdout.write("Stopping FKAPI stub")
+        finally:
+            server.server_close()
+            self.stdout.write(f"Responses by status: {dict(server.status_counts)}")
@@ -0,0 +1,185 @@
+"""
+Distributed token-bucket rate limiter for outbound FKAPI calls.
+
+All web and Celery workers share one upstream quota, so the bucket lives in
+Redis and is updated by a Lua script. This keeps the refill-and-take step
+atomic and uses the Redis clock, so workers with skewed clocks still agree.
+When the cache backend is not Redis (tests, local development with
+DummyCache), a per-process bucket with the same semantics is used instead.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from dataclasses import dataclass
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+RATE_LIMIT_KEY = "fkapi_rate_limit"
+DEFAULT_RATE_PER_MINUTE = 100
+DEFAULT_BURST = 20
+# How long batch imports wait for tokens before skipping a request
+BATCH_ACQUIRE_TIMEOUT = 120
+
+# Requests that make FKAPI do more work consume more of the quota.
+ENDPOINT_WEIGHTS: dict[str, int] = {
+    "/kits/bulk": 5,
+}
+
+# KEYS[1] bucket key
+# ARGV[1] capacity, ARGV[2] refill rate (tokens/second), ARGV[3] cost
+# Returns {granted (0/1), seconds to wait as string}
+BUCKET_LUA_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(bucket[1]) or capacity
+local ts = tonumber(bucket[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+
+local granted = 0
+local wait = 0
+if tokens >= cost then
+    tokens = tokens - cost
+    granted = 1
+else
+    wait = (cost - tokens) / rate
+end
+
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) + 1)
+return {granted, tostring(wait)}
+"""
+
+
+@dataclass
+class _LocalBucket:
+    tokens: float
+    updated_at: float
+
+
+_local_buckets: dict[str, _LocalBucket] = {}
+_local_lock = threading.Lock()
+_redis_script = None
+_redis_checked = False
+
+
+def _get_redis_script():
+    """Return the registered Lua script, or None when the cache is not Redis."""
+    global _redis_script, _redis_checked  # noqa: PLW0603
+
+    if not _redis_checked:
+        try:
+            from django_redis import get_redis_connection
+
+            _redis_script = get_redis_connection("default").register_script(BUCKET_LUA_SCRIPT)
+        except (ImportError, NotImplementedError):
+            logger.info("Cache backend is not Redis, using per-process FKAPI rate limiter")
+            _redis_script = None
+        _redis_checked = True
+    return _redis_script
+
+
+def get_endpoint_weight(endpoint: str) -> int:
+    """Return the token cost of ``endpoint`` (longest matching prefix, default 1)."""
+    weights = {**ENDPOINT_WEIGHTS, **getattr(settings, "FKAPI_RATE_LIMIT_WEIGHTS", {})}
+    matches = [prefix for prefix in weights if endpoint.startswith(prefix)]
+    if not matches:
+        return 1
+    return weights[max(matches, key=len)]
+
+
+class TokenBucketRateLimiter:
+    """Token bucket shared by every process that talks to FKAPI."""
+
+    def __init__(
+        self,
+        key: str = RATE_LIMIT_KEY,
+        rate_per_minute: int | None = None,
+        burst: int | None = None,
+    ):
+        self.key = key
+        self.rate_per_minute = rate_per_minute or getattr(
+            settings,
+            "FKAPI_RATE_LIMIT_PER_MINUTE",
+            DEFAULT_RATE_PER_MINUTE,
+        )
+        self.capacity = burst or getattr(settings, "FKAPI_RATE_LIMIT_BURST", DEFAULT_BURST)
+        self.refill_per_second = self.rate_per_minute / 60
+
+    def try_acquire(self, cost: int = 1) -> float:
+        """
+        Take ``cost`` tokens if available.
+
+        Returns:
+            float: 0 when granted, otherwise seconds until enough tokens refill
+        """
+        if cost > self.capacity:
+            logger.warning("Rate limit cost %d exceeds bucket capacity %d", cost, self.capacity)
+            cost = self.capacity
+
+        script = _get_redis_script()
+        if script is None:
+            return self._try_acquire_local(cost)
+        try:
+            granted, wait = script(keys=[self.key], args=[self.capacity, self.refill_per_second, cost])
+        except Exception:
+            # Same as the cache backend with IGNORE_EXCEPTIONS: fail open
+            logger.exception("Redis rate limiter unavailable, allowing FKAPI request")
+            return 0.0
+        return 0.0 if int(granted) else float(wait)
+
+    def _try_acquire_local(self, cost: int) -> float:
+        now = time.monotonic()
+        with _local_lock:
+            bucket = _local_buckets.setdefault(self.key, _LocalBucket(self.capacity, now))
+            elapsed = max(0.0, now - bucket.updated_at)
+            bucket.tokens = min(self.capacity, bucket.tokens + elapsed * self.refill_per_second)
+            bucket.updated_at = now
+            if bucket.tokens >= cost:
+                bucket.tokens -= cost
+                return 0.0
+            return (cost - bucket.tokens) / self.refill_per_second
+
+    def acquire(self, cost: int = 1, max_wait: float = 0) -> bool:
+        """Take ``cost`` tokens, blocking up to ``max_wait`` seconds for them to refill."""
+        deadline = time.monotonic() + max_wait
+        while True:
+            wait = self.try_acquire(cost)
+            if wait <= 0:
+                return True
+            remaining = deadline - time.monotonic()
+            if wait > remaining:
+                return False
+            time.sleep(wait)
+
+    async def aacquire(self, cost: int = 1, max_wait: float = 0) -> bool:
+        """
+        Async counterpart of ``acquire`` that waits without blocking the event loop.
+
+        The Redis script runs in a worker thread, as it is a network round trip.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + max_wait
+        try_acquire = sync_to_async(self.try_acquire, thread_sensitive=False)
+        while True:
+            wait = await try_acquire(cost)
+            if wait <= 0:
+                return True
+            if wait > deadline - loop.time():
+                return False
+            await asyncio.sleep(wait)
+
+
+def reset_local_buckets() -> None:
+    """Drop per-process bucket state (used by tests)."""
+    with _local_lock:
+        _local_buckets.clear()
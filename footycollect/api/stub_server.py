@@ -0,0 +1,312 @@
+"""
+Local stand-in for the Football Kit Archive API.
+
+Serves the endpoints ``FKAPIClient`` uses from a recorded fixture file so
+FKAPI-dependent flows (autocomplete, kit creation, ``fetch_home_kits``,
+``populate_user_collection``) can be exercised and benchmarked without a live
+FKAPI or network access. Point ``FKA_API_IP`` at the server address.
+
+Upstream behavior is configurable through ``StubBehavior``: added latency,
+a fraction of requests answered with 503, and a per-minute quota beyond which
+requests get 429 with ``Retry-After``. Run it with the ``run_fkapi_stub``
+management command, or start it in-process from tests::
+
+    with FKAPIStubServer(behavior=StubBehavior(error_rate=0.2, seed=1)) as server:
+        settings.FKA_API_IP = server.address
+"""
+
+import json
+import logging
+import random
+import re
+import threading
+import time
+from collections import Counter, deque
+from dataclasses import dataclass
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FIXTURES_PATH = Path(__file__).parent / "stub_data" / "fkapi_recorded.json"
+DEFAULT_PAGE_SIZE = 20
+THROTTLE_WINDOW = 60  # seconds
+
+
+@dataclass
+class StubBehavior:
+    """Knobs that make the stand-in behave like a slow or unreliable upstream."""
+
+    latency: float = 0.0  # seconds added to every response
+    jitter: float = 0.0  # extra random latency, uniform in [0, jitter]
+    error_rate: float = 0.0  # fraction of requests answered with 503
+    rate_limit_per_minute: int = 0  # 0 disables throttling
+    seed: int | None = None
+
+
+class FKAPIFixtures:
+    """Recorded FKAPI data and the lookups each endpoint needs."""
+
+    def __init__(self, data: dict):
+        self.clubs = data.get("clubs", [])
+        self.seasons = data.get("seasons", {})
+        self.brands = data.get("brands", [])
+        self.competitions = data.get("competitions", [])
+        self.kits = data.get("kits", [])
+        self.user_collections = data.get("user_collections", {})
+        self._kits_by_key = {str(kit["id"]): kit for kit in self.kits}
+        self._kits_by_key.update({kit["slug"]: kit for kit in self.kits if kit.get("slug")})
+
+    @classmethod
+    def from_file(cls, path: Path | str = DEFAULT_FIXTURES_PATH) -> "FKAPIFixtures":
+        with Path(path).open(encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    @staticmethod
+    def _search(items: list[dict], keyword: str) -> list[dict]:
+        keyword = keyword.lower()
+        return [item for item in items if keyword in item.get("name", "").lower()]
+
+    def search_clubs(self, keyword: str) -> list[dict]:
+        return self._search(self.clubs, keyword)
+
+    def search_brands(self, keyword: str) -> list[dict]:
+        return self._search(self.brands, keyword)
+
+    def search_competitions(self, keyword: str) -> list[dict]:
+        return self._search(self.competitions, keyword)
+
+    def search_kits(self, keyword: str) -> list[dict]:
+        """Kit search results use FKAPI's reduced search format."""
+        return [
+            {
+                "id": kit["id"],
+                "name": kit["name"],
+                "main_img_url": kit.get("main_img_url"),
+                "team_name": kit.get("team", {}).get("name"),
+                "season_year": kit.get("season", {}).get("year"),
+            }
+            for kit in self._search(self.kits, keyword)
+        ]
+
+    def club_seasons(self, club_id: str) -> list[dict]:
+        return self.seasons.get(club_id, [])
+
+    def club_kits(self, club_id: str, season_id: str) -> list[dict]:
+        return [
+            kit
+            for kit in self.kits
+            if str(kit.get("team", {}).get("id")) == club_id and str(kit.get("season", {}).get("id")) == season_id
+        ]
+
+    def kit(self, key: str) -> dict | None:
+        """Look up a kit by id or slug."""
+        return self._kits_by_key.get(key)
+
+    def kits_bulk(self, slugs: list[str]) -> list[dict]:
+        """Bulk results use FKAPI's reduced format, in request order, skipping unknown slugs."""
+        kits = [self._kits_by_key[slug] for slug in slugs if slug in self._kits_by_key]
+        return [
+            {
+                "slug": kit.get("slug"),
+                "name": kit["name"],
+                "team": {key: kit.get("team", {}).get(key) for key in ("name", "logo", "country")},
+                "season": {"year": kit.get("season", {}).get("year")},
+                "brand": {key: kit.get("brand", {}).get(key) for key in ("name", "logo", "logo_dark")},
+                "main_img_url": kit.get("main_img_url"),
+            }
+            for kit in kits
+        ]
+
+    def user_collection(self, userid: str, page: int, page_size: int) -> dict | None:
+        collection = self.user_collections.get(userid)
+        if collection is None:
+            return None
+        entries = collection.get("entries", [])
+        total_pages = max(1, -(-len(entries) // page_size))
+        start = (page - 1) * page_size
+        return {
+            "status": "completed",
+            "data": {"user": collection.get("user"), "entries": entries[start : start + page_size]},
+            "pagination": {"page": page, "page_size": page_size, "total_pages": total_pages},
+        }
+
+    def scrape_user_collection(self, userid: str) -> dict | None:
+        collection = self.user_collections.get(userid)
+        if collection is None:
+            return None
+        return {"status": "cached", "data": collection}
+
+
+class _StubRequestHandler(BaseHTTPRequestHandler):
+    server: "FKAPIStubServer"
+
+    GET_ROUTES = (
+        (re.compile(r"^/api/clubs/search$"), "_clubs_search"),
+        (re.compile(r"^/api/clubs/(?P<club_id>\d+)/kits$"), "_club_kits"),
+        (re.compile(r"^/api/seasons$"), "_seasons"),
+        (re.compile(r"^/api/kits/search$"), "_kits_search"),
+        (re.compile(r"^/api/kits/bulk$"), "_kits_bulk"),
+        (re.compile(r"^/api/kits/(?P<key>[^/]+)$"), "_kit_details"),
+        (re.compile(r"^/api/brands/search$"), "_brands_search"),
+        (re.compile(r"^/api/competitions/search$"), "_competitions_search"),
+        (re.compile(r"^/api/user-collection/(?P<userid>\d+)$"), "_user_collection"),
+    )
+    POST_ROUTES = ((re.compile(r"^/api/user-collection/(?P<userid>\d+)/scrape$"), "_scrape_user_collection"),)
+
+    def do_GET(self):  # noqa: N802
+        self._dispatch(self.GET_ROUTES)
+
+    def do_POST(self):  # noqa: N802
+        self._dispatch(self.POST_ROUTES)
+
+    def log_message(self, format, *args):  # noqa: A002
+        logger.debug("FKAPI stub: %s", format % args)
+
+    def _dispatch(self, routes) -> None:
+        url = urlsplit(self.path)
+        self.query = {key: values[0] for key, values in parse_qs(url.query).items()}
+
+        delay = self.server.simulated_delay()
+        if delay:
+            time.sleep(delay)
+
+        if retry_after := self.server.throttle():
+            self._send(HTTPStatus.TOO_MANY_REQUESTS, {"error": "rate limited"}, {"Retry-After": str(retry_after)})
+            return
+        if self.server.should_fail():
+            self._send(HTTPStatus.SERVICE_UNAVAILABLE, {"error": "simulated upstream failure"})
+            return
+
+        for pattern, handler_name in routes:
+            if match := pattern.match(url.path):
+                payload = getattr(self, handler_name)(**match.groupdict())
+                if payload is None:
+                    self._send(HTTPStatus.NOT_FOUND, {"error": "not found"})
+                else:
+                    self._send(HTTPStatus.OK, payload)
+                return
+        self._send(HTTPStatus.NOT_FOUND, {"error": f"unknown endpoint {url.path}"})
+
+    def _send(self, status: HTTPStatus, payload, headers: dict | None = None) -> None:
+        self.server.record(status)
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _keyword(self) -> str:
+        return self.query.get("keyword", "")
+
+    def _clubs_search(self):
+        return self.server.fixtures.search_clubs(self._keyword())
+
+    def _club_kits(self, club_id):
+        return self.server.fixtures.club_kits(club_id, self.query.get("season", ""))
+
+    def _seasons(self):
+        return self.server.fixtures.club_seasons(self.query.get("id", ""))
+
+    def _kits_search(self):
+        return self.server.fixtures.search_kits(self._keyword())
+
+    def _kits_bulk(self):
+        slugs = [slug for slug in self.query.get("slugs", "").split(",") if slug]
+        return self.server.fixtures.kits_bulk(slugs)
+
+    def _kit_details(self, key):
+        return self.server.fixtures.kit(key)
+
+    def _brands_search(self):
+        return self.server.fixtures.search_brands(self._keyword())
+
+    def _competitions_search(self):
+        return self.server.fixtures.search_competitions(self._keyword())
+
+    def _user_collection(self, userid):
+        page = int(self.query.get("page", 1))
+        page_size = int(self.query.get("page_size", DEFAULT_PAGE_SIZE))
+        return self.server.fixtures.user_collection(userid, page, page_size)
+
+    def _scrape_user_collection(self, userid):
+        return self.server.fixtures.scrape_user_collection(userid)
+
+
+class FKAPIStubServer(ThreadingHTTPServer):
+    """Threaded HTTP server answering FKAPI requests from fixtures."""
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        *,
+        fixtures: FKAPIFixtures | None = None,
+        behavior: StubBehavior | None = None,
+    ):
+        super().__init__((host, port), _StubRequestHandler)
+        self.fixtures = fixtures or FKAPIFixtures.from_file()
+        self.behavior = behavior or StubBehavior()
+        self.status_counts: Counter[int] = Counter()
+        self._random = random.Random(self.behavior.seed)  # noqa: S311
+        self._lock = threading.Lock()
+        self._request_times: deque[float] = deque()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def address(self) -> str:
+        """``host:port`` to use as ``FKA_API_IP``."""
+        host, port = self.server_address[:2]
+        return f"{host}:{port}"
+
+    def start(self) -> "FKAPIStubServer":
+        """Serve requests from a background thread."""
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> "FKAPIStubServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def simulated_delay(self) -> float:
+        with self._lock:
+            return self.behavior.latency + self._random.uniform(0, self.behavior.jitter)
+
+    def should_fail(self) -> bool:
+        with self._lock:
+            return self._random.random() < self.behavior.error_rate
+
+    def throttle(self) -> int:
+        """Count a request against the quota; return seconds to retry after, or 0."""
+        limit = self.behavior.rate_limit_per_minute
+        if not limit:
+            return 0
+        now = time.monotonic()
+        with self._lock:
+            while self._request_times and now - self._request_times[0] >= THROTTLE_WINDOW:
+                self._request_times.popleft()
+            if len(self._request_times) >= limit:
+                return max(1, int(THROTTLE_WINDOW - (now - self._request_times[0])) + 1)
+            self._request_times.append(now)
+            return 0
+
+    def record(self, status: HTTPStatus) -> None:
+        with self._lock:
+            self.status_counts[int(status)] += 1
@@ -17,3 +17,9 @@ def scrape_user_collection_task(userid: int):
         raise
     else:
         return result or {}
+
+
+@shared_task
+def refresh_fkapi_cache_task(endpoint: str, params: dict | None = None):
+    """Refresh a stale FKAPI cache entry in the background."""
+    FKAPIClient().refresh_cache(endpoint, params)
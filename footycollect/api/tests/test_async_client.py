@@ -0,0 +1,176 @@
+"""
+Tests for the asyncio FKAPI client.
+"""
+
+import asyncio
+import threading
+from unittest.mock import patch
+
+import httpx
+import pytest
+from asgiref.sync import async_to_sync
+
+from footycollect.api.async_client import AsyncFKAPIClient, afetch_season_sources
+
+CLUB_LIMIT = 3
+UPSTREAM_DELAY = 0.05
+
+
+def _mock_http(handler):
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+class _InFlightTracker:
+    """Records how many upstream requests were running at the same time."""
+
+    def __init__(self, routes):
+        self.routes = routes
+        self.current = 0
+        self.peak = 0
+        self.paths = []
+
+    async def __call__(self, request):
+        self.current += 1
+        self.peak = max(self.peak, self.current)
+        self.paths.append(request.url.path)
+        await asyncio.sleep(UPSTREAM_DELAY)
+        self.current -= 1
+        for prefix, payload in self.routes.items():
+            if request.url.path.startswith(prefix):
+                return httpx.Response(200, json=payload)
+        return httpx.Response(404, json={"error": "not found"})
+
+
+@pytest.mark.django_db
+class TestAsyncFKAPIClient:
+    def test_asearch_clubs_returns_results_and_caches(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request.url.params["keyword"])
+            return httpx.Response(200, json=[{"id": 893, "name": "Hammarby"}])
+
+        async def run():
+            async with AsyncFKAPIClient() as client:
+                client._http = _mock_http(handler)
+                first = await client.asearch_clubs("async-hammarby")
+                second = await client.asearch_clubs("async-hammarby")
+            return first, second
+
+        first, second = async_to_sync(run)()
+
+        assert first == [{"id": 893, "name": "Hammarby"}]
+        assert second == first
+        assert calls == ["async-hammarby"]
+
+    def test_cache_helpers_run_off_the_event_loop_thread(self):
+        helper_threads = []
+        try_cache = AsyncFKAPIClient._try_cache
+
+        def recording_try_cache(self, ctx, **kwargs):
+            helper_threads.append(threading.get_ident())
+            return try_cache(self, ctx, **kwargs)
+
+        def handler(request):
+            return httpx.Response(200, json=[{"id": 1, "name": "Off loop"}])
+
+        async def run():
+            async with AsyncFKAPIClient() as client:
+                client._http = _mock_http(handler)
+                await client.asearch_clubs("async-off-loop")
+            return threading.get_ident()
+
+        with patch.object(AsyncFKAPIClient, "_try_cache", recording_try_cache):
+            loop_thread = async_to_sync(run)()
+
+        assert helper_threads
+        assert loop_thread not in helper_threads
+
+    def test_http_error_records_failure_and_returns_empty(self):
+        def handler(request):
+            return httpx.Response(500, json={"error": "boom"})
+
+        async def run():
+            async with AsyncFKAPIClient() as client:
+                client.max_retries = 1
+                client._http = _mock_http(handler)
+                return await client.asearch_kits("async-error"), client.circuit_breaker.failure_count
+
+        results, failures = async_to_sync(run)()
+
+        assert results == []
+        assert failures == 1
+
+    def test_not_found_is_cached_without_breaker_failure(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request.url.path)
+            return httpx.Response(404, json={"error": "not found"})
+
+        async def run():
+            async with AsyncFKAPIClient() as client:
+                client._http = _mock_http(handler)
+                first = await client.aget_kit_details(888888)
+                second = await client.aget_kit_details(888888)
+                return first, second, client.circuit_breaker.failure_count
+
+        first, second, failures = async_to_sync(run)()
+
+        assert first is None
+        assert second is None
+        assert calls == ["/api/kits/888888"]
+        assert failures == 0
+
+    def test_asearch_brands_falls_back_to_kit_results(self):
+        def handler(request):
+            if request.url.path.endswith("/brands/search"):
+                return httpx.Response(503)
+            return httpx.Response(200, json=[{"brand": {"id": 7, "name": "Adidas"}}])
+
+        async def run():
+            async with AsyncFKAPIClient() as client:
+                client.max_retries = 1
+                client._http = _mock_http(handler)
+                return await client.asearch_brands("async-adidas")
+
+        assert async_to_sync(run)() == [{"id": 7, "name": "Adidas"}]
+
+    def test_fetch_season_sources_runs_club_seasons_concurrently(self):
+        tracker = _InFlightTracker(
+            {
+                "/api/kits/search": [{"season": {"id": 1, "year": "2024"}}],
+                "/api/clubs/search": [{"id": club_id} for club_id in range(1, 6)],
+                "/api/seasons": [{"id": 2, "year": "2023"}],
+            },
+        )
+
+        with patch.object(AsyncFKAPIClient, "_get_http", lambda self: self._http or _set_http(self, tracker)):
+            sources = async_to_sync(afetch_season_sources)("async-fanout", CLUB_LIMIT)
+
+        assert sources.kits == [{"season": {"id": 1, "year": "2024"}}]
+        assert len(sources.club_seasons) == CLUB_LIMIT
+        assert sources.complete is True
+        assert tracker.paths.count("/api/seasons") == CLUB_LIMIT
+        # kit search overlaps with club search, and all club season calls overlap
+        assert tracker.peak >= CLUB_LIMIT
+
+    def test_fetch_season_sources_marks_unanswered_requests(self):
+        tracker = _InFlightTracker(
+            {
+                "/api/clubs/search": [{"id": 1}],
+                "/api/seasons": [{"id": 2, "year": "2023"}],
+            },
+        )
+
+        with patch.object(AsyncFKAPIClient, "_get_http", lambda self: self._http or _set_http(self, tracker)):
+            sources = async_to_sync(afetch_season_sources)("async-partial", CLUB_LIMIT)
+
+        assert sources.kits == []
+        assert sources.club_seasons == [[{"id": 2, "year": "2023"}]]
+        assert sources.complete is False
+
+
+def _set_http(client, handler):
+    client._http = _mock_http(handler)
+    return client._http
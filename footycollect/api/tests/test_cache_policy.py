@@ -0,0 +1,46 @@
+"""
+Tests for per-endpoint FKAPI cache policies.
+"""
+
+from django.test import override_settings
+
+from footycollect.api.cache_policy import (
+    DEFAULT_CACHE_POLICY,
+    ENDPOINT_CACHE_POLICIES,
+    CachePolicy,
+    get_cache_policy,
+)
+
+OVERRIDE_SOFT_TTL = 42
+
+
+class TestGetCachePolicy:
+    def test_longest_prefix_wins(self):
+        assert get_cache_policy("/kits/search") == ENDPOINT_CACHE_POLICIES["/kits/search"]
+        assert get_cache_policy("/kits/171008") == ENDPOINT_CACHE_POLICIES["/kits/"]
+
+    def test_kit_details_live_longer_than_search(self):
+        details = get_cache_policy("/kits/171008")
+        search = get_cache_policy("/kits/search")
+        assert details.soft_ttl > search.soft_ttl
+        assert details.hard_ttl > search.hard_ttl
+
+    def test_unknown_endpoint_uses_default(self):
+        custom = CachePolicy(soft_ttl=1, hard_ttl=2)
+        assert get_cache_policy("/unknown") == DEFAULT_CACHE_POLICY
+        assert get_cache_policy("/unknown", default=custom) == custom
+
+    @override_settings(FKAPI_CACHE_POLICIES={"/kits/search": {"soft_ttl": OVERRIDE_SOFT_TTL}})
+    def test_settings_override_single_field(self):
+        policy = get_cache_policy("/kits/search")
+        assert policy.soft_ttl == OVERRIDE_SOFT_TTL
+        assert policy.hard_ttl == ENDPOINT_CACHE_POLICIES["/kits/search"].hard_ttl
+
+    def test_negative_results_expire_before_positive_ones(self):
+        for policy in ENDPOINT_CACHE_POLICIES.values():
+            assert policy.empty_ttl < policy.hard_ttl
+            assert policy.not_found_ttl < policy.hard_ttl
+
+    @override_settings(FKAPI_CACHE_POLICIES={"/clubs/search": {"cache_empty": False}})
+    def test_settings_can_disable_negative_caching(self):
+        assert get_cache_policy("/clubs/search").cache_empty is False
@@ -0,0 +1,105 @@
+"""
+Tests for compact FKAPI cache serialization and its metrics.
+"""
+
+import pytest
+from django.test import override_settings
+
+from footycollect.api import cache_serializer
+from footycollect.api.cache_serializer import FORMAT_JSON, FORMAT_JSON_ZLIB, decode, encode
+from footycollect.api.client import CACHE_ENTRY_MARKER, FKAPIClient
+
+KIT_COUNT = 200
+MIN_COMPRESSION_RATIO = 4
+HALF = 0.5
+
+
+def _search_payload():
+    return {
+        "results": [
+            {
+                "id": kit_id,
+                "name": f"FC Barcelona 2023-24 Home Kit {kit_id}",
+                "team": {
+                    "name": "FC Barcelona",
+                    "logo": "https://www.footballkitarchive.com/static/logos/teams/6.png",
+                },
+                "brand": {"name": "Nike", "logo": "https://www.footballkitarchive.com/static/logos/misc/Nike.png"},
+                "season": {"year": "2023-24"},
+            }
+            for kit_id in range(KIT_COUNT)
+        ],
+    }
+
+
+class TestEncodeDecode:
+    def test_small_entries_are_stored_uncompressed(self):
+        value, raw_size = encode({"data": {"id": 1}})
+        assert value.startswith(FORMAT_JSON)
+        assert raw_size == len(value) - 1
+        assert decode(value) == {"data": {"id": 1}}
+
+    def test_large_search_results_compress_several_times(self):
+        payload = _search_payload()
+        value, raw_size = encode(payload)
+        assert value.startswith(FORMAT_JSON_ZLIB)
+        assert raw_size / len(value) >= MIN_COMPRESSION_RATIO
+        assert decode(value) == payload
+
+    @override_settings(FKAPI_CACHE_COMPRESS_MIN_BYTES=1)
+    def test_compression_threshold_is_configurable(self):
+        value, _ = encode({"data": {"id": 1}})
+        assert value.startswith(FORMAT_JSON_ZLIB)
+
+    def test_legacy_and_corrupt_values(self):
+        assert decode({"results": []}) == {"results": []}
+        assert decode(None) is None
+        assert decode(FORMAT_JSON_ZLIB + b"not zlib") is None
+
+
+@pytest.mark.django_db
+class TestFKAPICacheMetrics:
+    def setup_method(self):
+        cache_serializer.reset_fkapi_cache_metrics()
+
+    def test_client_records_hits_misses_and_bytes(self):
+        from django.core.cache import cache
+
+        client = FKAPIClient()
+        ctx = client._create_request_context("/kits/search", {"keyword": "metrics"}, use_cache=True)
+
+        assert client._try_cache(ctx) == (False, None)
+        client._cache_response(ctx, _search_payload())
+        hit, data = client._try_cache(ctx)
+
+        assert hit
+        assert data == _search_payload()
+        assert isinstance(cache.get(ctx.cache_key), bytes)
+        metrics = cache_serializer.get_fkapi_cache_metrics()
+        assert metrics["hits"] == 1
+        assert metrics["misses"] == 1
+        assert metrics["hit_rate"] == HALF
+        assert metrics["compression_ratio"] >= MIN_COMPRESSION_RATIO
+
+    def test_legacy_pickled_entries_still_read(self):
+        from django.core.cache import cache
+
+        client = FKAPIClient()
+        ctx = client._create_request_context("/clubs/search", {"keyword": "legacy"}, use_cache=True)
+        cache.set(ctx.cache_key, {CACHE_ENTRY_MARKER: 1, "data": {"results": [1]}, "fresh_until": 1e12}, 60)
+
+        assert client._try_cache(ctx) == (True, {"results": [1]})
+
+    def test_reset_clears_metrics(self):
+        cache_serializer.record_lookups(hits=3, misses=2)
+        cache_serializer.record_write(100, 10)
+        cache_serializer.reset_fkapi_cache_metrics()
+
+        assert cache_serializer.get_fkapi_cache_metrics() == {
+            "hits": 0,
+            "misses": 0,
+            "hit_rate": 0.0,
+            "raw_bytes": 0,
+            "stored_bytes": 0,
+            "compression_ratio": 0.0,
+        }
@@ -0,0 +1,80 @@
+"""
+Tests for the cache-backed FKAPI circuit breaker.
+"""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import patch
+
+from footycollect.api.circuit_breaker import CircuitBreaker
+
+FAILURE_THRESHOLD = 3
+
+
+class TestSharedCircuitBreaker:
+    def test_failures_accumulate_across_instances(self):
+        for _ in range(FAILURE_THRESHOLD):
+            CircuitBreaker(failure_threshold=FAILURE_THRESHOLD).record_failure()
+
+        other_worker = CircuitBreaker(failure_threshold=FAILURE_THRESHOLD)
+        assert other_worker.failure_count == FAILURE_THRESHOLD
+        assert other_worker.state == "open"
+        assert other_worker.allow_request() is False
+
+    def test_half_open_lets_single_probe_through(self):
+        breaker = CircuitBreaker(failure_threshold=1, timeout=60)
+        breaker.record_failure()
+        breaker.last_failure_time = datetime.now(UTC) - timedelta(seconds=61)
+
+        first_worker = CircuitBreaker(failure_threshold=1, timeout=60)
+        second_worker = CircuitBreaker(failure_threshold=1, timeout=60)
+        assert first_worker.allow_request() is True
+        assert second_worker.allow_request() is False
+
+    def test_failed_probe_reopens(self):
+        breaker = CircuitBreaker(failure_threshold=FAILURE_THRESHOLD, timeout=60)
+        breaker.state = "half_open"
+
+        assert breaker.allow_request() is True
+        breaker.record_failure()
+
+        assert breaker.state == "open"
+        assert breaker.allow_request() is False
+
+    def test_successful_probe_closes_for_everyone(self):
+        breaker = CircuitBreaker(failure_threshold=1, timeout=60)
+        breaker.record_failure()
+        breaker.state = "half_open"
+        assert breaker.allow_request() is True
+
+        breaker.record_success()
+
+        other_worker = CircuitBreaker(failure_threshold=1, timeout=60)
+        assert other_worker.state == "closed"
+        assert other_worker.failure_count == 0
+        assert other_worker.allow_request() is True
+        assert other_worker.allow_request() is True
+
+    def test_success_while_closed_writes_nothing(self):
+        breaker = CircuitBreaker(failure_threshold=FAILURE_THRESHOLD)
+
+        with patch("footycollect.api.circuit_breaker.cache.delete_many") as mock_delete:
+            breaker.record_success()
+        mock_delete.assert_not_called()
+
+        breaker.record_failure()
+        breaker.record_success()
+        assert breaker.failure_count == 0
+
+    def test_released_probe_lets_next_worker_probe(self):
+        breaker = CircuitBreaker(failure_threshold=1, timeout=60)
+        breaker.state = "half_open"
+        assert breaker.allow_request() is True
+
+        breaker.release_probe()
+
+        assert CircuitBreaker(failure_threshold=1, timeout=60).allow_request() is True
+
+    def test_breakers_with_different_keys_are_independent(self):
+        CircuitBreaker(failure_threshold=1, key="fkapi_circuit_breaker_test").record_failure()
+
+        assert CircuitBreaker(failure_threshold=1).state == "closed"
@@ -4,7 +4,7 @@ Tests for FKAPI client with real data.
 
 import json
 from datetime import UTC, datetime, timedelta
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 import requests
@@ -24,6 +24,7 @@ SECONDARY_COLORS_COUNT = 2
 SK_BRANN_SEARCH_RESULTS_COUNT = 3
 SK_BRANN_KIT_337301_ID = 337301
 INVALID_JSON_STRING_LENGTH = 12
+REPEATED_CALLS = 2
 
 
 @pytest.mark.django_db
@@ -40,7 +41,7 @@ class TestFKAPIClient:
         assert hasattr(client, "cache_timeout")
         assert hasattr(client, "headers")
 
-    @patch("footycollect.api.client.requests.get")
+    @patch("footycollect.api.client.requests.Session.get")
     def test_search_clubs_success(self, mock_get):
         """Test successful club search with real data."""
         from footycollect.api.client import FKAPIClient
@@ -81,7 +82,7 @@ class TestFKAPIClient:
         assert results[0]["name"] == "Hammarby"
         assert "logo" in results[0]
 
-    @patch("footycollect.api.client.requests.get")
+    @patch("footycollect.api.client.requests.Session.get")
     def test_get_club_seasons_success(self, mock_get):
         """Test successful club seasons retrieval with real data."""
         from footycollect.api.client import FKAPIClient
@@ -121,7 +122,7 @@ class TestFKAPIClient:
         assert results[1]["id"] == SEASON_41_ID
         assert results[1]["year"] == "2024"
 
-    @patch("footycollect.api.client.requests.get")
+    @patch("footycollect.api.client.requests.Session.get")
     def test_get_club_kits_success(self, mock_get):
         """Test successful club kits retrieval with real data."""
         from footycollect.api.client import FKAPIClient
@@ -140,7 +141,7 @@ class TestFKAPIClient:
         assert isinstance(results, list)
         assert len(results) == 0
 
-    @patch("footycollect.api.client.requests.get")
+    @patch("footycollect.api.client.requests.Session.get")
     def test_get_kit_details_success(self, mock_get):
         """Test successful kit details retrieval with real data."""
         from footycollect.api.client import FKAPIClient
@@ -219,7 +220,7 @@ class TestFKAPIClient:
         assert len(result["secondary_color"]) == SECONDARY_COLORS_COUNT
         assert result["main_img_url"] is not None
 
-    @patch("footycollect.api.client.requests.get")
+    @patch("footycollect.api.client.requests.Session.get")
     def test_search_kits_success(self, mock_get):
         """Test successful kit search with real data."""
         from footycollect.api.client import FKAPIClient
@@ -264,7 +265,7 @@ class TestFKAPIClient:
         assert results[0]["season_year"] == "2025"
         assert "main_img_url" in results[0]
 
-    @patch("footycollect.api.client.requests.get")
+    @patch("footycollect.api.client.requests.Session.get")
     def test_search_kits_empty_results(self, mock_get):
         """Test kit search with empty results."""
         from footycollect.api.client import FKAPIClient
@@ -282,7 +283,7 @@ class TestFKAPIClient:
         assert results is not None
         assert len(results) == 0
 
-    @patch("footycollect.api.client.requests.get")
+    @patch("footycollect.api.client.requests.Session.get")
     def test_search_kits_api_error(self, mock_get):
         """Test kit search with API error."""
         from footycollect.api.client import FKAPIClient
@@ -297,7 +298,7 @@ class TestFKAPIClient:
         assert len(results) == 0
 
     @patch("footycollect.api.client.cache")
-    @patch("footycollect.api.client.requests.get")
+    @patch("footycollect.api.client.requests.Session.get")
     def test_get_club_seasons_api_error(self, mock_get, mock_cache):
         """Test club seasons retrieval with API error."""
         from footycollect.api.client import FKAPIClient
@@ -313,7 +314,7 @@ class TestFKAPIClient:
         assert results == []
 
     @patch("footycollect.api.client.cache")
-    @patch("footycollect.api.client.requests.get")
+    @patch("footycollect.api.client.requests.Session.get")
     def test_get_club_kits_api_error(self, mock_get, mock_cache):
         """Test club kits retrieval with API error."""
         from footycollect.api.client import FKAPIClient
@@ -329,7 +330,7 @@ class TestFKAPIClient:
         assert results == []
 
     @patch("footycollect.api.client.cache")
-    @patch("footycollect.api.client.requests.get")
+    @patch("footycollect.api.client.requests.Session.get")
     def test_get_kit_details_api_error(self, mock_get, mock_cache):
         """Test kit details retrieval with API error."""
         from footycollect.api.client import FKAPIClient
@@ -345,7 +346,7 @@ class TestFKAPIClient:
         assert result is None
 
     @patch("footycollect.api.client.cache")
-    @patch("footycollect.api.client.requests.get")
+    @patch("footycollect.api.client.requests.Session.get")
     def test_search_clubs_api_error(self, mock_get, mock_cache):
         """Test club search with API error."""
         from footycollect.api.client import FKAPIClient
@@ -361,7 +362,7 @@ class TestFKAPIClient:
         assert results == []
 
     @patch("footycollect.api.client.cache")
-    @patch("footycollect.api.client.requests.get")
+    @patch("footycollect.api.client.requests.Session.get")
     def test_search_kits_with_empty_query(self, mock_get, mock_cache):
         """Test kit search with empty query."""
         from footycollect.api.client import FKAPIClient
@@ -381,7 +382,7 @@ class TestFKAPIClient:
         assert len(results) == 0
 
     @patch("footycollect.api.client.cache")
-    @patch("footycollect.api.client.requests.get")
+    @patch("footycollect.api.client.requests.Session.get")
     def test_search_kits_with_none_query(self, mock_get, mock_cache):
         """Test kit search with None query."""
         from footycollect.api.client import FKAPIClient
@@ -400,7 +401,7 @@ class TestFKAPIClient:
         assert results is not None
         assert len(results) == 0
 
-    @patch("footycollect.api.client.requests.get")
+    @patch("footycollect.api.client.requests.Session.get")
     def test_search_kits_list_response(self, mock_get):
         """Test kit search with list response format."""
         from footycollect.api.client import FKAPIClient
@@ -427,7 +428,7 @@ class TestFKAPIClient:
         assert len(results) == 1
         assert results[0]["name"] == "SK Brann 2025 Pre-Match"
 
-    @patch("footycollect.api.client.requests.get")
+    @patch("footycollect.api.client.requests.Session.get")
     def test_search_kits_dict_response(self, mock_get):
         """Test kit search with dict response format."""
         from footycollect.api.client import FKAPIClient
@@ -456,7 +457,7 @@ class TestFKAPIClient:
         assert len(results) == 1
         assert results[0]["name"] == "SK Brann 2025 Pre-Match"
 
-    @patch("footycollect.api.client.requests.get")
+    @patch("footycollect.api.client.requests.Session.get")
     def test_search_kits_invalid_response_format(self, mock_get):
         """Test kit search with invalid response format."""
         from footycollect.api.client import FKAPIClient
@@ -476,7 +477,7 @@ class TestFKAPIClient:
         # The client normalizes string responses to dict format, so we get the string length
         assert len(results) == INVALID_JSON_STRING_LENGTH  # "invalid json" has 12 characters
 
-    @patch("footycollect.api.client.requests.get")
+    @patch("footycollect.api.client.requests.Session.get")
     def test_cache_functionality(self, mock_get):
         """Test that caching works correctly."""
         from footycollect.api.client import FKAPIClient
@@ -509,7 +510,7 @@ class TestFKAPIClient:
         # But requests.get should only be called once due to caching
         assert mock_get.call_count == 1
 
-    @patch("footycollect.api.client.requests.post")
+    @patch("footycollect.api.client.requests.Session.post")
     def test_post_success_200_returns_normalized_data(self, mock_post):
         from footycollect.api.client import FKAPIClient
 
@@ -527,7 +528,7 @@ class TestFKAPIClient:
         assert result == {"foo": "bar"}
         mock_post.assert_called_once()
 
-    @patch("footycollect.api.client.requests.post")
+    @patch("footycollect.api.client.requests.Session.post")
     def test_post_timeout_calls_retry_logic_and_returns_none(self, mock_post):
         from footycollect.api.client import FKAPIClient
 
@@ -544,7 +545,7 @@ class TestFKAPIClient:
         assert result is None
         mock_handle_failed.assert_called_once()
 
-    @patch("footycollect.api.client.requests.post")
+    @patch("footycollect.api.client.requests.Session.post")
     def test_post_http_error_calls_handle_all_retries_failed(self, mock_post):
         from footycollect.api.client import FKAPIClient
 
@@ -566,7 +567,7 @@ class TestFKAPIClient:
         assert result is None
         mock_handle_failed.assert_called_once()
 
-    @patch("footycollect.api.client.requests.post")
+    @patch("footycollect.api.client.requests.Session.post")
     def test_post_json_decode_error_stops_retries_and_returns_none(self, mock_post):
         from footycollect.api.client import FKAPIClient
 
@@ -635,7 +636,7 @@ class TestFKAPIClientBranches:
     """Tests for FKAPIClient branches: circuit breaker, rate limit, stale cache, bulk, extract."""
 
     @patch("footycollect.api.client.cache")
-    @patch("footycollect.api.client.requests.get")
+    @patch("footycollect.api.client.requests.Session.get")
     def test_get_returns_stale_cache_when_circuit_breaker_open(self, mock_get, mock_cache):
         from footycollect.api.client import FKAPIClient
 
@@ -657,25 +658,35 @@ class TestFKAPIClientBranches:
         mock_get.assert_not_called()
 
     @patch("footycollect.api.client.cache")
-    @patch("footycollect.api.client.requests.get")
-    def test_get_returns_stale_cache_when_rate_limit_exceeded(self, mock_get, mock_cache):
+    @patch("footycollect.api.client.requests.Session.get")
+    def test_get_skips_request_when_rate_limit_exceeded(self, mock_get, mock_cache):
         from footycollect.api.client import FKAPIClient
 
-        def cache_get(key):
-            if key == "fkapi_rate_limit":
-                return 200
-            return {"results": []} if str(key).startswith("fkapi_") else None
-
-        mock_cache.get.side_effect = cache_get
+        mock_cache.get.return_value = None
+        mock_cache.add.return_value = True
         client = FKAPIClient()
 
-        result = client._get("/clubs/search", params={"keyword": "y"}, use_cache=True)
+        with patch.object(client.rate_limiter, "try_acquire", return_value=30.0):
+            result = client._get("/clubs/search", params={"keyword": "y"}, use_cache=True)
 
-        assert result == {"results": []}
+        assert result is None
         mock_get.assert_not_called()
 
+    def test_rate_limited_probe_gives_back_half_open_slot(self):
+        from footycollect.api.client import FKAPIClient
+
+        client = FKAPIClient()
+        client.circuit_breaker.key = "fkapi_circuit_breaker_probe_test"
+        client.circuit_breaker.state = "half_open"
+        ctx = client._create_request_context("/clubs/search", None, use_cache=True)
+
+        with patch.object(client.rate_limiter, "acquire", return_value=False):
+            assert client._check_availability(ctx) is False
+
+        assert client.circuit_breaker.allow_request() is True
+
     @patch("footycollect.api.client.cache")
-    @patch("footycollect.api.client.requests.get")
+    @patch("footycollect.api.client.requests.Session.get")
     def test_execute_request_timeout_returns_request_result(self, mock_get, mock_cache):
         from footycollect.api.client import FKAPIClient
 
@@ -689,7 +700,7 @@ class TestFKAPIClientBranches:
         assert result == []
 
     @patch("footycollect.api.client.cache")
-    @patch("footycollect.api.client.requests.get")
+    @patch("footycollect.api.client.requests.Session.get")
     def test_execute_request_json_decode_error_returns_empty(self, mock_get, mock_cache):
         from footycollect.api.client import FKAPIClient
 
@@ -707,7 +718,7 @@ class TestFKAPIClientBranches:
         assert result == []
 
     @patch("footycollect.api.client.cache")
-    @patch("footycollect.api.client.requests.get")
+    @patch("footycollect.api.client.requests.Session.get")
     def test_post_http_error_returns_none(self, mock_get, mock_cache):
         from footycollect.api.client import FKAPIClient
 
@@ -719,7 +730,7 @@ class TestFKAPIClientBranches:
         mock_response.json.return_value = {}
         mock_get.return_value = mock_response
 
-        with patch("footycollect.api.client.requests.post") as mock_post:
+        with patch("footycollect.api.client.requests.Session.post") as mock_post:
             mock_post.return_value = mock_response
             client = FKAPIClient()
             client.max_retries = 1
@@ -728,25 +739,33 @@ class TestFKAPIClientBranches:
                 assert result is None
                 mock_handle.assert_called_once()
 
-    def test_get_kits_bulk_too_few_slugs_returns_empty(self):
+    @patch("footycollect.api.client.FKAPIClient._get")
+    def test_get_kits_bulk_single_slug_uses_kit_endpoint(self, mock_get):
         from footycollect.api.client import FKAPIClient
 
+        mock_get.return_value = {"name": "One", "slug": "bulk-one"}
         client = FKAPIClient()
-        result = client.get_kits_bulk(["one"])
-        assert result == []
+        result = client.get_kits_bulk(["bulk-one"])
 
-    @patch("footycollect.api.client.FKAPIClient._get")
-    def test_get_kits_bulk_truncates_when_more_than_max(self, mock_get):
+        mock_get.assert_called_once_with("/kits/bulk-one")
+        assert result == [{"name": "One", "slug": "bulk-one"}]
+
+    def test_get_kits_bulk_splits_large_requests_into_chunks(self):
+        from unittest.mock import AsyncMock
+
+        from footycollect.api.async_client import AsyncFKAPIClient
         from footycollect.api.client import FKAPIClient
 
-        mock_get.return_value = {"results": []}
-        client = FKAPIClient()
-        slugs = [f"slug-{i}" for i in range(MAX_BULK_SLUGS + 5)]
-        client.get_kits_bulk(slugs)
-        call_args = mock_get.call_args
-        assert call_args[0][0] == "/kits/bulk"
-        param_slugs = call_args[1]["params"]["slugs"].split(",")
-        assert len(param_slugs) == MAX_BULK_SLUGS
+        async def bulk_response(endpoint, params=None, **kwargs):
+            return {"results": [{"slug": slug} for slug in params["slugs"].split(",")]}
+
+        slugs = [f"bulk-chunk-{i}" for i in range(MAX_BULK_SLUGS + 5)]
+        with patch.object(AsyncFKAPIClient, "_aget", AsyncMock(side_effect=bulk_response)) as mock_aget:
+            result = FKAPIClient().get_kits_bulk(slugs)
+
+        chunk_sizes = sorted(len(call.kwargs["params"]["slugs"].split(",")) for call in mock_aget.call_args_list)
+        assert chunk_sizes == [5, MAX_BULK_SLUGS]
+        assert [kit["slug"] for kit in result] == slugs
 
     def test_extract_list_from_result_unexpected_type_returns_empty(self):
         from footycollect.api.client import FKAPIClient
@@ -754,3 +773,349 @@ class TestFKAPIClientBranches:
         client = FKAPIClient()
         result = client._extract_list_from_result("not-dict-or-list")
         assert result == []
+
+
+@pytest.mark.django_db
+class TestSingleFlight:
+    """Tests for coalescing identical FKAPI cache misses."""
+
+    def _response(self, payload):
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = payload
+        return mock_response
+
+    @patch("footycollect.api.client.requests.Session.get")
+    def test_follower_waits_for_leader_result(self, mock_get):
+        import threading
+
+        from django.core.cache import cache
+
+        from footycollect.api.client import FKAPIClient
+
+        client = FKAPIClient()
+        ctx = client._create_request_context("/clubs/search", {"keyword": "sf-wait"}, use_cache=True)
+        cache.add(ctx.lock_key, "leader-token", 10)
+
+        def leader_finishes():
+            cache.set(ctx.cache_key, {"results": [{"id": 1}]}, 60)
+            cache.delete(ctx.lock_key)
+
+        timer = threading.Timer(0.1, leader_finishes)
+        timer.start()
+        try:
+            results = client.search_clubs("sf-wait")
+        finally:
+            timer.join()
+
+        assert results == [{"id": 1}]
+        mock_get.assert_not_called()
+
+    @patch("footycollect.api.client.requests.Session.get")
+    def test_follower_fetches_when_leader_gives_up(self, mock_get):
+        from django.core.cache import cache
+
+        from footycollect.api.client import FKAPIClient
+
+        mock_get.return_value = self._response([{"id": 2}])
+        client = FKAPIClient()
+        client.single_flight_wait_timeout = 0.2
+        ctx = client._create_request_context("/clubs/search", {"keyword": "sf-timeout"}, use_cache=True)
+        cache.add(ctx.lock_key, "stuck-token", 10)
+
+        results = client.search_clubs("sf-timeout")
+
+        assert results == [{"id": 2}]
+        mock_get.assert_called_once()
+        # the follower must not release a lock it does not own
+        assert cache.get(ctx.lock_key) == "stuck-token"
+
+    @patch("footycollect.api.client.requests.Session.get")
+    def test_leader_releases_lock_after_fetch(self, mock_get):
+        from django.core.cache import cache
+
+        from footycollect.api.client import FKAPIClient
+
+        mock_get.return_value = self._response([{"id": 3}])
+        client = FKAPIClient()
+        ctx = client._create_request_context("/clubs/search", {"keyword": "sf-release"}, use_cache=True)
+
+        client.search_clubs("sf-release")
+
+        assert cache.get(ctx.lock_key) is None
+        assert client._get_stale_cache(ctx) == {"results": [{"id": 3}]}
+
+    def test_uncached_requests_do_not_take_lock(self):
+        from footycollect.api.client import FKAPIClient
+
+        client = FKAPIClient()
+        ctx = client._create_request_context("/user-collection/1", None, use_cache=False)
+
+        assert client._acquire_fetch_lock(ctx) is None
+        assert client._wait_for_inflight(ctx) == (False, None)
+
+
+@pytest.mark.django_db
+class TestStaleWhileRevalidate:
+    """Tests for the soft/hard TTL cache tier."""
+
+    def _response(self, payload):
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = payload
+        return mock_response
+
+    def test_cache_response_uses_policy_ttls(self):
+        from footycollect.api import cache_serializer
+        from footycollect.api.client import FKAPIClient
+
+        client = FKAPIClient()
+        ctx = client._create_request_context("/kits/123", None, use_cache=True)
+
+        with patch("footycollect.api.client.cache") as mock_cache:
+            client._cache_response(ctx, {"name": "Kit"})
+
+        key, value, timeout = mock_cache.set.call_args[0]
+        assert key == ctx.cache_key
+        assert cache_serializer.decode(value)["data"] == {"name": "Kit"}
+        assert timeout == ctx.policy.hard_ttl
+
+    @patch("footycollect.api.client.requests.Session.get")
+    def test_stale_entry_is_served_and_refreshed(self, mock_get):
+        from django.core.cache import cache
+
+        from footycollect.api.client import CACHE_ENTRY_MARKER, FKAPIClient
+
+        mock_get.return_value = self._response([{"id": 2, "name": "Fresh"}])
+        client = FKAPIClient()
+        ctx = client._create_request_context("/clubs/search", {"keyword": "swr-stale"}, use_cache=True)
+        stale_entry = {CACHE_ENTRY_MARKER: 1, "data": {"results": [{"id": 1}]}, "fresh_until": 0}
+        cache.set(ctx.cache_key, stale_entry, 60)
+
+        with patch("footycollect.api.tasks.refresh_fkapi_cache_task.delay") as mock_delay:
+            results = client.search_clubs("swr-stale")
+            client.search_clubs("swr-stale")
+
+        assert results == [{"id": 1}]
+        mock_get.assert_not_called()
+        mock_delay.assert_called_once_with("/clubs/search", {"keyword": "swr-stale"})
+
+    @patch("footycollect.api.client.requests.Session.get")
+    def test_refresh_cache_overwrites_entry(self, mock_get):
+        from django.core.cache import cache
+
+        from footycollect.api.client import CACHE_ENTRY_MARKER, FKAPIClient
+
+        mock_get.return_value = self._response([{"id": 2}])
+        client = FKAPIClient()
+        ctx = client._create_request_context("/clubs/search", {"keyword": "swr-refresh"}, use_cache=True)
+        cache.set(ctx.cache_key, {CACHE_ENTRY_MARKER: 1, "data": {"results": [{"id": 1}]}, "fresh_until": 0}, 60)
+        cache.add(ctx.refresh_key, 1, 60)
+
+        client.refresh_cache("/clubs/search", {"keyword": "swr-refresh"})
+
+        assert client._try_cache(ctx) == (True, {"results": [{"id": 2}]})
+        assert cache.get(ctx.refresh_key) is None
+
+    def test_legacy_raw_entries_are_fresh(self):
+        from footycollect.api.client import unwrap_cache_entry
+
+        assert unwrap_cache_entry({"results": [1]}) == ({"results": [1]}, True)
+        assert unwrap_cache_entry(None) == (None, True)
+
+
+@pytest.mark.django_db
+class TestNegativeCaching:
+    """Tests for caching empty results and 404s."""
+
+    def _response(self, payload, status_code=200):
+        mock_response = Mock()
+        mock_response.status_code = status_code
+        mock_response.json.return_value = payload
+        return mock_response
+
+    @patch("footycollect.api.client.requests.Session.get")
+    def test_empty_search_is_cached_with_short_ttl(self, mock_get):
+        from django.core.cache import cache
+
+        from footycollect.api.client import FKAPIClient
+
+        mock_get.return_value = self._response([])
+        client = FKAPIClient()
+
+        with patch("footycollect.api.client.cache.set", wraps=cache.set) as mock_set:
+            assert client.search_clubs("neg-barcelnoa") == []
+        assert client.search_clubs("neg-barcelnoa") == []
+
+        mock_get.assert_called_once()
+        ctx = client._create_request_context("/clubs/search", {"keyword": "neg-barcelnoa"}, use_cache=True)
+        assert mock_set.call_args[0][2] == ctx.policy.empty_ttl
+
+    @patch("footycollect.api.client.requests.Session.get")
+    def test_not_found_is_cached_without_retry_or_breaker_failure(self, mock_get):
+        from footycollect.api.client import FKAPIClient
+
+        mock_get.return_value = self._response({"error": "not found"}, status_code=404)
+        client = FKAPIClient()
+
+        assert client.get_kit_details(999999) is None
+        assert client.get_kit_details(999999) is None
+
+        mock_get.assert_called_once()
+        assert client.circuit_breaker.failure_count == 0
+
+    @patch("footycollect.api.client.requests.Session.get")
+    def test_negative_caching_can_be_disabled(self, mock_get, settings):
+        from footycollect.api.client import FKAPIClient
+
+        settings.FKAPI_CACHE_POLICIES = {"/kits/": {"cache_not_found": False}}
+        mock_get.return_value = self._response({"error": "not found"}, status_code=404)
+        client = FKAPIClient()
+
+        client.get_kit_details(999998)
+        client.get_kit_details(999998)
+
+        assert mock_get.call_count == REPEATED_CALLS
+
+    def test_oversized_payload_is_not_cached(self, settings):
+        from footycollect.api.client import FKAPIClient
+
+        settings.FKAPI_CACHE_POLICIES = {"/kits/search": {"max_payload_bytes": 64}}
+        client = FKAPIClient()
+        ctx = client._create_request_context("/kits/search", {"keyword": "neg-big"}, use_cache=True)
+
+        client._cache_response(ctx, {"results": [{"name": "x" * 100}]})
+
+        assert client._try_cache(ctx) == (False, None)
+
+    def test_is_empty_response(self):
+        from footycollect.api.client import FKAPIClient
+
+        assert FKAPIClient._is_empty_response({})
+        assert FKAPIClient._is_empty_response({"results": []})
+        assert FKAPIClient._is_empty_response({"data": None})
+        assert not FKAPIClient._is_empty_response({"results": [{"id": 1}]})
+        assert not FKAPIClient._is_empty_response({"id": 1, "data": None})
+
+
+@pytest.mark.django_db
+class TestBulkKitCache:
+    """Tests for per-kit caching in get_kits_bulk."""
+
+    @patch("footycollect.api.client.FKAPIClient._get")
+    def test_overlapping_calls_only_fetch_missing_slugs(self, mock_get):
+        from footycollect.api.client import FKAPIClient
+
+        def bulk_response(endpoint, params=None, **kwargs):
+            return {"results": [{"slug": slug, "name": slug.upper()} for slug in params["slugs"].split(",")]}
+
+        mock_get.side_effect = bulk_response
+        client = FKAPIClient()
+        client.get_kits_bulk(["cache-a", "cache-b"])
+        result = client.get_kits_bulk(["cache-b", "cache-a", "cache-c", "cache-d"])
+
+        assert mock_get.call_args_list[-1].kwargs["params"] == {"slugs": "cache-c,cache-d"}
+        assert [kit["slug"] for kit in result] == ["cache-b", "cache-a", "cache-c", "cache-d"]
+
+    @patch("footycollect.api.client.FKAPIClient._get")
+    def test_kits_without_slug_are_matched_by_url_or_id(self, mock_get):
+        from footycollect.api.client import FKAPIClient
+
+        mock_get.return_value = {
+            "results": [
+                {"name": "Second", "url": "https://www.footballkitarchive.com/pos-b/"},
+                {"name": "First", "id": "pos-a"},
+            ]
+        }
+        client = FKAPIClient()
+        client.get_kits_bulk(["pos-a", "pos-b"])
+        result = client.get_kits_bulk(["pos-b", "pos-a"])
+
+        assert mock_get.call_count == 1
+        assert [kit["name"] for kit in result] == ["Second", "First"]
+
+    @patch("footycollect.api.client.FKAPIClient._get")
+    def test_kits_without_identifier_are_not_matched_by_position(self, mock_get):
+        from footycollect.api.client import FKAPIClient
+
+        mock_get.return_value = {"results": [{"name": "First"}, {"name": "Second"}]}
+        client = FKAPIClient()
+
+        assert client.get_kits_bulk(["pos-a", "pos-b"]) == [{"name": "First"}, {"name": "Second"}]
+        client.get_kits_bulk(["pos-b"])
+        assert mock_get.call_count == REPEATED_CALLS
+
+    @patch("footycollect.api.client.FKAPIClient._get")
+    def test_unmatched_kits_are_returned_but_not_cached(self, mock_get):
+        from footycollect.api.client import FKAPIClient
+
+        mock_get.return_value = {"results": [{"name": "Only one"}]}
+        client = FKAPIClient()
+
+        assert client.get_kits_bulk(["gap-a", "gap-b"]) == [{"name": "Only one"}]
+        client.get_kits_bulk(["gap-a", "gap-b"])
+        assert mock_get.call_count == REPEATED_CALLS
+
+
+@pytest.mark.django_db
+class TestKitDetailsBatch:
+    """Tests for get_kits_details."""
+
+    @patch("footycollect.api.async_client.afetch_kit_details", new_callable=AsyncMock)
+    def test_cached_kits_skip_fetch_and_misses_are_fetched_once(self, mock_fetch):
+        from footycollect.api.client import FKAPIClient
+
+        mock_fetch.return_value = {2: {"id": 2}, 3: None}
+        client = FKAPIClient()
+        ctx = client._create_request_context("/kits/1", None, use_cache=True)
+        client._cache_response(ctx, {"id": 1, "cached": True})
+
+        result = client.get_kits_details([2, 1, 3, 2])
+
+        assert list(result) == [2, 1]
+        assert result[1]["cached"] is True
+        mock_fetch.assert_called_once()
+        assert mock_fetch.call_args.args[0] == [2, 3]
+
+    @patch("footycollect.api.async_client.afetch_kit_details", new_callable=AsyncMock)
+    def test_cached_not_found_is_not_refetched(self, mock_fetch):
+        from footycollect.api.client import FKAPIClient
+
+        client = FKAPIClient()
+        client._cache_not_found(client._create_request_context("/kits/404", None, use_cache=True))
+
+        assert client.get_kits_details([404]) == {}
+        mock_fetch.assert_not_called()
+
+
+@pytest.mark.django_db
+class TestContentHashes:
+    """Tests for the content hash recorded by each _get call."""
+
+    @patch("footycollect.api.client.FKAPIClient._make_request_with_retries")
+    @patch("footycollect.api.client.FKAPIClient._check_availability", return_value=True)
+    def test_fetch_and_cache_hit_record_the_same_hash(self, mock_available, mock_request):
+        from footycollect.api.client import FKAPIClient, RequestResult
+
+        mock_request.return_value = RequestResult(success=True, data={"id": 1, "name": "Kit"})
+        client = FKAPIClient()
+        client._get("/kits/hash-test")
+        fetched_hash = client.last_content_hash
+        client._get("/kits/hash-test")
+
+        assert mock_request.call_count == 1
+        assert fetched_hash is not None
+        assert client.last_content_hash == fetched_hash
+
+    def test_legacy_entries_have_no_hash(self):
+        from django.core.cache import cache
+
+        from footycollect.api.client import FKAPIClient
+
+        client = FKAPIClient()
+        ctx = client._create_request_context("/kits/legacy-hash", None, use_cache=True)
+        cache.set(ctx.cache_key, {"id": 1}, 60)
+
+        client.last_content_hash = "stale"
+        assert client._get("/kits/legacy-hash") == {"id": 1}
+        assert client.last_content_hash is None
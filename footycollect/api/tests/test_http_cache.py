@@ -0,0 +1,75 @@
+"""
+Tests for HTTP caching of the FKAPI proxy views.
+"""
+
+import json
+from unittest.mock import patch
+
+from django.test import RequestFactory, override_settings
+
+from footycollect.api.http_cache import cached_json_response, get_http_cache_policy
+
+HTTP_OK = 200
+HTTP_NOT_MODIFIED = 304
+KIT_MAX_AGE = 3600
+
+
+class TestCachedJsonResponse:
+    def setup_method(self):
+        self.factory = RequestFactory()
+
+    def test_sets_etag_and_cache_control(self):
+        response = cached_json_response(self.factory.get("/"), "get_kit_details", {"id": 1}, "abc")
+
+        assert response.status_code == HTTP_OK
+        assert json.loads(response.content) == {"id": 1}
+        assert response["ETag"].startswith('"')
+        assert f"max-age={KIT_MAX_AGE}" in response["Cache-Control"]
+        assert "public" in response["Cache-Control"]
+        assert "stale-while-revalidate=86400" in response["Cache-Control"]
+
+    def test_matching_content_hash_returns_304_without_serializing(self):
+        etag = cached_json_response(self.factory.get("/"), "search_clubs", {"results": []}, "abc")["ETag"]
+
+        with patch("footycollect.api.http_cache.JsonResponse") as mock_json:
+            response = cached_json_response(
+                self.factory.get("/", HTTP_IF_NONE_MATCH=etag),
+                "search_clubs",
+                {"results": []},
+                "abc",
+            )
+
+        assert response.status_code == HTTP_NOT_MODIFIED
+        assert response["ETag"] == etag
+        assert "max-age" in response["Cache-Control"]
+        mock_json.assert_not_called()
+
+    def test_etag_depends_on_view_and_hashes(self):
+        request = self.factory.get("/")
+        etag = cached_json_response(request, "search_clubs", {}, "abc")["ETag"]
+
+        assert cached_json_response(request, "search_kits", {}, "abc")["ETag"] != etag
+        assert cached_json_response(request, "search_clubs", {}, "abd")["ETag"] != etag
+
+    def test_unknown_hash_falls_back_to_body(self):
+        request = self.factory.get("/")
+        first = cached_json_response(request, "search_brands", {"results": [1]}, None)
+        second = cached_json_response(request, "search_brands", {"results": [1]})
+        changed = cached_json_response(request, "search_brands", {"results": [2]})
+
+        assert first["ETag"] == second["ETag"] != changed["ETag"]
+        response = cached_json_response(
+            self.factory.get("/", HTTP_IF_NONE_MATCH=first["ETag"]),
+            "search_brands",
+            {"results": [1]},
+        )
+        assert response.status_code == HTTP_NOT_MODIFIED
+
+
+class TestHttpCachePolicy:
+    @override_settings(FKAPI_HTTP_CACHE_POLICIES={"search_kits": {"max_age": 60}})
+    def test_settings_override(self):
+        policy = get_http_cache_policy("search_kits")
+
+        assert policy.max_age == 60  # noqa: PLR2004
+        assert policy.stale_while_revalidate == get_http_cache_policy("search_clubs").stale_while_revalidate
@@ -0,0 +1,89 @@
+"""
+Tests for the FKAPI token-bucket rate limiter.
+"""
+
+from unittest.mock import Mock, patch
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.test import override_settings
+
+from footycollect.api.rate_limit import (
+    ENDPOINT_WEIGHTS,
+    TokenBucketRateLimiter,
+    get_endpoint_weight,
+)
+
+BURST = 3
+RATE_PER_MINUTE = 60
+BULK_WEIGHT = 4
+
+
+class TestTokenBucketRateLimiter:
+    def test_burst_then_deny_with_wait_time(self):
+        limiter = TokenBucketRateLimiter(key="test-burst", rate_per_minute=RATE_PER_MINUTE, burst=BURST)
+
+        assert all(limiter.try_acquire() == 0 for _ in range(BURST))
+        wait = limiter.try_acquire()
+        assert 0 < wait <= 1
+
+    def test_weighted_cost_consumes_more_tokens(self):
+        limiter = TokenBucketRateLimiter(key="test-weight", rate_per_minute=RATE_PER_MINUTE, burst=BURST)
+
+        assert limiter.try_acquire(BURST) == 0
+        assert limiter.try_acquire(1) > 0
+
+    def test_non_blocking_acquire_fails_fast(self):
+        limiter = TokenBucketRateLimiter(key="test-fast", rate_per_minute=1, burst=1)
+        assert limiter.acquire() is True
+
+        with patch("footycollect.api.rate_limit.time.sleep") as mock_sleep:
+            assert limiter.acquire(max_wait=0) is False
+        mock_sleep.assert_not_called()
+
+    def test_blocking_acquire_waits_for_refill(self):
+        limiter = TokenBucketRateLimiter(key="test-block", rate_per_minute=RATE_PER_MINUTE, burst=1)
+        assert limiter.acquire() is True
+
+        with (
+            patch.object(limiter, "try_acquire", side_effect=[0.5, 0.0]) as mock_try,
+            patch("footycollect.api.rate_limit.time.sleep") as mock_sleep,
+        ):
+            assert limiter.acquire(max_wait=5) is True
+        mock_sleep.assert_called_once_with(0.5)
+        assert mock_try.call_count == 2  # noqa: PLR2004
+
+    def test_async_acquire_waits_for_refill(self):
+        limiter = TokenBucketRateLimiter(key="test-async", rate_per_minute=6000, burst=1)
+
+        async def run():
+            assert await limiter.aacquire() is True
+            return await limiter.aacquire(max_wait=1)
+
+        assert async_to_sync(run)() is True
+
+    def test_redis_script_result_is_used(self):
+        limiter = TokenBucketRateLimiter(key="test-redis", rate_per_minute=RATE_PER_MINUTE, burst=BURST)
+        script = Mock(return_value=[0, "1.5"])
+
+        with patch("footycollect.api.rate_limit._get_redis_script", return_value=script):
+            assert limiter.try_acquire(2) == pytest.approx(1.5)
+
+        script.assert_called_once_with(keys=["test-redis"], args=[BURST, 1.0, 2])
+
+    def test_redis_errors_fail_open(self):
+        limiter = TokenBucketRateLimiter(key="test-redis-down")
+        script = Mock(side_effect=ConnectionError("redis down"))
+
+        with patch("footycollect.api.rate_limit._get_redis_script", return_value=script):
+            assert limiter.try_acquire() == 0
+
+
+class TestEndpointWeight:
+    def test_bulk_costs_more_than_search(self):
+        assert get_endpoint_weight("/kits/bulk") == ENDPOINT_WEIGHTS["/kits/bulk"]
+        assert get_endpoint_weight("/kits/search") == 1
+
+    @override_settings(FKAPI_RATE_LIMIT_WEIGHTS={"/kits/bulk": BULK_WEIGHT})
+    def test_weights_can_be_overridden(self):
+        assert get_endpoint_weight("/kits/bulk") == BULK_WEIGHT
@@ -0,0 +1,107 @@
+"""
+Tests for the local FKAPI stand-in server.
+"""
+
+from http import HTTPStatus
+
+import pytest
+import requests
+from django.core.management import CommandError, call_command
+
+from footycollect.api.client import FKAPIClient
+from footycollect.api.stub_server import FKAPIFixtures, FKAPIStubServer, StubBehavior
+
+HAMMARBY_CLUB_ID = 893
+SANFRECCE_KIT_ID = 171008
+BRANN_SEASONS_COUNT = 16
+STUB_USERID = 12345
+STUB_ENTRIES_COUNT = 2
+
+
+@pytest.fixture
+def stub_server(settings):
+    with FKAPIStubServer() as server:
+        settings.FKA_API_IP = server.address
+        yield server
+
+
+class TestFKAPIFixtures:
+    def test_kit_lookup_by_id_and_slug(self):
+        fixtures = FKAPIFixtures.from_file()
+        by_id = fixtures.kit(str(SANFRECCE_KIT_ID))
+        assert by_id is not None
+        assert fixtures.kit(by_id["slug"]) is by_id
+        assert fixtures.kit("missing-kit") is None
+
+    def test_user_collection_is_paginated(self):
+        fixtures = FKAPIFixtures.from_file()
+        page = fixtures.user_collection(str(STUB_USERID), page=2, page_size=1)
+        assert len(page["data"]["entries"]) == 1
+        assert page["pagination"]["total_pages"] == STUB_ENTRIES_COUNT
+
+
+@pytest.mark.django_db
+class TestFKAPIStubServer:
+    def test_client_reads_recorded_endpoints(self, stub_server):
+        client = FKAPIClient()
+
+        clubs = client.search_clubs("hammarby")
+        seasons = client.get_club_seasons(2089)
+        kit = client.get_kit_details(SANFRECCE_KIT_ID)
+
+        assert clubs[0]["id"] == HAMMARBY_CLUB_ID
+        assert len(seasons) == BRANN_SEASONS_COUNT
+        assert kit["brand"]["name"] == "Mizuno"
+
+    def test_unknown_kit_is_404(self, stub_server):
+        client = FKAPIClient()
+
+        assert client.get_kit_details(1) is None
+        assert stub_server.status_counts[HTTPStatus.NOT_FOUND] == 1
+        assert client.circuit_breaker.failure_count == 0
+
+    def test_kits_bulk_returns_kits_in_request_order(self, stub_server):
+        client = FKAPIClient()
+
+        kits = client.get_kits_bulk(["sk-brann-2024-away-kit", "unknown-kit", "sanfrecce-hiroshima-2005-home-kit"])
+
+        assert [kit["name"] for kit in kits] == ["SK Brann 2024 Away", "Sanfrecce Hiroshima 2005 Home"]
+
+    def test_error_rate_trips_client_failure_handling(self, settings):
+        with FKAPIStubServer(behavior=StubBehavior(error_rate=1.0, seed=1)) as server:
+            settings.FKA_API_IP = server.address
+            client = FKAPIClient()
+            client.max_retries = 1
+
+            assert client.search_kits("brann-error") == []
+
+        assert server.status_counts[HTTPStatus.SERVICE_UNAVAILABLE] == 1
+        assert client.circuit_breaker.failure_count == 1
+
+    def test_rate_limit_answers_429_with_retry_after(self):
+        with FKAPIStubServer(behavior=StubBehavior(rate_limit_per_minute=1)) as server:
+            url = f"http://{server.address}/api/clubs/search"
+            first = requests.get(url, params={"keyword": "hammarby"}, timeout=5)
+            second = requests.get(url, params={"keyword": "hammarby"}, timeout=5)
+
+        assert first.status_code == HTTPStatus.OK
+        assert second.status_code == HTTPStatus.TOO_MANY_REQUESTS
+        assert int(second.headers["Retry-After"]) > 0
+
+    def test_scrape_returns_cached_collection(self, stub_server):
+        client = FKAPIClient()
+
+        response = client.post_scrape_user_collection(STUB_USERID)
+
+        assert response["status"] == "cached"
+        assert len(response["data"]["entries"]) == STUB_ENTRIES_COUNT
+
+
+class TestRunFKAPIStubCommand:
+    def test_rejects_invalid_error_rate(self):
+        with pytest.raises(CommandError, match="error-rate"):
+            call_command("run_fkapi_stub", "--error-rate", "2")
+
+    def test_rejects_missing_fixtures(self, tmp_path):
+        with pytest.raises(CommandError, match="Could not load fixtures"):
+            call_command("run_fkapi_stub", "--fixtures", str(tmp_path / "missing.json"))
@@ -4,7 +4,7 @@ from unittest.mock import patch
 
 import pytest
 
-from footycollect.api.tasks import scrape_user_collection_task
+from footycollect.api.tasks import refresh_fkapi_cache_task, scrape_user_collection_task
 
 
 @pytest.mark.django_db
@@ -32,3 +32,11 @@ class TestScrapeUserCollectionTask:
             with pytest.raises(RuntimeError, match="API down"):
                 scrape_user_collection_task(1)
         mock_client.post_scrape_user_collection.assert_called_once_with(1)
+
+
+@pytest.mark.django_db
+class TestRefreshFKAPICacheTask:
+    def test_refreshes_endpoint_through_client(self):
+        with patch("footycollect.api.tasks.FKAPIClient") as mock_client_cls:
+            refresh_fkapi_cache_task("/clubs/search", {"keyword": "x"})
+        mock_client_cls.return_value.refresh_cache.assert_called_once_with("/clubs/search", {"keyword": "x"})
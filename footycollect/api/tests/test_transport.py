@@ -0,0 +1,57 @@
+"""
+Tests for the shared FKAPI HTTP transport.
+"""
+
+from unittest.mock import Mock, patch
+
+import pytest
+from django.test import override_settings
+
+from footycollect.api.transport import close_http_session, get_http_session
+
+POOL_MAXSIZE = 7
+
+
+@pytest.fixture(autouse=True)
+def _fresh_session():
+    close_http_session()
+    yield
+    close_http_session()
+
+
+class TestHTTPTransport:
+    def test_session_is_shared_between_calls(self):
+        assert get_http_session() is get_http_session()
+
+    @override_settings(FKAPI_HTTP_POOL_MAXSIZE=POOL_MAXSIZE, FKAPI_HTTP_POOL_BLOCK=True)
+    def test_adapter_uses_configured_pool(self):
+        adapter = get_http_session().get_adapter("http://fkapi.example/api/kits/1")
+
+        assert adapter._pool_maxsize == POOL_MAXSIZE
+        assert adapter._pool_block is True
+        assert adapter.max_retries.total == 0
+
+    def test_session_rebuilt_after_fork(self):
+        session = get_http_session()
+        with patch("footycollect.api.transport.os.getpid", return_value=-1):
+            assert get_http_session() is not session
+
+    def test_close_drops_session(self):
+        session = get_http_session()
+        close_http_session()
+        assert get_http_session() is not session
+
+    @pytest.mark.django_db
+    def test_clients_reuse_the_same_session(self):
+        from footycollect.api.client import FKAPIClient
+
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = []
+
+        with patch("requests.Session.get", autospec=True, return_value=mock_response) as mock_get:
+            FKAPIClient().search_clubs("transport-a")
+            FKAPIClient().search_clubs("transport-b")
+
+        used_sessions = {call.args[0] for call in mock_get.call_args_list}
+        assert used_sessions == {get_http_session()}
@@ -6,14 +6,17 @@ import json
 from unittest.mock import Mock, patch
 
 import pytest
+from django.core.cache import cache
 from django.test import RequestFactory
 from django.urls import reverse
 
+from footycollect.api.async_client import SeasonSources
 from footycollect.api.views import (
     get_club_kits,
     get_club_seasons,
     get_filter_options,
     get_kit_details,
+    get_kits_details,
     search_brands,
     search_clubs,
     search_competitions,
@@ -23,6 +26,7 @@ from footycollect.api.views import (
 
 # HTTP status codes
 HTTP_OK = 200
+HTTP_NOT_MODIFIED = 304
 HTTP_BAD_REQUEST = 400
 HTTP_INTERNAL_SERVER_ERROR = 500
 HTTP_SERVICE_UNAVAILABLE = 503
@@ -189,6 +193,38 @@ class TestAPIViews:
             assert "error" in data
             assert "temporarily unavailable" in data["error"]
 
+    def test_get_kits_details_success(self):
+        """Test batch kit details with ETag revalidation."""
+        with patch("footycollect.api.views.FKAPIClient") as mock_client_class:
+            mock_client = Mock()
+            mock_client_class.return_value = mock_client
+            mock_client.get_kits_details.return_value = {HAMMARBY_KIT_ID: {"id": HAMMARBY_KIT_ID}}
+
+            request = self.factory.get("/api/kits/details/", {"ids": f"{HAMMARBY_KIT_ID},999999,{HAMMARBY_KIT_ID}"})
+            response = get_kits_details(request)
+
+            assert response.status_code == HTTP_OK
+            mock_client.get_kits_details.assert_called_once_with([HAMMARBY_KIT_ID, 999999])
+            data = json.loads(response.content)
+            assert data["results"] == {str(HAMMARBY_KIT_ID): {"id": HAMMARBY_KIT_ID}}
+            assert data["missing"] == [999999]
+
+            request = self.factory.get(
+                "/api/kits/details/",
+                {"ids": f"{HAMMARBY_KIT_ID},999999"},
+                HTTP_IF_NONE_MATCH=response["ETag"],
+            )
+            assert get_kits_details(request).status_code == HTTP_NOT_MODIFIED
+
+    @pytest.mark.parametrize("ids", ["", "1,abc", ",".join(str(i) for i in range(51))])
+    def test_get_kits_details_invalid_ids(self, ids):
+        """Test batch kit details rejects missing, malformed and oversized id lists."""
+        with patch("footycollect.api.views.FKAPIClient") as mock_client_class:
+            response = get_kits_details(self.factory.get("/api/kits/details/", {"ids": ids}))
+
+            assert response.status_code == HTTP_BAD_REQUEST
+            mock_client_class.assert_not_called()
+
     def test_search_kits_success(self):
         """Test successful kit search."""
         with patch("footycollect.api.views.FKAPIClient") as mock_client_class:
@@ -410,16 +446,17 @@ class TestAPIViews:
 
     def test_search_seasons_success(self):
         """Test successful seasons search."""
-        with patch("footycollect.api.views.FKAPIClient") as mock_client_class:
-            mock_client = Mock()
-            mock_client_class.return_value = mock_client
-            # search_kits returns kits with season info
-            mock_client.search_kits.return_value = [
-                {"season": {"year": "2023-24", "id": 1}},
-                {"season": {"year": "2022-23", "id": 2}},
-            ]
-            # search_clubs returns clubs; we'll keep club seasons empty for simplicity
-            mock_client.search_clubs.return_value = []
+        cache.clear()
+        with patch("footycollect.api.async_client.fetch_season_sources") as mock_fetch:
+            # kit search returns kits with season info; no club seasons for simplicity
+            mock_fetch.return_value = SeasonSources(
+                [
+                    {"season": {"year": "2023-24", "id": 1}},
+                    {"season": {"year": "2022-23", "id": 2}},
+                ],
+                [],
+                complete=True,
+            )
 
             request = self.factory.get("/api/seasons/search/?keyword=2023")
             response = search_seasons(request)
@@ -556,6 +593,11 @@ class TestAPIURLs:
         url = reverse("footycollect_api:kit_details", kwargs={"kit_id": 171008})
         assert url == "/fkapi/kit/171008/"
 
+    def test_kits_details_url(self):
+        """Test batch kit details URL pattern."""
+        url = reverse("footycollect_api:kits_details")
+        assert url == "/fkapi/kits/details/"
+
     def test_search_kits_url(self):
         """Test search kits URL pattern."""
         url = reverse("footycollect_api:search_kits")
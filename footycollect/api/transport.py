@@ -0,0 +1,82 @@
+"""
+Shared HTTP transport for FKAPI requests.
+
+A single ``requests.Session`` is kept per process so that every
+``FKAPIClient`` instance reuses pooled keep-alive connections instead of
+opening a new TCP/TLS connection for each call.
+"""
+
+import logging
+import os
+import threading
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 20
+
+_session: requests.Session | None = None
+_session_pid: int | None = None
+_session_lock = threading.Lock()
+
+
+def _build_session() -> requests.Session:
+    """Build a session with a sized connection pool mounted for http and https."""
+    pool_connections = getattr(settings, "FKAPI_HTTP_POOL_CONNECTIONS", DEFAULT_POOL_CONNECTIONS)
+    pool_maxsize = getattr(settings, "FKAPI_HTTP_POOL_MAXSIZE", DEFAULT_POOL_MAXSIZE)
+    pool_block = getattr(settings, "FKAPI_HTTP_POOL_BLOCK", False)
+
+    # Retries are handled by FKAPIClient (with backoff and circuit breaker),
+    # so the adapter itself must not retry.
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        pool_block=pool_block,
+        max_retries=0,
+    )
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers["Connection"] = "keep-alive"
+    logger.debug(
+        "Created FKAPI HTTP session (pool_connections=%d, pool_maxsize=%d, pool_block=%s)",
+        pool_connections,
+        pool_maxsize,
+        pool_block,
+    )
+    return session
+
+
+def get_http_session() -> requests.Session:
+    """
+    Return the process-wide FKAPI session, creating it on first use.
+
+    The session is rebuilt after a fork so that gunicorn and Celery workers
+    never share sockets inherited from the parent process.
+    """
+    global _session, _session_pid  # noqa: PLW0603
+
+    pid = os.getpid()
+    if _session is not None and _session_pid == pid:
+        return _session
+
+    with _session_lock:
+        if _session is None or _session_pid != pid:
+            _session = _build_session()
+            _session_pid = pid
+    return _session
+
+
+def close_http_session() -> None:
+    """Close the shared session and drop pooled connections."""
+    global _session, _session_pid  # noqa: PLW0603
+
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+        _session = None
+        _session_pid = None
@@ -8,6 +8,7 @@ from django.views.decorators.http import require_GET
 from django_ratelimit.decorators import ratelimit
 
 from .client import FKAPIClient
+from .http_cache import cached_json_response
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +16,8 @@ HTTP_TOO_MANY_REQUESTS = 429
 
 
 FKAPI_RATE_LIMIT = "100/h"
+SEASON_SEARCH_CLUB_LIMIT = 3
+MAX_KIT_DETAILS_BATCH = 50
 
 
 def _rate_limited_response(request):
@@ -43,7 +46,7 @@ def search_clubs(request):
     query = request.GET.get("keyword", "")
     client = FKAPIClient()
     results = client.search_clubs(query)
-    return JsonResponse({"results": results})
+    return cached_json_response(request, "search_clubs", {"results": results}, client.last_content_hash)
 
 
 @ratelimit(key="ip", rate="100/h", method="GET")
@@ -58,7 +61,39 @@ def get_kit_details(request, kit_id):
             {"error": "Kit data temporarily unavailable"},
             status=503,
         )
-    return JsonResponse(kit_data)
+    return cached_json_response(request, "get_kit_details", kit_data, client.last_content_hash)
+
+
+@ratelimit(key="ip", rate="100/h", method="GET")
+@require_GET
+def get_kits_details(request):
+    """
+    Return details for several kits at once: ``?ids=1,2,3``.
+
+    Responds with ``{"results": {"<id>": kit}, "missing": [ids]}`` and an
+    ETag over the body, so unchanged batches revalidate with a 304.
+    """
+    if getattr(request, "limited", False):
+        return _rate_limited_response(request)
+    try:
+        kit_ids = [int(kit_id) for kit_id in request.GET.get("ids", "").split(",") if kit_id.strip()]
+    except ValueError:
+        return JsonResponse({"error": "ids must be a comma-separated list of integers"}, status=400)
+    kit_ids = list(dict.fromkeys(kit_ids))
+    if not kit_ids:
+        return JsonResponse({"error": "ids is required"}, status=400)
+    if len(kit_ids) > MAX_KIT_DETAILS_BATCH:
+        return JsonResponse(
+            {"error": f"At most {MAX_KIT_DETAILS_BATCH} kit ids per request"},
+            status=400,
+        )
+
+    kits = FKAPIClient().get_kits_details(kit_ids)
+    data = {
+        "results": {str(kit_id): kit for kit_id, kit in kits.items()},
+        "missing": [kit_id for kit_id in kit_ids if kit_id not in kits],
+    }
+    return cached_json_response(request, "get_kits_details", data)
 
 
 @ratelimit(key="ip", rate="100/h", method="GET")
@@ -76,7 +111,7 @@ def search_kits(request):
 
     client = FKAPIClient()
     results = client.search_kits(query)
-    return JsonResponse({"results": results})
+    return cached_json_response(request, "search_kits", {"results": results}, client.last_content_hash)
 
 
 @ratelimit(key="ip", rate="100/h", method="GET")
@@ -89,7 +124,7 @@ def get_club_seasons(request, club_id):
         return _rate_limited_response(request)
     client = FKAPIClient()
     results = client.get_club_seasons(club_id)
-    return JsonResponse({"results": results})
+    return cached_json_response(request, "get_club_seasons", {"results": results}, client.last_content_hash)
 
 
 @ratelimit(key="ip", rate="100/h", method="GET")
@@ -102,7 +137,7 @@ def get_club_kits(request, club_id, season_id):
         return _rate_limited_response(request)
     client = FKAPIClient()
     results = client.get_club_kits(club_id, season_id)
-    return JsonResponse({"results": results})
+    return cached_json_response(request, "get_club_kits", {"results": results}, client.last_content_hash)
 
 
 @ratelimit(key="ip", rate="100/h", method="GET")
@@ -118,7 +153,7 @@ def search_brands(request):
 
     client = FKAPIClient()
     results = client.search_brands(query)
-    return JsonResponse({"results": results})
+    return cached_json_response(request, "search_brands", {"results": results}, client.last_content_hash)
 
 
 @ratelimit(key="ip", rate="100/h", method="GET")
@@ -134,7 +169,7 @@ def search_competitions(request):
 
     client = FKAPIClient()
     results = client.search_competitions(query)
-    return JsonResponse({"results": results})
+    return cached_json_response(request, "search_competitions", {"results": results}, client.last_content_hash)
 
 
 @ratelimit(key="ip", rate="100/h", method="GET")
@@ -148,67 +183,13 @@ def search_seasons(request):
     if len(query) < min_query_length:
         return JsonResponse({"results": []})
 
-    client = FKAPIClient()
-    seasons_dict = _build_seasons_from_kits(client, query)
-    seasons_dict = _enrich_seasons_with_club_data(client, query, seasons_dict)
-    results = list(seasons_dict.values())
-    return JsonResponse({"results": results})
+    from footycollect.core.season_resolution import resolve_seasons
 
-
-def _build_seasons_from_kits(client: FKAPIClient, query: str) -> dict:
-    """Build initial seasons dict from kit search results."""
-    api_kits = client.search_kits(query)
-
-    seasons_dict: dict[str, dict] = {}
-    for kit in api_kits:
-        season_data = kit.get("season") if isinstance(kit, dict) else None
-        if not season_data:
-            continue
-
-        if isinstance(season_data, dict):
-            season_year = season_data.get("year")
-            season_id = season_data.get("id")
-        else:
-            season_year = str(season_data)
-            season_id = None
-
-        if season_year and season_year not in seasons_dict:
-            seasons_dict[season_year] = _build_season_entry(season_year, season_id)
-
-    return seasons_dict
-
-
-def _enrich_seasons_with_club_data(
-    client: FKAPIClient,
-    query: str,
-    seasons_dict: dict,
-) -> dict:
-    """Enrich seasons dict with data from club seasons."""
-    api_clubs = client.search_clubs(query)
-    for club in api_clubs[:3]:
-        if not isinstance(club, dict) or not club.get("id"):
-            continue
-
-        club_seasons = client.get_club_seasons(club.get("id"))
-        for season_data in club_seasons:
-            if not isinstance(season_data, dict):
-                continue
-
-            season_year = season_data.get("year")
-            season_id = season_data.get("id")
-            if season_year and season_year not in seasons_dict:
-                seasons_dict[season_year] = _build_season_entry(season_year, season_id)
-
-    return seasons_dict
-
-
-def _build_season_entry(season_year: str, season_id: int | None) -> dict:
-    """Create a normalized season entry dict."""
-    return {
-        "id": season_id,
-        "name": season_year,
-        "logo": None,
-    }
+    results = [
+        {"id": season["id_fka"], "name": season["year"], "logo": None}
+        for season in resolve_seasons(query, SEASON_SEARCH_CLUB_LIMIT)
+    ]
+    return cached_json_response(request, "search_seasons", {"results": results})
 
 
 @ratelimit(key="ip", rate="100/h", method="GET")
@@ -217,8 +198,9 @@ def get_filter_options(request):
     """
     Get available filter options with item counts.
 
-    Returns filter options (brands, clubs, competitions, etc.) with counts
-    of how many items match each option, optionally filtered by other active filters.
+    Returns filter options (brands, clubs, competitions, kit types, seasons,
+    main colors) with counts of how many items match each option, given the
+    other active feed filters. Counts come from FeedFacetService.
     """
     if getattr(request, "limited", False):
         return _rate_limited_response(request)
@@ -227,78 +209,12 @@ def get_filter_options(request):
     if not filter_type:
         return JsonResponse({"error": "filter_type parameter is required"}, status=400)
 
-    from django.db.models import Count, Q
-
-    from footycollect.collection.models import Jersey
-    from footycollect.core.models import Brand, Club, Competition, TypeK
-
-    base_queryset = Jersey.objects.filter(base_item__is_private=False, base_item__is_draft=False)
+    from footycollect.collection.services.facet_service import FACET_FIELDS, FeedFacetService
+    from footycollect.collection.services.feed_service import FeedFilterService
 
-    country = request.GET.get("country")
-    if country:
-        base_queryset = base_queryset.filter(Q(base_item__club__country=country) | Q(base_item__country=country))
-
-    if filter_type == "brand":
-        brands = (
-            Brand.objects.filter(baseitem__jersey__in=base_queryset)
-            .annotate(item_count=Count("baseitem__jersey", distinct=True))
-            .filter(item_count__gt=0)
-            .order_by("-item_count", "name")[:50]
-        )
-        results = [
-            {"id": brand.id, "name": brand.name, "logo": brand.logo_display_url or "", "count": brand.item_count}
-            for brand in brands
-        ]
-    elif filter_type == "club":
-        clubs = (
-            Club.objects.filter(baseitem__jersey__in=base_queryset)
-            .annotate(item_count=Count("baseitem__jersey", distinct=True))
-            .filter(item_count__gt=0)
-            .order_by("-item_count", "name")[:50]
-        )
-        results = [
-            {
-                "id": club.id,
-                "name": club.name,
-                "logo": club.logo_display_url or "",
-                "country": str(club.country) if club.country else None,
-                "count": club.item_count,
-            }
-            for club in clubs
-        ]
-    elif filter_type == "competition":
-        competitions = (
-            Competition.objects.filter(collection_baseitem_competitions__jersey__in=base_queryset)
-            .annotate(item_count=Count("collection_baseitem_competitions__jersey", distinct=True))
-            .filter(item_count__gt=0)
-            .order_by("-item_count", "name")[:50]
-        )
-        results = [
-            {
-                "id": comp.id,
-                "name": comp.name,
-                "logo": comp.logo or "",
-                "count": comp.item_count,
-            }
-            for comp in competitions
-        ]
-    elif filter_type == "kit_type":
-        kit_types = (
-            TypeK.objects.filter(kit__jersey__in=base_queryset)
-            .annotate(item_count=Count("kit__jersey", distinct=True))
-            .filter(item_count__gt=0)
-            .order_by("-item_count", "name")[:50]
-        )
-        results = [
-            {
-                "id": kt.id,
-                "name": kt.name,
-                "category": kt.category,
-                "count": kt.item_count,
-            }
-            for kt in kit_types
-        ]
-    else:
+    if filter_type not in FACET_FIELDS:
         return JsonResponse({"error": f"Unknown filter_type: {filter_type}"}, status=400)
 
+    filters = FeedFilterService().parse_filters_from_request(request)
+    results = FeedFacetService().get_facet_counts(filter_type, filters)
     return JsonResponse({"results": results})
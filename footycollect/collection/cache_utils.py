@@ -1,3 +1,5 @@
+import hashlib
+import json
 import time
 
 from django.core.cache import cache
@@ -8,6 +10,12 @@ ITEM_LIST_FRAGMENT_VERSION_TIMEOUT = 86400 * 7  # 7 days
 ITEM_LIST_CACHE_METRICS_HITS_KEY = "cache_metrics:item_list:hits"
 ITEM_LIST_CACHE_METRICS_MISSES_KEY = "cache_metrics:item_list:misses"
 
+# Anonymous feed pages; every public item change bumps the version instead of deleting keys
+FEED_PAGE_CACHE_TIMEOUT = 60 * 5  # 5 minutes
+FEED_PAGE_CACHE_VERSION_KEY = "feed_page:version"
+# Rendered into cached feed pages in place of the CSRF token, which differs per visitor
+FEED_PAGE_CSRF_PLACEHOLDER = "__feed_page_csrf_token__"
+
 
 def get_item_list_fragment_version_key(user_id):
     return f"item_list_fragment_version:{user_id}"
@@ -61,3 +69,29 @@ def get_item_list_cache_metrics():
     hits = cache.get(ITEM_LIST_CACHE_METRICS_HITS_KEY, 0)
     misses = cache.get(ITEM_LIST_CACHE_METRICS_MISSES_KEY, 0)
     return {"hits": hits, "misses": misses}
+
+
+def get_feed_page_cache_key(page, language, *, fragment=False):
+    """
+    Build the cache key of an anonymous feed page or infinite scroll fragment.
+
+    Args:
+        page: What selects the page's items, built by ``FeedView._get_page_cache_key``:
+            ``filters`` (normalized, from ``FeedFilterService.parse_filters_from_request``),
+            ``sort``, ``offset`` (start of the random order, 0 for other sorts) and
+            ``position`` (decoded, signature-checked cursor, or None for the first page)
+        language: Active language code
+        fragment: Key of the items grid fragment instead of the full page
+    """
+    version = cache.get(FEED_PAGE_CACHE_VERSION_KEY, 0)
+    payload = json.dumps(page, sort_keys=True, default=str)
+    digest = hashlib.sha256(payload.encode()).hexdigest()[:32]
+    kind = "fragment" if fragment else "page"
+    return f"feed_page:v{version}:{kind}:{language}:{digest}"
+
+
+def bump_feed_page_cache_version():
+    try:
+        cache.incr(FEED_PAGE_CACHE_VERSION_KEY)
+    except ValueError:
+        cache.set(FEED_PAGE_CACHE_VERSION_KEY, 1, None)
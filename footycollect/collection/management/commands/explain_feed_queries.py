@@ -0,0 +1,216 @@
+"""
+Django management command to check the query plans of the feed and public listings.
+
+Runs ``EXPLAIN`` (``EXPLAIN ANALYZE`` on PostgreSQL) for the canonical feed
+and public item queries and flags sequential scans of the large tables.
+With ``--seed N`` it first adds N synthetic public jerseys inside a
+transaction that is rolled back afterwards, so plans can be checked at scale
+on an empty or small database. ``--compare-distinct`` times the
+multi-competition jersey filter as a semi-join against the former M2M join
+plus ``.distinct()``.
+"""
+
+import random
+import re
+import statistics
+import time
+from collections.abc import Callable
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.db.models import QuerySet
+
+from footycollect.collection.models import BaseItem, FeedEntry, Jersey, Size
+from footycollect.collection.repositories import ItemRepository
+from footycollect.collection.services.feed_entry_service import rebuild_feed_entries
+from footycollect.collection.services.feed_pagination import FEED_PAGE_SIZE
+from footycollect.collection.services.feed_service import FeedFilterService
+from footycollect.collection.services.search_service import rebuild_search_documents
+from footycollect.core.models import Brand, Club, Competition
+
+SEED_BATCH_SIZE = 1000
+SEED_CLUBS = 200
+SEED_BRANDS = 30
+SEED_COMPETITIONS = 40
+COMPARE_COMPETITIONS = 3
+# Tables that grow with the catalogue; scanning smaller lookup tables is fine
+LARGE_TABLES = ("collection_feedentry", "collection_baseitem", "collection_jersey")
+SEQ_SCAN_PATTERNS = {
+    "postgresql": r"Seq Scan on (\w+)",
+    "sqlite": r"SCAN (\w+)\b(?! USING (?:COVERING )?INDEX)",
+}
+
+
+def find_sequential_scans(plan: str, vendor: str) -> list[str]:
+    """Return the large tables ``plan`` reads with a sequential scan."""
+    pattern = SEQ_SCAN_PATTERNS.get(vendor)
+    if pattern is None:
+        return []
+    return sorted({table for table in re.findall(pattern, plan) if table in LARGE_TABLES})
+
+
+class Command(BaseCommand):
+    help = "EXPLAIN the canonical feed and public item queries and flag sequential scans"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=0,
+            help="Add this many synthetic public jerseys first; rolled back afterwards (default: 0)",
+        )
+        parser.add_argument(
+            "--verbose-plans",
+            action="store_true",
+            help="Print every plan, not only the flagged ones",
+        )
+        parser.add_argument(
+            "--compare-distinct",
+            action="store_true",
+            help="Time the multi-competition filter as a semi-join and as a join with DISTINCT",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=5,
+            help="Runs per query for --compare-distinct timings (default: 5)",
+        )
+        parser.add_argument(
+            "--fail-on-seq-scan",
+            action="store_true",
+            help="Exit with an error when any query scans a large table sequentially",
+        )
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            if options["seed"]:
+                self._seed(options["seed"])
+            flagged = self._explain_all(verbose=options["verbose_plans"])
+            if options["compare_distinct"]:
+                self._compare_distinct(repeat=max(options["repeat"], 1), verbose=options["verbose_plans"])
+            # Seeded rows (and the feed entries rebuilt for them) are never kept
+            transaction.set_rollback(True)
+
+        if flagged:
+            message = f"{len(flagged)} queries scan large tables sequentially: {', '.join(flagged)}"
+            if options["fail_on_seq_scan"]:
+                raise CommandError(message)
+            self.stdout.write(self.style.WARNING(message))
+        else:
+            self.stdout.write(self.style.SUCCESS("No sequential scans of large tables"))
+
+    def _canonical_queries(self) -> dict[str, Callable[[], QuerySet]]:
+        service = FeedFilterService()
+        repository = ItemRepository()
+        entries = FeedEntry.objects.only("jersey_id", "created_at", "shuffle_key")
+        club_id = FeedEntry.objects.exclude(club=None).values_list("club_id", flat=True).first() or 0
+        brand_id = FeedEntry.objects.values_list("brand_id", flat=True).first() or 0
+        competition_id = Competition.objects.values_list("pk", flat=True).first() or 0
+        user = BaseItem.objects.public().values_list("user", flat=True).first() or 0
+
+        def feed(filters: dict, sort: str) -> Callable[[], QuerySet]:
+            return lambda: service.sort_entries(service.filter_entries(entries, filters), sort)[: FEED_PAGE_SIZE + 1]
+
+        return {
+            "feed newest": feed({}, "newest"),
+            "feed random": feed({}, "random"),
+            "feed newest by club": feed({"club": club_id}, "newest"),
+            "feed random by brand": feed({"brand": brand_id}, "random"),
+            "feed by competition": feed({"competition": [competition_id]}, "newest"),
+            "feed search": feed({"q": "home"}, "newest"),
+            "public items": lambda: repository.get_public_items()[:FEED_PAGE_SIZE],
+            "public items by club": lambda: repository.get_items_by_club(club_id)[:FEED_PAGE_SIZE],
+            "public items by brand": lambda: repository.get_items_by_brand(brand_id)[:FEED_PAGE_SIZE],
+            "user collection": lambda: repository.get_user_items(user)[:FEED_PAGE_SIZE],
+        }
+
+    @staticmethod
+    def _explain_options() -> dict:
+        return {"analyze": True, "buffers": True} if connection.vendor == "postgresql" else {}
+
+    def _explain_all(self, *, verbose: bool) -> list[str]:
+        vendor = connection.vendor
+        options = self._explain_options()
+        flagged = []
+        for name, build in self._canonical_queries().items():
+            started = time.monotonic()
+            plan = build().explain(**options)
+            elapsed_ms = (time.monotonic() - started) * 1000
+            scans = find_sequential_scans(plan, vendor)
+            if scans:
+                flagged.append(name)
+                self.stdout.write(self.style.WARNING(f"{name}: sequential scan of {', '.join(scans)}"))
+            else:
+                self.stdout.write(f"{name}: ok ({elapsed_ms:.1f} ms)")
+            if scans or verbose:
+                self.stdout.write(plan)
+        return flagged
+
+    def _compare_distinct(self, *, repeat: int, verbose: bool) -> None:
+        competition_ids = list(Competition.objects.order_by("pk").values_list("pk", flat=True)[:COMPARE_COMPETITIONS])
+        jerseys = (
+            Jersey.objects.public()
+            .select_related("base_item", "base_item__club", "base_item__brand", "base_item__season", "kit__type")
+            .order_by("-base_item__created_at", "-base_item_id")
+        )
+        variants = {
+            "semi-join": lambda: FeedFilterService().apply_filters(jerseys, {"competition": competition_ids}),
+            "join + distinct": lambda: jerseys.filter(base_item__competitions__id__in=competition_ids).distinct(),
+        }
+        self.stdout.write(f"Filtering jerseys by {len(competition_ids)} competitions, {repeat} runs each:")
+        for name, build in variants.items():
+            timings = []
+            for _ in range(repeat):
+                started = time.monotonic()
+                list(build()[:FEED_PAGE_SIZE])
+                timings.append((time.monotonic() - started) * 1000)
+            self.stdout.write(f"  {name}: median {statistics.median(timings):.1f} ms, max {max(timings):.1f} ms")
+            if verbose:
+                self.stdout.write(build()[:FEED_PAGE_SIZE].explain(**self._explain_options()))
+
+    def _seed(self, count: int) -> None:
+        self.stdout.write(f"Seeding {count} public jerseys...")
+        started = time.monotonic()
+        suffix = int(time.time())
+        user = get_user_model().objects.create_user(username=f"explain-seed-{suffix}", password=None)
+        size = Size.objects.create(name="M", category="tops")
+        clubs = Club.objects.bulk_create(
+            [Club(name=f"Seed club {i}", slug=f"seed-club-{suffix}-{i}") for i in range(SEED_CLUBS)]
+        )
+        brands = Brand.objects.bulk_create(
+            [Brand(name=f"Seed brand {i}", slug=f"seed-brand-{suffix}-{i}") for i in range(SEED_BRANDS)]
+        )
+        competitions = Competition.objects.bulk_create(
+            [Competition(name=f"Seed league {i}", slug=f"seed-league-{suffix}-{i}") for i in range(SEED_COMPETITIONS)]
+        )
+        through = BaseItem.competitions.through
+        for start in range(0, count, SEED_BATCH_SIZE):
+            items = BaseItem.objects.bulk_create(
+                [
+                    BaseItem(
+                        item_type="jersey",
+                        name=f"Seed {'home' if i % 2 else 'away'} shirt {i}",
+                        user=user,
+                        club=random.choice(clubs),  # noqa: S311
+                        brand=random.choice(brands),  # noqa: S311
+                        is_draft=False,
+                        is_private=i % 10 == 0,
+                    )
+                    for i in range(start, min(start + SEED_BATCH_SIZE, count))
+                ]
+            )
+            Jersey.objects.bulk_create([Jersey(base_item=item, size=size) for item in items])
+            through.objects.bulk_create(
+                [
+                    through(baseitem_id=item.pk, competition_id=random.choice(competitions).pk)  # noqa: S311
+                    for item in items
+                ]
+            )
+        rebuild_feed_entries()
+        rebuild_search_documents(missing_only=True)
+        if connection.vendor == "postgresql":
+            with connection.cursor() as cursor:
+                for table in LARGE_TABLES:
+                    cursor.execute(f"ANALYZE {table}")
+        self.stdout.write(f"Seeded in {time.monotonic() - started:.1f}s")
@@ -20,7 +20,8 @@ from django.core.files.base import ContentFile
 from django.core.files.storage import default_storage
 from django.core.management.base import BaseCommand
 
-from footycollect.api.client import FKAPIClient
+from footycollect.api.client import MAX_BULK_SLUGS, FKAPIClient
+from footycollect.api.rate_limit import BATCH_ACQUIRE_TIMEOUT
 from footycollect.core.utils.images import optimize_image
 
 logger = logging.getLogger(__name__)
@@ -177,27 +178,17 @@ class Command(BaseCommand):
             return []
 
     def fetch_kits_data(self, slugs: list[str], *, verbose: bool) -> list[dict]:
-        """Fetch kits data from FKAPI bulk endpoint in batches."""
-        client = FKAPIClient()
-        all_kits = []
-
-        batch_size = 30
-        for i in range(0, len(slugs), batch_size):
-            batch = slugs[i : i + batch_size]
-            if verbose:
-                self.stdout.write(f"Fetching batch {i // batch_size + 1}: {len(batch)} kits")
-                self.stdout.write(f"  Slugs: {batch[:3]}...")
-
-            kits = client.get_kits_bulk(batch)
-
-            if verbose:
-                self.stdout.write(f"  Received {len(kits)} kits from API")
-                if kits:
-                    self.stdout.write(f"  First kit: {kits[0].get('name', 'N/A')}")
+        """Fetch kits data from FKAPI; the client chunks the bulk requests and runs them concurrently."""
+        client = FKAPIClient(rate_limit_timeout=BATCH_ACQUIRE_TIMEOUT)
+        if verbose:
+            self.stdout.write(f"Fetching {len(slugs)} kits in chunks of up to {MAX_BULK_SLUGS}")
+            self.stdout.write(f"  Slugs: {slugs[:3]}...")
 
-            all_kits.extend(kits)
+        all_kits = client.get_kits_bulk(slugs)
 
         if verbose:
+            if all_kits:
+                self.stdout.write(f"  First kit: {all_kits[0].get('name', 'N/A')}")
             self.stdout.write(f"Total kits fetched: {len(all_kits)}")
 
         return all_kits
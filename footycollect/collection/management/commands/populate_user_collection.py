@@ -19,6 +19,7 @@ from django.db import transaction
 from django.utils.text import slugify
 
 from footycollect.api.client import FKAPIClient
+from footycollect.api.rate_limit import BATCH_ACQUIRE_TIMEOUT
 from footycollect.collection.models import BaseItem, Color, Jersey, Photo, Size
 from footycollect.collection.services.logo_download import ensure_item_entity_logos_downloaded
 from footycollect.core.models import Brand, Club, Competition, Kit, Season, TypeK
@@ -234,7 +235,7 @@ class Command(BaseCommand):
         page_size: int,
     ) -> tuple[dict | None, dict | None]:
         """Fetch user collection from API with pagination. Returns (collection_data, user_info)."""
-        client = FKAPIClient()
+        client = FKAPIClient(rate_limit_timeout=BATCH_ACQUIRE_TIMEOUT)
         self.stdout.write(f"Starting scrape for user {userid}...")
         try:
             try:
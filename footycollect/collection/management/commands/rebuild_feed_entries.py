@@ -0,0 +1,33 @@
+"""
+Django management command to rebuild the feed read model (FeedEntry).
+"""
+
+from django.core.management.base import BaseCommand
+
+from footycollect.collection.models import FeedEntry
+from footycollect.collection.services.feed_entry_service import REBUILD_BATCH_SIZE, rebuild_feed_entries
+
+
+class Command(BaseCommand):
+    help = "Recompute the denormalized feed entries of all public jerseys"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=REBUILD_BATCH_SIZE,
+            help=f"Number of jerseys loaded per query (default: {REBUILD_BATCH_SIZE})",
+        )
+        parser.add_argument(
+            "--if-empty",
+            action="store_true",
+            help="Only rebuild when there are no feed entries yet (first deploy)",
+        )
+
+    def handle(self, *args, **options):
+        if options["if_empty"] and FeedEntry.objects.exists():
+            self.stdout.write("Feed entries already built, skipping")
+            return
+        self.stdout.write("Rebuilding feed entries...")
+        entries = rebuild_feed_entries(batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {entries} feed entries"))
@@ -0,0 +1,29 @@
+"""
+Django management command to rebuild item search documents.
+"""
+
+from django.core.management.base import BaseCommand
+
+from footycollect.collection.services.search_service import REBUILD_BATCH_SIZE, rebuild_search_documents
+
+
+class Command(BaseCommand):
+    help = "Recompute the full-text search documents of collection items"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--missing-only",
+            action="store_true",
+            help="Only items that have no search document yet",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=REBUILD_BATCH_SIZE,
+            help=f"Number of items loaded per query (default: {REBUILD_BATCH_SIZE})",
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write("Rebuilding search documents...")
+        items = rebuild_search_documents(batch_size=options["batch_size"], missing_only=options["missing_only"])
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {items} search documents"))
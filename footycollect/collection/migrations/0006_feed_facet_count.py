@@ -0,0 +1,34 @@
+# Generated by Django 5.0.8 on 2026-10-16 20:53
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('collection', '0005_add_jersey_fit_private'),
+        ('core', '0003_trigram_search_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FeedFacetCount',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('by_competition', models.BooleanField(default=False)),
+                ('club_country', models.CharField(blank=True, max_length=2)),
+                ('country', models.CharField(blank=True, max_length=2)),
+                ('item_count', models.PositiveIntegerField()),
+                ('brand', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='core.brand')),
+                ('club', models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='core.club')),
+                ('competition', models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='core.competition')),
+                ('kit_type', models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='core.typek')),
+                ('main_color', models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='collection.color')),
+                ('season', models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='core.season')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['by_competition', 'brand'], name='feedfacet_brand_idx'), models.Index(fields=['by_competition', 'club'], name='feedfacet_club_idx'), models.Index(fields=['by_competition', 'competition'], name='feedfacet_competition_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 5.0.8 on 2026-10-16 22:10
+
+import random
+
+from django.db import migrations, models
+
+import footycollect.collection.models
+
+SHUFFLE_BATCH_SIZE = 1000
+SHUFFLE_KEY_SPACE = 2147483647
+
+
+def shuffle_existing_items(apps, schema_editor):
+    # AddField gives every existing row the same default; spread them out
+    BaseItem = apps.get_model("collection", "BaseItem")
+    ids = list(BaseItem.objects.values_list("id", flat=True))
+    for start in range(0, len(ids), SHUFFLE_BATCH_SIZE):
+        items = [
+            BaseItem(id=item_id, shuffle_key=random.randrange(SHUFFLE_KEY_SPACE))  # noqa: S311
+            for item_id in ids[start : start + SHUFFLE_BATCH_SIZE]
+        ]
+        BaseItem.objects.bulk_update(items, ["shuffle_key"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('collection', '0006_feed_facet_count'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='baseitem',
+            name='shuffle_key',
+            field=models.PositiveIntegerField(default=footycollect.collection.models.random_shuffle_key, editable=False, help_text="Position of the item in the feed's random order; reshuffled periodically."),
+        ),
+        migrations.RunPython(shuffle_existing_items, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='baseitem',
+            index=models.Index(condition=models.Q(('is_draft', False), ('is_private', False)), fields=['shuffle_key', 'id'], name='baseitem_public_shuffle_idx'),
+        ),
+    ]
@@ -0,0 +1,69 @@
+# Generated by Django 5.0.8 on 2026-10-16 23:05
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+# GIN indexes for the feed's competition / secondary color filters, which
+# match the id lists with jsonb containment (@>). PostgreSQL only.
+JSONB_INDEXES = [
+    ('feedentry_competition_ids_gin', 'collection_feedentry', 'competition_ids'),
+    ('feedentry_secondary_color_ids_gin', 'collection_feedentry', 'secondary_color_ids'),
+]
+
+
+def create_jsonb_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name, table, column in JSONB_INDEXES:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {name} ON {table} USING gin ({column} jsonb_path_ops);'
+        )
+
+
+def drop_jsonb_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name, _table, _column in JSONB_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {name};')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('collection', '0007_baseitem_shuffle_key'),
+        ('core', '0003_trigram_search_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FeedEntry',
+            fields=[
+                ('jersey', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='feed_entry', serialize=False, to='collection.jersey')),
+                ('created_at', models.DateTimeField()),
+                ('shuffle_key', models.PositiveIntegerField()),
+                ('club_country', models.CharField(blank=True, max_length=2)),
+                ('country', models.CharField(blank=True, max_length=2)),
+                ('season_year', models.CharField(blank=True, max_length=9)),
+                ('kit_category', models.CharField(blank=True, max_length=20)),
+                ('has_nameset', models.BooleanField(default=False)),
+                ('competition_ids', models.JSONField(blank=True, default=list)),
+                ('secondary_color_ids', models.JSONField(blank=True, default=list)),
+                ('name', models.CharField(max_length=200)),
+                ('club_name', models.CharField(blank=True, max_length=500)),
+                ('brand_name', models.CharField(blank=True, max_length=100)),
+                ('kit_type_name', models.CharField(blank=True, max_length=100)),
+                ('main_photo_url', models.CharField(blank=True, max_length=500)),
+                ('brand', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='core.brand')),
+                ('club', models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='core.club')),
+                ('kit_type', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='core.typek')),
+                ('main_color', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='collection.color')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['-created_at', '-jersey'], name='feedentry_newest_idx'), models.Index(fields=['shuffle_key', 'jersey'], name='feedentry_shuffle_idx'), models.Index(fields=['season_year'], name='feedentry_season_idx'), models.Index(fields=['club_country'], name='feedentry_club_country_idx'), models.Index(fields=['country'], name='feedentry_country_idx')],
+            },
+        ),
+        migrations.RunPython(create_jsonb_indexes, drop_jsonb_indexes),
+    ]
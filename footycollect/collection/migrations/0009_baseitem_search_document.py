@@ -0,0 +1,47 @@
+# Generated by Django 5.0.8 on 2026-10-16 23:40
+
+import django.contrib.postgres.search
+from django.db import migrations, models
+
+# Full-text and trigram indexes for collection.services.search_service.
+# PostgreSQL only; other databases search search_text with icontains.
+SEARCH_INDEXES = [
+    ('baseitem_search_document_gin', 'collection_baseitem', 'search_document'),
+    ('baseitem_search_text_trgm', 'collection_baseitem', 'search_text gin_trgm_ops'),
+]
+
+
+def create_search_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm;')
+    for name, table, expression in SEARCH_INDEXES:
+        schema_editor.execute(f'CREATE INDEX IF NOT EXISTS {name} ON {table} USING gin ({expression});')
+
+
+def drop_search_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name, _table, _expression in SEARCH_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {name};')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('collection', '0008_feed_entry'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='baseitem',
+            name='search_document',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='baseitem',
+            name='search_text',
+            field=models.TextField(blank=True, editable=False),
+        ),
+        migrations.RunPython(create_search_indexes, drop_search_indexes),
+    ]
@@ -0,0 +1,57 @@
+# Generated by Django 5.0.8 on 2026-10-17 00:10
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('collection', '0009_baseitem_search_document'),
+        ('core', '0003_trigram_search_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='baseitem',
+            index=models.Index(condition=models.Q(('is_draft', False), ('is_private', False)), fields=['-created_at', '-id'], name='baseitem_public_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='baseitem',
+            index=models.Index(condition=models.Q(('is_draft', False), ('is_private', False)), fields=['club', '-created_at'], name='baseitem_public_club_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='baseitem',
+            index=models.Index(condition=models.Q(('is_draft', False), ('is_private', False)), fields=['brand', '-created_at'], name='baseitem_public_brand_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='baseitem',
+            index=models.Index(condition=models.Q(('is_draft', False), ('is_private', False)), fields=['season', '-created_at'], name='baseitem_public_season_idx'),
+        ),
+        migrations.AlterField(
+            model_name='feedentry',
+            name='brand',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='core.brand'),
+        ),
+        migrations.AlterField(
+            model_name='feedentry',
+            name='club',
+            field=models.ForeignKey(db_index=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='core.club'),
+        ),
+        migrations.AddIndex(
+            model_name='feedentry',
+            index=models.Index(fields=['club', '-created_at', '-jersey'], name='feedentry_club_newest_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='feedentry',
+            index=models.Index(fields=['club', 'shuffle_key', 'jersey'], name='feedentry_club_shuffle_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='feedentry',
+            index=models.Index(fields=['brand', '-created_at', '-jersey'], name='feedentry_brand_newest_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='feedentry',
+            index=models.Index(fields=['brand', 'shuffle_key', 'jersey'], name='feedentry_brand_shuffle_idx'),
+        ),
+    ]
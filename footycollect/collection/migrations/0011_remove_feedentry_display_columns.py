@@ -0,0 +1,29 @@
+# Generated by Django 5.0.8 on 2026-10-17 09:20
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('collection', '0010_public_feed_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='feedentry',
+            name='brand_name',
+        ),
+        migrations.RemoveField(
+            model_name='feedentry',
+            name='club_name',
+        ),
+        migrations.RemoveField(
+            model_name='feedentry',
+            name='main_photo_url',
+        ),
+        migrations.RemoveField(
+            model_name='feedentry',
+            name='name',
+        ),
+    ]
@@ -1,14 +1,17 @@
+import random
+
 from django.contrib.contenttypes.fields import GenericForeignKey, GenericRelation
 from django.contrib.contenttypes.models import ContentType
+from django.contrib.postgres.search import SearchVectorField
 from django.core.validators import MaxValueValidator, MinValueValidator, RegexValidator
-from django.db import models
+from django.db import models, transaction
 from django.utils.translation import gettext_lazy as _
 from django_countries.fields import CountryField
 from imagekit.models import ImageSpecField
 from imagekit.processors import ResizeToFill
 from taggit.models import Tag
 
-from footycollect.core.models import Brand, Club, Competition, Kit, Season
+from footycollect.core.models import Brand, Club, Competition, Kit, Season, TypeK
 from footycollect.core.utils.images import optimize_image
 
 
@@ -186,6 +189,14 @@ class MTIManager(models.Manager):
         return self.filter(base_item__is_draft=True)
 
 
+# Upper bound (exclusive) of BaseItem.shuffle_key
+SHUFFLE_KEY_SPACE = 2147483647
+
+
+def random_shuffle_key() -> int:
+    return random.randrange(SHUFFLE_KEY_SPACE)  # noqa: S311
+
+
 class BaseItem(models.Model):
     COLOR_CHOICES = [
         ("WHITE", _("White")),
@@ -320,6 +331,14 @@ class BaseItem(models.Model):
         db_index=True,
         help_text="FootballKitArchive user-collection entry id; used to skip duplicates on re-import.",
     )
+    shuffle_key = models.PositiveIntegerField(
+        default=random_shuffle_key,
+        editable=False,
+        help_text="Position of the item in the feed's random order; reshuffled periodically.",
+    )
+    # Maintained by collection.services.search_service
+    search_document = SearchVectorField(null=True, editable=False)
+    search_text = models.TextField(blank=True, editable=False)
 
     photos = GenericRelation(Photo)
 
@@ -340,6 +359,33 @@ class BaseItem(models.Model):
             models.Index(fields=["user", "created_at"], name="baseitem_user_created_idx"),
             models.Index(fields=["club", "season"], name="baseitem_club_season_idx"),
             models.Index(fields=["user", "id_fka_entry"], name="baseitem_user_id_fka_entry_idx"),
+            # Random feed order: pages are range scans over public items
+            models.Index(
+                fields=["shuffle_key", "id"],
+                condition=models.Q(is_private=False, is_draft=False),
+                name="baseitem_public_shuffle_idx",
+            ),
+            # Public listings (ItemRepository), newest first, overall and per club / brand / season
+            models.Index(
+                fields=["-created_at", "-id"],
+                condition=models.Q(is_private=False, is_draft=False),
+                name="baseitem_public_created_idx",
+            ),
+            models.Index(
+                fields=["club", "-created_at"],
+                condition=models.Q(is_private=False, is_draft=False),
+                name="baseitem_public_club_idx",
+            ),
+            models.Index(
+                fields=["brand", "-created_at"],
+                condition=models.Q(is_private=False, is_draft=False),
+                name="baseitem_public_brand_idx",
+            ),
+            models.Index(
+                fields=["season", "-created_at"],
+                condition=models.Q(is_private=False, is_draft=False),
+                name="baseitem_public_season_idx",
+            ),
         ]
 
     def __str__(self):
@@ -452,8 +498,10 @@ class Jersey(models.Model):
             self.base_item.item_type = "jersey"
         # Auto-generate name using builder
         self.base_item.name = self.build_name()
-        self.base_item.save()
-        super().save(*args, **kwargs)
+        # One transaction, so the base item and jersey saves sync the feed once
+        with transaction.atomic():
+            self.base_item.save()
+            super().save(*args, **kwargs)
 
     def _build_base_name(self) -> str:
         """Build the base name (club + type)."""
@@ -683,3 +731,86 @@ class OtherItem(models.Model):
             self.base_item.item_type = "other"
             self.base_item.save()
         super().save(*args, **kwargs)
+
+
+class FeedFacetCount(models.Model):
+    """
+    Precomputed count of public jerseys per combination of feed filter values.
+
+    Rebuilt by ``collection.tasks.rebuild_feed_facet_counts``; read by
+    ``FeedFacetService`` to answer filter drawer counts without aggregating
+    over every public jersey. Rows with ``by_competition=False`` count each
+    jersey once and leave ``competition`` empty; rows with
+    ``by_competition=True`` count each (jersey, competition) pair.
+    """
+
+    by_competition = models.BooleanField(default=False)
+    brand = models.ForeignKey(Brand, on_delete=models.CASCADE, related_name="+")
+    club = models.ForeignKey(Club, on_delete=models.CASCADE, null=True, related_name="+")
+    club_country = models.CharField(max_length=2, blank=True)
+    country = models.CharField(max_length=2, blank=True)
+    season = models.ForeignKey(Season, on_delete=models.CASCADE, null=True, related_name="+")
+    kit_type = models.ForeignKey(TypeK, on_delete=models.CASCADE, null=True, related_name="+")
+    main_color = models.ForeignKey(Color, on_delete=models.CASCADE, null=True, related_name="+")
+    competition = models.ForeignKey(Competition, on_delete=models.CASCADE, null=True, related_name="+")
+    item_count = models.PositiveIntegerField()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["by_competition", "brand"], name="feedfacet_brand_idx"),
+            models.Index(fields=["by_competition", "club"], name="feedfacet_club_idx"),
+            models.Index(fields=["by_competition", "competition"], name="feedfacet_competition_idx"),
+        ]
+
+    def __str__(self):
+        return f"Feed facet count ({self.item_count})"
+
+
+class FeedEntry(models.Model):
+    """
+    Denormalized row per public jersey, read by the global feed.
+
+    Holds every column the feed filters and sorts on, so ``FeedFilterService``
+    pages the feed from this one table instead of joining ``Jersey`` to
+    ``BaseItem`` and its related tables. Competitions and secondary colors are
+    stored as lists of ids. Pages are rendered from the jerseys themselves, so
+    no display-only columns are kept. Kept in sync by ``collection.signals`` (see
+    ``services.feed_entry_service``); rebuilt with ``manage.py
+    rebuild_feed_entries``.
+    """
+
+    jersey = models.OneToOneField(Jersey, on_delete=models.CASCADE, primary_key=True, related_name="feed_entry")
+    user = models.ForeignKey("users.User", on_delete=models.CASCADE, related_name="+")
+    created_at = models.DateTimeField()
+    shuffle_key = models.PositiveIntegerField()
+    # Indexed together with the sort keys in Meta.indexes
+    brand = models.ForeignKey(Brand, on_delete=models.CASCADE, related_name="+", db_index=False)
+    club = models.ForeignKey(Club, on_delete=models.CASCADE, null=True, related_name="+", db_index=False)
+    club_country = models.CharField(max_length=2, blank=True)
+    country = models.CharField(max_length=2, blank=True)
+    season_year = models.CharField(max_length=9, blank=True)
+    kit_type = models.ForeignKey(TypeK, on_delete=models.SET_NULL, null=True, related_name="+")
+    kit_category = models.CharField(max_length=20, blank=True)
+    main_color = models.ForeignKey(Color, on_delete=models.SET_NULL, null=True, related_name="+")
+    has_nameset = models.BooleanField(default=False)
+    competition_ids = models.JSONField(default=list, blank=True)
+    secondary_color_ids = models.JSONField(default=list, blank=True)
+    # Matched by the kit type name filter
+    kit_type_name = models.CharField(max_length=100, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["-created_at", "-jersey"], name="feedentry_newest_idx"),
+            models.Index(fields=["shuffle_key", "jersey"], name="feedentry_shuffle_idx"),
+            # Club and brand filters, under either feed order
+            models.Index(fields=["club", "-created_at", "-jersey"], name="feedentry_club_newest_idx"),
+            models.Index(fields=["club", "shuffle_key", "jersey"], name="feedentry_club_shuffle_idx"),
+            models.Index(fields=["brand", "-created_at", "-jersey"], name="feedentry_brand_newest_idx"),
+            models.Index(fields=["brand", "shuffle_key", "jersey"], name="feedentry_brand_shuffle_idx"),
+            models.Index(fields=["season_year"], name="feedentry_season_idx"),
+            models.Index(fields=["club_country"], name="feedentry_club_country_idx"),
+            models.Index(fields=["country"], name="feedentry_country_idx"),
+        ]
+
+    def __str__(self):
+        return f"Feed entry: jersey {self.jersey_id}"
@@ -6,7 +6,7 @@ including jerseys, shorts, outerwear, and other item types.
 """
 
 from django.contrib.auth import get_user_model
-from django.db.models import Q, QuerySet
+from django.db.models import QuerySet
 
 from footycollect.collection.models import BaseItem
 
@@ -72,28 +72,29 @@ class ItemRepository(BaseRepository):
 
     def search_items(self, query: str, user: User | None = None) -> QuerySet[BaseItem]:
         """
-        Search items by name, description, or related fields.
+        Search items by name, club, brand, season, player name, kit type or description.
 
         Args:
             query: Search query string
             user: Optional user to limit search to their items
 
         Returns:
-            QuerySet of matching items
+            QuerySet of matching items, most relevant first
         """
-        search_filter = Q(description__icontains=query)
+        # Imported here: the services package imports the repositories
+        from footycollect.collection.services.search_service import order_by_relevance, search_filter
 
         if user:
             queryset = self.model.objects.filter(user=user)
         else:
             queryset = self.model.objects.filter(is_draft=False, is_private=False)
 
-        return (
-            queryset.filter(search_filter)
+        queryset = (
+            queryset.filter(search_filter(query))
             .select_related("user", "club", "season", "brand", "main_color")
             .prefetch_related("photos", "competitions", "secondary_colors", "tags")
-            .order_by("-created_at")
         )
+        return order_by_relevance(queryset, query, "-created_at")
 
     def get_items_by_club(self, club_id: int, user: User | None = None) -> QuerySet[BaseItem]:
         """
@@ -0,0 +1,280 @@
+"""
+Service for feed filter facet counts.
+
+Counts of public jerseys per brand, club, competition, kit type, season and
+main color, conditioned on the other active feed filters. Counts are read
+from the precomputed ``FeedFacetCount`` table when the active filters map
+onto its columns, and aggregated live over ``Jersey`` otherwise (free-text
+search, secondary colors, nameset, several competitions, or before the
+table is first built). Results are cached per facet and normalized filter
+set; rebuilding the table bumps the cache version.
+"""
+
+import hashlib
+import json
+import logging
+import time
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, F, Q, QuerySet, Sum, Value
+from django.db.models.functions import Coalesce
+
+from footycollect.collection.models import Color, FeedFacetCount, Jersey
+from footycollect.collection.services.feed_service import FeedFilterService
+from footycollect.core.models import Brand, Club, Competition, Season, TypeK
+
+logger = logging.getLogger(__name__)
+
+FACET_CACHE_TIMEOUT = 60 * 10
+FACET_CACHE_VERSION_KEY = "feed_facets:version"
+FACET_REBUILD_PENDING_KEY = "feed_facets:rebuild_pending"
+FACET_REBUILD_DELAY = 60  # seconds, coalesces bursts of item changes into one rebuild
+FACET_RESULT_LIMIT = 50
+REBUILD_BATCH_SIZE = 1000
+
+# facet -> (FeedFacetCount column, Jersey lookup used for live aggregation)
+FACET_FIELDS = {
+    "brand": ("brand_id", "base_item__brand"),
+    "club": ("club_id", "base_item__club"),
+    "competition": ("competition_id", "base_item__competitions"),
+    "kit_type": ("kit_type_id", "kit__type"),
+    "season": ("season_id", "base_item__season"),
+    "main_color": ("main_color_id", "base_item__main_color"),
+}
+# Filters that narrow a facet's own values; dropped when counting that facet
+# so the drawer keeps showing the alternatives.
+FACET_OWN_FILTERS = {
+    "brand": ("brand",),
+    "club": ("club",),
+    "competition": ("competition",),
+    "kit_type": ("kit_type", "category"),
+    "season": ("season",),
+    "main_color": ("main_color",),
+}
+# Filters the FeedFacetCount table has no columns for
+LIVE_ONLY_FILTERS = ("q", "secondary_color", "has_nameset")
+
+
+def _int_or_none(value) -> int | None:
+    try:
+        return int(str(value).strip())
+    except (ValueError, TypeError):
+        return None
+
+
+class FeedFacetService:
+    """Service for counting feed filter options."""
+
+    def __init__(self):
+        self.filter_service = FeedFilterService()
+
+    def get_facet_counts(self, facet: str, filters: dict[str, Any]) -> list[dict[str, Any]]:
+        """
+        Return the options of ``facet`` with item counts, most items first.
+
+        Args:
+            facet: One of ``FACET_FIELDS``
+            filters: Active feed filters, as parsed by ``FeedFilterService``
+
+        Returns:
+            List of option dicts (id, name, count and facet-specific fields)
+        """
+        filters = self.normalize_filters(facet, filters)
+        cache_key = self._cache_key(facet, filters)
+        results = cache.get(cache_key)
+        if results is None:
+            counts = self._count(facet, filters)
+            results = self._describe(facet, counts)
+            cache.set(cache_key, results, getattr(settings, "FEED_FACET_CACHE_TIMEOUT", FACET_CACHE_TIMEOUT))
+        return results
+
+    def normalize_filters(self, facet: str, filters: dict[str, Any]) -> dict[str, Any]:
+        """Drop the facet's own and empty filters, resolve slugs to ids and sort list values."""
+        normalized = {}
+        for key, raw_value in filters.items():
+            if key in FACET_OWN_FILTERS[facet] or raw_value in (None, "", []):
+                continue
+            value = self._normalize_value(key, raw_value)
+            if value is not None:
+                normalized[key] = value
+        return normalized
+
+    def _normalize_value(self, key: str, value):
+        if key in ("club", "brand") and _int_or_none(value) is None:
+            model = Club if key == "club" else Brand
+            return model.objects.filter(slug=value).values_list("pk", flat=True).first() or 0
+        if key == "competition":
+            return sorted({int(v) for v in value}) if isinstance(value, list) else [int(value)]
+        if key == "main_color":
+            return _int_or_none(value)
+        return value
+
+    def _cache_key(self, facet: str, filters: dict[str, Any]) -> str:
+        version = cache.get(FACET_CACHE_VERSION_KEY, 0)
+        digest = hashlib.sha256(json.dumps(filters, sort_keys=True, default=str).encode()).hexdigest()[:16]
+        return f"feed_facets:v{version}:{facet}:{digest}"
+
+    def _count(self, facet: str, filters: dict[str, Any]) -> list[tuple[int, int]]:
+        if self._table_can_answer(filters) and FeedFacetCount.objects.exists():
+            return self._count_from_table(facet, filters)
+        return self._count_live(facet, filters)
+
+    def _table_can_answer(self, filters: dict[str, Any]) -> bool:
+        if any(key in filters for key in LIVE_ONLY_FILTERS):
+            return False
+        # A jersey in several selected competitions has one row per competition.
+        return len(filters.get("competition", [])) <= 1
+
+    def _count_from_table(self, facet: str, filters: dict[str, Any]) -> list[tuple[int, int]]:
+        column = FACET_FIELDS[facet][0]
+        rows = FeedFacetCount.objects.filter(
+            by_competition=facet == "competition" or "competition" in filters,
+            **{f"{column}__isnull": False},
+        )
+        if country := filters.get("country"):
+            rows = rows.filter(Q(club_country=country) | Q(country=country))
+        if "club" in filters:
+            rows = rows.filter(club_id=int(filters["club"]))
+        if "brand" in filters:
+            rows = rows.filter(brand_id=int(filters["brand"]))
+        if "season" in filters:
+            rows = rows.filter(season__year=filters["season"])
+        if "competition" in filters:
+            rows = rows.filter(competition_id=filters["competition"][0])
+        if "kit_type" in filters:
+            kit_type_id = _int_or_none(filters["kit_type"])
+            if kit_type_id is None:
+                rows = rows.filter(kit_type__name__icontains=filters["kit_type"])
+            else:
+                rows = rows.filter(kit_type_id=kit_type_id)
+        if "category" in filters:
+            rows = rows.filter(kit_type__category=filters["category"])
+        if "main_color" in filters:
+            rows = rows.filter(main_color_id=filters["main_color"])
+        counts = rows.values(column).annotate(total=Sum("item_count")).order_by("-total", column)
+        return [(row[column], row["total"]) for row in counts]
+
+    def _count_live(self, facet: str, filters: dict[str, Any]) -> list[tuple[int, int]]:
+        lookup = FACET_FIELDS[facet][1]
+        # apply_filters matches M2M filters with semi-joins, so each jersey is one row
+        # and, grouped by competition, one row per competition
+        queryset = self.filter_service.apply_filters(Jersey.objects.public(), filters)
+        counts = (
+            queryset.filter(**{f"{lookup}__isnull": False})
+            .values(lookup)
+            .annotate(total=Count("pk"))
+            .order_by("-total", lookup)
+        )
+        return [(row[lookup], row["total"]) for row in counts]
+
+    def _describe(self, facet: str, counts: list[tuple[int, int]]) -> list[dict[str, Any]]:
+        """Attach display fields to the top (id, count) pairs and order them by count, then name."""
+        count_by_id = dict(counts[:FACET_RESULT_LIMIT])
+        describe = getattr(self, f"_describe_{facet}")
+        options = describe(count_by_id)
+        options.sort(key=lambda option: (-option["count"], option["name"]))
+        return options
+
+    def _describe_brand(self, count_by_id):
+        return [
+            {"id": brand.id, "name": brand.name, "logo": brand.logo_display_url or "", "count": count_by_id[brand.id]}
+            for brand in Brand.objects.filter(pk__in=count_by_id)
+        ]
+
+    def _describe_club(self, count_by_id):
+        return [
+            {
+                "id": club.id,
+                "name": club.name,
+                "logo": club.logo_display_url or "",
+                "country": str(club.country) if club.country else None,
+                "count": count_by_id[club.id],
+            }
+            for club in Club.objects.filter(pk__in=count_by_id)
+        ]
+
+    def _describe_competition(self, count_by_id):
+        return [
+            {"id": comp.id, "name": comp.name, "logo": comp.logo or "", "count": count_by_id[comp.id]}
+            for comp in Competition.objects.filter(pk__in=count_by_id)
+        ]
+
+    def _describe_kit_type(self, count_by_id):
+        return [
+            {"id": kt.id, "name": kt.name, "category": kt.category, "count": count_by_id[kt.id]}
+            for kt in TypeK.objects.filter(pk__in=count_by_id)
+        ]
+
+    def _describe_season(self, count_by_id):
+        return [
+            {"id": season.id, "name": season.year, "count": count_by_id[season.id]}
+            for season in Season.objects.filter(pk__in=count_by_id)
+        ]
+
+    def _describe_main_color(self, count_by_id):
+        from footycollect.collection.utils_i18n import get_color_display_name
+
+        return [
+            {
+                "id": color.id,
+                "name": str(get_color_display_name(color.name)),
+                "hex_value": color.hex_value or "#000000",
+                "count": count_by_id[color.id],
+            }
+            for color in Color.objects.filter(pk__in=count_by_id)
+        ]
+
+
+def _facet_rows(queryset: QuerySet[Jersey], *, by_competition: bool) -> list[FeedFacetCount]:
+    dimensions = {
+        "brand_id": F("base_item__brand_id"),
+        "club_id": F("base_item__club_id"),
+        "club_country": Coalesce(F("base_item__club__country"), Value("")),
+        "country": Coalesce(F("base_item__country"), Value("")),
+        "season_id": F("base_item__season_id"),
+        "kit_type_id": F("kit__type_id"),
+        "main_color_id": F("base_item__main_color_id"),
+    }
+    if by_competition:
+        queryset = queryset.filter(base_item__competitions__isnull=False)
+        dimensions["competition_id"] = F("base_item__competitions__id")
+    groups = queryset.values(**dimensions).annotate(item_count=Count("pk", distinct=True)).order_by()
+    return [FeedFacetCount(by_competition=by_competition, **group) for group in groups]
+
+
+def rebuild_feed_facet_counts() -> int:
+    """Recompute the FeedFacetCount table from public jerseys; return the number of rows written."""
+    started = time.monotonic()
+    rows = _facet_rows(Jersey.objects.public(), by_competition=False) + _facet_rows(
+        Jersey.objects.public(), by_competition=True
+    )
+    with transaction.atomic():
+        FeedFacetCount.objects.all().delete()
+        FeedFacetCount.objects.bulk_create(rows, batch_size=REBUILD_BATCH_SIZE)
+    bump_feed_facet_cache_version()
+    logger.info("Rebuilt %d feed facet rows in %.2fs", len(rows), time.monotonic() - started)
+    return len(rows)
+
+
+def bump_feed_facet_cache_version() -> None:
+    try:
+        cache.incr(FACET_CACHE_VERSION_KEY)
+    except ValueError:
+        cache.set(FACET_CACHE_VERSION_KEY, 1, None)
+
+
+def schedule_feed_facet_rebuild() -> None:
+    """Queue one table rebuild after a short delay, however many items change meanwhile."""
+    delay = getattr(settings, "FEED_FACET_REBUILD_DELAY", FACET_REBUILD_DELAY)
+    if not cache.add(FACET_REBUILD_PENDING_KEY, 1, delay):
+        return
+    from footycollect.collection.tasks import rebuild_feed_facet_counts_task
+
+    try:
+        rebuild_feed_facet_counts_task.apply_async(countdown=delay)
+    except Exception:
+        logger.exception("Could not queue feed facet rebuild")
+        cache.delete(FACET_REBUILD_PENDING_KEY)
@@ -0,0 +1,172 @@
+"""
+Service keeping the ``FeedEntry`` read model in sync with public jerseys.
+
+Each public jersey has one ``FeedEntry`` row with the columns the feed filters
+and sorts on; the page itself is rendered from the jerseys
+(``hydrate_feed_entries``). Rows are written when an item, jersey or the
+item's competitions / secondary colors change (``collection.signals``), once
+per transaction after it commits, so the feed shows an item as soon as it is
+saved. Changes to shared entities (a club's country, a kit re-typed) can touch many rows and are applied by a Celery
+task instead. ``rebuild_feed_entries`` recomputes the whole table in batches,
+from the daily beat task or the ``rebuild_feed_entries`` management command:
+run that once after a change to how entries are built (deploys only run it
+while the table is empty).
+
+Every write that changes the table bumps the anonymous feed page cache
+version once the transaction commits.
+"""
+
+import logging
+import time
+from collections.abc import Iterable
+
+from django.db import transaction
+from django.db.models import QuerySet
+
+from footycollect.collection.cache_utils import bump_feed_page_cache_version
+from footycollect.collection.models import FeedEntry, Jersey
+
+logger = logging.getLogger(__name__)
+
+REBUILD_BATCH_SIZE = 1000
+
+# Entity lookup -> Jersey lookup of the items showing it
+ENTITY_LOOKUPS = {
+    "club": "base_item__club",
+    "brand": "base_item__brand",
+    "season": "base_item__season",
+    "kit": "kit",
+    "kit_type": "kit__type",
+}
+
+
+def _feed_jerseys(queryset: QuerySet[Jersey]) -> QuerySet[Jersey]:
+    return queryset.select_related(
+        "base_item",
+        "base_item__club",
+        "base_item__brand",
+        "base_item__season",
+        "kit__type",
+    ).prefetch_related(
+        "base_item__competitions",
+        "base_item__secondary_colors",
+    )
+
+
+def build_feed_entry(jersey: Jersey) -> FeedEntry:
+    """Build the (unsaved) feed entry of a jersey loaded with ``_feed_jerseys``."""
+    base_item = jersey.base_item
+    club = base_item.club
+    kit_type = jersey.kit.type if jersey.kit else None
+    return FeedEntry(
+        jersey_id=jersey.pk,
+        user_id=base_item.user_id,
+        created_at=base_item.created_at,
+        shuffle_key=base_item.shuffle_key,
+        brand_id=base_item.brand_id,
+        club_id=base_item.club_id,
+        club_country=str(club.country) if club and club.country else "",
+        country=str(base_item.country) if base_item.country else "",
+        season_year=base_item.season.year if base_item.season else "",
+        kit_type_id=kit_type.pk if kit_type else None,
+        kit_category=kit_type.category if kit_type else "",
+        main_color_id=base_item.main_color_id,
+        has_nameset=jersey.has_nameset,
+        competition_ids=sorted(competition.pk for competition in base_item.competitions.all()),
+        secondary_color_ids=sorted(color.pk for color in base_item.secondary_colors.all()),
+        kit_type_name=kit_type.name if kit_type else "",
+    )
+
+
+def sync_feed_entries(jersey_ids: Iterable[int]) -> int:
+    """
+    Write the feed entries of the given jerseys (or base items) from their current state.
+
+    Items that are private, drafts, or no longer exist lose their entry.
+
+    Returns:
+        Number of entries written
+    """
+    jersey_ids = list({int(pk) for pk in jersey_ids if pk is not None})
+    if not jersey_ids:
+        return 0
+    jerseys = _feed_jerseys(Jersey.objects.public().filter(pk__in=jersey_ids))
+    entries = [build_feed_entry(jersey) for jersey in jerseys]
+    with transaction.atomic():
+        deleted, _ = FeedEntry.objects.filter(jersey_id__in=jersey_ids).delete()
+        FeedEntry.objects.bulk_create(entries)
+        if deleted or entries:
+            transaction.on_commit(bump_feed_page_cache_version)
+    return len(entries)
+
+
+def sync_feed_entries_for_entity(entity: str, pk: int) -> int:
+    """Re-sync the entries of every public jersey showing the given club, brand, season, kit or kit type."""
+    lookup = ENTITY_LOOKUPS[entity]
+    ids = list(Jersey.objects.public().filter(**{lookup: pk}).values_list("pk", flat=True))
+    written = 0
+    for start in range(0, len(ids), REBUILD_BATCH_SIZE):
+        written += sync_feed_entries(ids[start : start + REBUILD_BATCH_SIZE])
+    return written
+
+
+def rebuild_feed_entries(batch_size: int = REBUILD_BATCH_SIZE) -> int:
+    """
+    Recompute the FeedEntry table from public jerseys; return the number of rows written.
+
+    Public jerseys are walked by primary key and each batch is re-synced in its
+    own transaction, so live saves only ever wait for one batch. Entries of
+    jerseys that are no longer public are deleted at the end.
+    """
+    started = time.monotonic()
+    public = Jersey.objects.public()
+    written = 0
+    last_pk = 0
+    while True:
+        ids = list(public.filter(pk__gt=last_pk).order_by("pk").values_list("pk", flat=True)[:batch_size])
+        if not ids:
+            break
+        written += sync_feed_entries(ids)
+        last_pk = ids[-1]
+    deleted, _ = FeedEntry.objects.exclude(jersey__in=public).delete()
+    if deleted:
+        bump_feed_page_cache_version()
+    logger.info("Rebuilt %d feed entries in %.2fs", written, time.monotonic() - started)
+    return written
+
+
+def schedule_feed_entry_refresh(entity: str, pk: int) -> None:
+    """Queue a re-sync of the entries showing an entity that changed."""
+    from footycollect.collection.tasks import sync_feed_entries_for_entity_task
+
+    try:
+        sync_feed_entries_for_entity_task.delay(entity, pk)
+    except Exception:
+        logger.exception("Could not queue feed entry refresh for %s %s", entity, pk)
+
+
+def hydrate_feed_entries(entries: Iterable[FeedEntry]) -> list[Jersey]:
+    """Load the jerseys of a page of feed entries for rendering, in the entries' order."""
+    ids = [entry.jersey_id for entry in entries]
+    if not ids:
+        return []
+    jerseys = (
+        Jersey.objects.select_related(
+            "base_item",
+            "base_item__user",
+            "base_item__club",
+            "base_item__season",
+            "base_item__brand",
+            "base_item__main_color",
+            "size",
+            "kit",
+            "kit__type",
+        )
+        .prefetch_related(
+            "base_item__competitions",
+            "base_item__photos",
+            "base_item__secondary_colors",
+        )
+        .in_bulk(ids)
+    )
+    return [jerseys[pk] for pk in ids if pk in jerseys]
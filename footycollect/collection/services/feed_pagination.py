@@ -0,0 +1,171 @@
+"""
+Keyset (cursor) pagination for the global kits feed.
+
+Offset pagination needs a ``COUNT(*)`` over the filtered feed and an
+``OFFSET`` that grows with page depth. Instead, each page is fetched with a
+``WHERE (sort key, id) > (last sort key, last id)`` condition and a ``LIMIT``
+of one more row than the page size, which tells whether a next page exists.
+No total count is computed.
+
+The random order starts at a per-URL point of the shuffle key space and
+wraps around: keys from the start point upwards first, then the keys below
+it. Each part is a plain range over the shuffle key index.
+
+The cursor is the sort key of the last item on the page (and, for the random
+order, which part it was in), signed so it stays opaque to clients. A cursor
+that does not match the current sort (or was tampered with) is ignored and
+the first page is returned.
+"""
+
+import operator
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from django.core import signing
+from django.db.models import Q, QuerySet
+
+from footycollect.collection.models import FeedEntry, Jersey
+
+FEED_PAGE_SIZE = 20
+CURSOR_SALT = "footycollect.feed.cursor"
+
+# The feed pages FeedEntry rows; Jersey querysets page the same way
+FeedRow = Jersey | FeedEntry
+
+# Sort type -> (field, descending) pairs of the feed ordering, ending with the
+# primary key so every row has a unique position. Must match
+# FeedFilterService.apply_sorting; "popular" uses the random order until items
+# have a view count.
+FEED_SORT_KEYS: dict[str, tuple[tuple[str, bool], ...]] = {
+    "newest": (("base_item__created_at", True), ("base_item_id", True)),
+    "random": (("base_item__shuffle_key", False), ("base_item_id", False)),
+}
+# The same orderings over FeedEntry. Must match FeedFilterService.sort_entries.
+FEED_ENTRY_SORT_KEYS: dict[str, tuple[tuple[str, bool], ...]] = {
+    "newest": (("created_at", True), ("jersey_id", True)),
+    "random": (("shuffle_key", False), ("jersey_id", False)),
+}
+SHUFFLE_SORT_KEYS = (FEED_SORT_KEYS["random"], FEED_ENTRY_SORT_KEYS["random"])
+
+
+@dataclass(frozen=True)
+class FeedPage:
+    """One page of feed items and the cursor of the page after it."""
+
+    items: list[FeedRow]
+    next_cursor: str | None
+
+    @property
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+
+class FeedCursorPaginator:
+    """Paginate an ordered feed queryset by sort key instead of offset."""
+
+    def __init__(self, page_size: int = FEED_PAGE_SIZE):
+        self.page_size = page_size
+
+    def get_sort_keys(self, queryset: QuerySet[FeedRow]) -> tuple[tuple[str, bool], ...] | None:
+        """Return the keyset for the queryset's ordering, or None if it cannot be paged by key."""
+        ordering = tuple(queryset.query.order_by)
+        for keys in (*FEED_SORT_KEYS.values(), *FEED_ENTRY_SORT_KEYS.values()):
+            if ordering == tuple(f"-{field}" if descending else field for field, descending in keys):
+                return keys
+        return None
+
+    def paginate(self, queryset: QuerySet[FeedRow], cursor: str | None = None, *, rotation: int = 0) -> FeedPage:
+        """
+        Return the page of ``queryset`` that follows ``cursor``.
+
+        Args:
+            queryset: Feed queryset ordered by ``FeedFilterService.sort_entries``
+                (or ``apply_sorting`` for Jerseys)
+            cursor: ``next_cursor`` of the previous page, or None for the first page
+            rotation: Shuffle key the random order starts at
+                (``FeedFilterService.shuffle_offset``); ignored for other orders
+
+        Returns:
+            FeedPage with at most ``page_size`` items
+        """
+        keys = self.get_sort_keys(queryset)
+        if keys is None:
+            # Orders without a unique key have no stable position to resume from
+            return FeedPage(items=list(queryset[: self.page_size]), next_cursor=None)
+
+        rotation = rotation if keys in SHUFFLE_SORT_KEYS else 0
+        phase, values = self.decode_cursor(cursor, keys) or (0, None)
+        if not rotation:
+            phase = 0
+
+        rows = self._fetch(queryset, keys, values, self._phase_condition(keys, phase, rotation), self.page_size + 1)
+        if rotation and phase == 0 and len(rows) <= self.page_size:
+            # Wrap around to the keys below the start point
+            remaining = self.page_size + 1 - len(rows)
+            rows += self._fetch(queryset, keys, None, self._phase_condition(keys, 1, rotation), remaining)
+
+        items = rows[: self.page_size]
+        next_cursor = None
+        if len(rows) > self.page_size:
+            last = [self._key_value(items[-1], field) for field, _ in keys]
+            last_phase = 1 if rotation and last[0] < rotation else 0
+            next_cursor = self.encode_cursor(keys, last, last_phase)
+        return FeedPage(items=items, next_cursor=next_cursor)
+
+    def _fetch(
+        self,
+        queryset: QuerySet[FeedRow],
+        keys: tuple[tuple[str, bool], ...],
+        values: list[Any] | None,
+        condition: Q,
+        limit: int,
+    ) -> list[FeedRow]:
+        if values is not None:
+            condition &= self._after(keys, values)
+        return list(queryset.filter(condition)[:limit])
+
+    @staticmethod
+    def _phase_condition(keys: tuple[tuple[str, bool], ...], phase: int, rotation: int) -> Q:
+        """Restrict the random order to keys from the start point up (phase 0) or below it (phase 1)."""
+        if not rotation:
+            return Q()
+        field = keys[0][0]
+        return Q(**{f"{field}__gte" if phase == 0 else f"{field}__lt": rotation})
+
+    @staticmethod
+    def _after(keys: tuple[tuple[str, bool], ...], values: list[Any]) -> Q:
+        """Build the condition for rows sorting strictly after ``values``."""
+        condition = Q()
+        for index, (field, descending) in enumerate(keys):
+            equal_prefix = {keys[i][0]: values[i] for i in range(index)}
+            lookup = "lt" if descending else "gt"
+            condition |= Q(**equal_prefix, **{f"{field}__{lookup}": values[index]})
+        return condition
+
+    @staticmethod
+    def _key_value(item: FeedRow, field: str) -> Any:
+        value = operator.attrgetter(field.replace("__", "."))(item)
+        return value.isoformat() if isinstance(value, datetime) else value
+
+    @staticmethod
+    def encode_cursor(keys: tuple[tuple[str, bool], ...], values: list[Any], phase: int = 0) -> str:
+        payload = {"k": [field for field, _ in keys], "v": values, "p": phase}
+        return signing.dumps(payload, salt=CURSOR_SALT, compress=True)
+
+    @staticmethod
+    def decode_cursor(cursor: str | None, keys: tuple[tuple[str, bool], ...]) -> tuple[int, list[Any]] | None:
+        """Return (phase, key values) stored in ``cursor``, or None if it is missing or invalid for ``keys``."""
+        if not cursor:
+            return None
+        try:
+            payload = signing.loads(cursor, salt=CURSOR_SALT)
+        except signing.BadSignature:
+            return None
+        if not isinstance(payload, dict) or payload.get("k") != [field for field, _ in keys]:
+            return None
+        values = payload.get("v")
+        phase = payload.get("p", 0)
+        if not isinstance(values, list) or len(values) != len(keys) or phase not in (0, 1):
+            return None
+        return phase, values
@@ -2,21 +2,88 @@
 Service for feed filtering and sorting logic.
 
 This service handles filtering and sorting operations for the global kits feed.
+The feed itself reads the denormalized ``FeedEntry`` table (``filter_entries``
+and ``sort_entries``); ``apply_filters`` and ``apply_sorting`` run the same
+filters over ``Jersey`` for callers that need the full item.
+
+The random order follows ``BaseItem.shuffle_key``, a stored random number
+reshuffled periodically by ``reshuffle_feed_task``. Each filter set starts the
+order at a different point of the key space (``random_seed`` and
+``shuffle_offset``), or at the point given by the ``seed`` query parameter, so
+feeds differ between listings while every page stays an index range scan. The
+seed is derived from the URL alone, so feed pages never write to the session.
 """
 
+import hashlib
+import logging
+import random
+import time
 from contextlib import suppress
 from typing import Any
 
-from django.db.models import F, Q, QuerySet
-from django.db.models.functions import Mod
+from django.db import connection
+from django.db.models import Exists, OuterRef, Q, QuerySet
 
-from footycollect.collection.models import Jersey
+from footycollect.collection.cache_utils import bump_feed_page_cache_version
+from footycollect.collection.models import SHUFFLE_KEY_SPACE, BaseItem, FeedEntry, Jersey
+from footycollect.collection.services.search_service import matching_item_ids, search_filter
+
+logger = logging.getLogger(__name__)
+
+SHUFFLE_BATCH_SIZE = 1000
+# Used when a filter set hashes to 0, which would start at the beginning of the key space
+FALLBACK_RANDOM_SEED = 123456789
+
+
+def _int_list(value) -> list[int]:
+    """Parse a list or comma-separated string of ids, skipping anything that is not a number."""
+    values = value if isinstance(value, list) else str(value).split(",")
+    ids = []
+    for item in values:
+        with suppress(ValueError, TypeError):
+            ids.append(int(str(item).strip()))
+    return ids
+
+
+def item_relation_exists(relation: str, **lookups) -> Exists:
+    """
+    Semi-join on one of BaseItem's M2M tables: does the outer row's item have a matching link?
+
+    Works for BaseItem, Jersey and FeedEntry querysets, whose primary key is the
+    item's id. Unlike filtering across the M2M join, an item linked to several
+    matching rows is returned once, so no ``.distinct()`` is needed.
+
+    Args:
+        relation: ``"competitions"`` or ``"secondary_colors"``
+        **lookups: Conditions on the link table, e.g. ``competition_id__in=[1, 2]``
+            or ``competition__slug="la-liga"``
+
+    Returns:
+        Exists expression for ``QuerySet.filter``
+    """
+    through = getattr(BaseItem, relation).through
+    return Exists(through.objects.filter(baseitem_id=OuterRef("pk"), **lookups))
+
+
+def _ids_overlap(field: str, relation: str, through_field: str, ids: list[int]) -> Q | Exists:
+    """
+    Match feed entries whose id list ``field`` contains any of ``ids``.
+
+    PostgreSQL answers this from the jsonb GIN index (``@>``); other databases
+    have no JSON containment lookup and use a semi-join on the M2M table.
+    """
+    if connection.vendor == "postgresql":
+        condition = Q()
+        for pk in ids:
+            condition |= Q(**{f"{field}__contains": [pk]})
+        return condition
+    return item_relation_exists(relation, **{f"{through_field}__in": ids})
 
 
 class FeedFilterService:
     """Service for filtering and sorting the global kits feed."""
 
-    def apply_filters(  # noqa: C901, PLR0915
+    def apply_filters(  # noqa: C901
         self, queryset: QuerySet[Jersey], filters_dict: dict[str, Any]
     ) -> QuerySet[Jersey]:
         """
@@ -59,16 +126,23 @@ class FeedFilterService:
             season = filters_dict["season"]
             queryset = queryset.filter(base_item__season__year=season)
 
-        if "competition" in filters_dict:
-            competitions = filters_dict["competition"]
-            if competitions:
-                if isinstance(competitions, list):
-                    competitions = [c for c in competitions if c]
-                    if competitions:
-                        queryset = queryset.filter(base_item__competitions__id__in=competitions).distinct()
-                else:
-                    queryset = queryset.filter(base_item__competitions__id=competitions).distinct()
+        competitions = _int_list(filters_dict.get("competition") or [])
+        if competitions:
+            queryset = queryset.filter(item_relation_exists("competitions", competition_id__in=competitions))
+
+        queryset = self._filter_kit(queryset, filters_dict)
+        queryset = self._filter_colors(queryset, filters_dict)
+
+        if "q" in filters_dict:
+            search_query = filters_dict["q"]
+            if search_query and str(search_query).strip():
+                queryset = queryset.filter(search_filter(str(search_query), prefix="base_item__"))
+
+        return queryset
 
+    @staticmethod
+    def _filter_kit(queryset: QuerySet[Jersey], filters_dict: dict[str, Any]) -> QuerySet[Jersey]:
+        """Apply the kit type, category and nameset filters of ``apply_filters``."""
         if "kit_type" in filters_dict:
             kit_type_value = filters_dict["kit_type"]
             if kit_type_value and str(kit_type_value).strip():
@@ -85,7 +159,11 @@ class FeedFilterService:
 
         if filters_dict.get("has_nameset"):
             queryset = queryset.filter(has_nameset=True)
+        return queryset
 
+    @staticmethod
+    def _filter_colors(queryset: QuerySet[Jersey], filters_dict: dict[str, Any]) -> QuerySet[Jersey]:
+        """Apply the main and secondary color filters of ``apply_filters``."""
         if "main_color" in filters_dict:
             main_color_value = filters_dict["main_color"]
             if main_color_value and str(main_color_value).strip():
@@ -95,66 +173,157 @@ class FeedFilterService:
                 except (ValueError, TypeError):
                     pass
 
-        if "secondary_color" in filters_dict:
-            secondary_colors = filters_dict["secondary_color"]
-            if isinstance(secondary_colors, list):
-                queryset = queryset.filter(base_item__secondary_colors__id__in=secondary_colors).distinct()
-            elif isinstance(secondary_colors, str) and secondary_colors:
-                try:
-                    color_ids = [int(c.strip()) for c in secondary_colors.split(",") if c.strip().isdigit()]
-                    if color_ids:
-                        queryset = queryset.filter(base_item__secondary_colors__id__in=color_ids).distinct()
-                except (ValueError, TypeError):
-                    try:
-                        color_id = int(secondary_colors)
-                        queryset = queryset.filter(base_item__secondary_colors__id=color_id).distinct()
-                    except (ValueError, TypeError):
-                        pass
-
-        if "q" in filters_dict:
-            search_query = filters_dict["q"]
-            if search_query and str(search_query).strip():
-                queryset = queryset.filter(
-                    Q(base_item__name__icontains=search_query)
-                    | Q(base_item__club__name__icontains=search_query)
-                    | Q(base_item__brand__name__icontains=search_query)
-                )
-
+        secondary_colors = _int_list(filters_dict.get("secondary_color") or [])
+        if secondary_colors:
+            queryset = queryset.filter(item_relation_exists("secondary_colors", color_id__in=secondary_colors))
         return queryset
 
-    def apply_sorting(
-        self, queryset: QuerySet[Jersey], sort_type: str = "random", seed: int | None = None
-    ) -> QuerySet[Jersey]:
+    def apply_sorting(self, queryset: QuerySet[Jersey], sort_type: str = "random") -> QuerySet[Jersey]:
         """
         Apply sorting to a Jersey queryset.
 
         Args:
             queryset: Jersey queryset to sort
             sort_type: Type of sorting ('random', 'newest', 'popular')
-            seed: Optional seed for random ordering to ensure consistent pagination
 
         Returns:
-            Sorted queryset
+            Sorted queryset. The primary key breaks ties so the feed can be
+            paged by sort key (see feed_pagination.FEED_SORT_KEYS).
+        """
+        if sort_type == "newest":
+            return queryset.order_by("-base_item__created_at", "-base_item_id")
+        if sort_type == "popular" and hasattr(queryset.model.base_item.related.related_model, "view_count"):
+            return queryset.order_by("-base_item__view_count", "-base_item_id")
+        # Random, and popular while items have no view count
+        return queryset.order_by("base_item__shuffle_key", "base_item_id")
+
+    def filter_entries(  # noqa: C901
+        self, queryset: QuerySet[FeedEntry], filters_dict: dict[str, Any]
+    ) -> QuerySet[FeedEntry]:
+        """
+        Apply filters to a FeedEntry queryset, without joins.
+
+        Takes the same filters as ``apply_filters``. Only club and brand slugs
+        and kit type names are looked up in their own tables, and free-text
+        search is a semi-join on the items' search documents.
+
+        Args:
+            queryset: FeedEntry queryset
+            filters_dict: Dictionary of filter parameters
+
+        Returns:
+            Filtered queryset
         """
-        if seed is not None:
+        if not filters_dict:
+            return queryset
+
+        country = filters_dict.get("country")
+        if country and str(country).strip():
+            queryset = queryset.filter(Q(club_country=country) | Q(country=country))
+
+        for key in ("club", "brand"):
+            value = filters_dict.get(key)
+            if value and str(value).strip():
+                try:
+                    queryset = queryset.filter(**{f"{key}_id": int(value)})
+                except (ValueError, TypeError):
+                    queryset = queryset.filter(**{f"{key}__slug": value})
+
+        if "season" in filters_dict:
+            queryset = queryset.filter(season_year=filters_dict["season"])
+
+        competitions = _int_list(filters_dict.get("competition") or [])
+        if competitions:
+            queryset = queryset.filter(_ids_overlap("competition_ids", "competitions", "competition_id", competitions))
+
+        kit_type_value = filters_dict.get("kit_type")
+        if kit_type_value and str(kit_type_value).strip():
             try:
-                seed = int(seed) % 2147483647
+                queryset = queryset.filter(kit_type_id=int(kit_type_value))
             except (ValueError, TypeError):
-                seed = None
+                queryset = queryset.filter(kit_type_name__icontains=kit_type_value)
+
+        category = filters_dict.get("category")
+        if category and str(category).strip():
+            queryset = queryset.filter(kit_category=category)
+
+        if filters_dict.get("has_nameset"):
+            queryset = queryset.filter(has_nameset=True)
+
+        main_color_value = filters_dict.get("main_color")
+        if main_color_value and str(main_color_value).strip():
+            with suppress(ValueError, TypeError):
+                queryset = queryset.filter(main_color_id=int(str(main_color_value).strip()))
+
+        secondary_colors = _int_list(filters_dict.get("secondary_color") or [])
+        if secondary_colors:
+            queryset = queryset.filter(
+                _ids_overlap("secondary_color_ids", "secondary_colors", "color_id", secondary_colors)
+            )
+
+        search_query = filters_dict.get("q")
+        if search_query and str(search_query).strip():
+            queryset = queryset.filter(jersey_id__in=matching_item_ids(str(search_query)))
+
+        return queryset
+
+    def sort_entries(self, queryset: QuerySet[FeedEntry], sort_type: str = "random") -> QuerySet[FeedEntry]:
+        """
+        Apply sorting to a FeedEntry queryset; the entry counterpart of ``apply_sorting``.
+
+        Args:
+            queryset: FeedEntry queryset to sort
+            sort_type: Type of sorting ('random', 'newest', 'popular')
 
+        Returns:
+            Sorted queryset, see feed_pagination.FEED_ENTRY_SORT_KEYS
+        """
         if sort_type == "newest":
-            return queryset.order_by("-base_item__created_at")
-        if sort_type == "popular":
-            if hasattr(queryset.model.base_item.related.related_model, "view_count"):
-                return queryset.order_by("-base_item__view_count")
-            if seed is not None:
-                return queryset.annotate(random_order=Mod(F("base_item_id") * seed, 2147483647)).order_by(
-                    "random_order"
-                )
-            return queryset.order_by("?")
-        if seed is not None:
-            return queryset.annotate(random_order=Mod(F("base_item_id") * seed, 2147483647)).order_by("random_order")
-        return queryset.order_by("?")
+            return queryset.order_by("-created_at", "-jersey_id")
+        # Random, and popular while items have no view count
+        return queryset.order_by("shuffle_key", "jersey_id")
+
+    @staticmethod
+    def random_seed(filters: dict[str, Any], sort_type: str, seed: str | None = None) -> int:
+        """
+        Return the seed of the random order for a feed URL.
+
+        Without a ``seed`` parameter the order is shared: every visitor with the
+        same filters and sort sees it, until the next reshuffle, which keeps the
+        pages cacheable. The feed's Shuffle button adds a random ``seed`` to the
+        URL for an order of the visitor's own.
+
+        Args:
+            filters: Normalized filters from ``parse_filters_from_request``
+            sort_type: Sort requested, ``"random"`` or ``"popular"``
+            seed: Value of the ``seed`` query parameter, if any
+
+        Returns:
+            The ``seed`` parameter when it is a positive number, else a seed
+            derived from the filters and sort, the same for every visitor
+        """
+        with suppress(ValueError, TypeError):
+            if int(seed) > 0:
+                return int(seed)
+        filter_str = str(sorted(filters.items())) + str(sort_type)
+        derived = int(hashlib.sha256(filter_str.encode()).hexdigest()[:8], 16) % SHUFFLE_KEY_SPACE
+        return derived or FALLBACK_RANDOM_SEED
+
+    @staticmethod
+    def shuffle_offset(seed: int | None) -> int:
+        """
+        Return where a random order starts in the shuffle key space.
+
+        Args:
+            seed: Seed from ``random_seed``; None starts at the beginning
+
+        Returns:
+            Shuffle key to start from, see ``FeedCursorPaginator.paginate``
+        """
+        try:
+            return int(seed) % SHUFFLE_KEY_SPACE
+        except (ValueError, TypeError):
+            return 0
 
     def parse_filters_from_request(self, request) -> dict[str, Any]:  # noqa: C901
         """
@@ -263,3 +432,39 @@ class FeedFilterService:
         if params:
             return f"{base_url}?{urlencode(params, doseq=True)}"
         return base_url
+
+
+def reshuffle_feed_keys(batch_size: int = SHUFFLE_BATCH_SIZE) -> int:
+    """
+    Give every public item a new random ``shuffle_key``.
+
+    Only public items appear in the feed; private items and drafts keep their
+    key until they are published. Items are walked in primary key batches, so
+    only one batch of ids is held at a time. Open feed cursors stay valid, but
+    the items after them change.
+
+    Returns:
+        Number of items reshuffled
+    """
+    started = time.monotonic()
+    reshuffled = 0
+    last_id = 0
+    while True:
+        ids = list(
+            BaseItem.objects.public().filter(id__gt=last_id).order_by("id").values_list("id", flat=True)[:batch_size]
+        )
+        if not ids:
+            break
+        items = [
+            BaseItem(id=item_id, shuffle_key=random.randrange(SHUFFLE_KEY_SPACE))  # noqa: S311
+            for item_id in ids
+        ]
+        BaseItem.objects.bulk_update(items, ["shuffle_key"])
+        FeedEntry.objects.bulk_update(
+            [FeedEntry(jersey_id=item.id, shuffle_key=item.shuffle_key) for item in items], ["shuffle_key"]
+        )
+        reshuffled += len(ids)
+        last_id = ids[-1]
+    bump_feed_page_cache_version()
+    logger.info("Reshuffled %d feed items in %.2fs", reshuffled, time.monotonic() - started)
+    return reshuffled
@@ -0,0 +1,194 @@
+"""
+Full-text search over collection items.
+
+Each ``BaseItem`` stores a search document built from its name, club, brand,
+season, player name, kit type and description:
+
+* ``search_document`` is a weighted ``tsvector`` (A: name and player name,
+  B: club and brand, C: season and kit type, D: description), matched with
+  web search syntax and ranked with ``ts_rank``.
+* ``search_text`` holds the same words, description aside, as plain text,
+  matched with pg_trgm word similarity so misspelled queries still find items.
+
+Both are GIN-indexed on PostgreSQL (``collection.migrations.0009``). Other
+databases (SQLite in tests) match every word of the query against
+``search_text`` and ``description`` with ``icontains`` and do not rank.
+
+Documents are written by ``collection.signals`` once the transaction that
+saved an item or jersey commits; edits to clubs, brands, seasons, kits and kit types are applied by a
+Celery task. ``manage.py rebuild_search_documents`` recomputes them.
+"""
+
+import logging
+import operator
+import time
+from collections.abc import Iterable
+from functools import reduce
+
+from django.db import connection
+from django.db.models import Case, F, Q, QuerySet, TextField, Value, When
+
+from footycollect.collection.models import BaseItem
+
+logger = logging.getLogger(__name__)
+
+# Club, brand and player names are not in any one language; skip stemming
+SEARCH_CONFIG = "simple"
+REBUILD_BATCH_SIZE = 1000
+
+# Entity lookup -> BaseItem lookup of the items mentioning it
+ENTITY_LOOKUPS = {
+    "club": "club",
+    "brand": "brand",
+    "season": "season",
+    "kit": "jersey__kit",
+    "kit_type": "jersey__kit__type",
+}
+
+
+def _uses_postgres() -> bool:
+    return connection.vendor == "postgresql"
+
+
+def _join(*values: str | None) -> str:
+    return " ".join(value for value in values if value)
+
+
+def build_search_parts(item: BaseItem) -> dict[str, str]:
+    """Return the item's searchable text by tsvector weight."""
+    jersey = getattr(item, "jersey", None)
+    kit = jersey.kit if jersey else None
+    kit_type = kit.type if kit else None
+    return {
+        "A": _join(item.name, jersey.player_name if jersey else ""),
+        "B": _join(item.club.name if item.club else "", item.brand.name),
+        "C": _join(item.season.year if item.season else "", kit_type.name if kit_type else ""),
+        "D": item.description,
+    }
+
+
+def _search_vector(parts: dict[str, str]):
+    from django.contrib.postgres.search import SearchVector
+
+    return reduce(
+        operator.add,
+        [SearchVector(Value(text), weight=weight, config=SEARCH_CONFIG) for weight, text in parts.items()],
+    )
+
+
+def update_search_documents(item_ids: Iterable[int]) -> int:
+    """Recompute the search documents of the given items; return how many were written."""
+    item_ids = list({int(pk) for pk in item_ids if pk is not None})
+    if not item_ids:
+        return 0
+    items = BaseItem.objects.filter(pk__in=item_ids).select_related("club", "brand", "season", "jersey__kit__type")
+    parts_by_pk = {item.pk: build_search_parts(item) for item in items}
+    if not parts_by_pk:
+        return 0
+    fields = {
+        "search_text": Case(
+            *[When(pk=pk, then=Value(_join(parts["A"], parts["B"], parts["C"]))) for pk, parts in parts_by_pk.items()],
+            output_field=TextField(),
+        ),
+    }
+    if _uses_postgres():
+        from django.contrib.postgres.search import SearchVectorField
+
+        fields["search_document"] = Case(
+            *[When(pk=pk, then=_search_vector(parts)) for pk, parts in parts_by_pk.items()],
+            output_field=SearchVectorField(),
+        )
+    # One UPDATE for the batch; update() rather than save(): no signals, no auto_now bump
+    return BaseItem.objects.filter(pk__in=parts_by_pk).update(**fields)
+
+
+def update_search_documents_for_entity(entity: str, pk: int) -> int:
+    """Recompute the search documents of every item mentioning the given club, brand, season, kit or kit type."""
+    ids = list(BaseItem.objects.filter(**{ENTITY_LOOKUPS[entity]: pk}).values_list("pk", flat=True))
+    written = 0
+    for start in range(0, len(ids), REBUILD_BATCH_SIZE):
+        written += update_search_documents(ids[start : start + REBUILD_BATCH_SIZE])
+    return written
+
+
+def rebuild_search_documents(batch_size: int = REBUILD_BATCH_SIZE, *, missing_only: bool = False) -> int:
+    """
+    Recompute search documents of all items.
+
+    Args:
+        batch_size: Number of items loaded per query
+        missing_only: Only items that have no search text yet
+
+    Returns:
+        Number of items written
+    """
+    started = time.monotonic()
+    queryset = BaseItem.objects.all()
+    if missing_only:
+        queryset = queryset.filter(search_text="")
+    ids = list(queryset.order_by("pk").values_list("pk", flat=True))
+    written = 0
+    for start in range(0, len(ids), batch_size):
+        written += update_search_documents(ids[start : start + batch_size])
+    logger.info("Rebuilt %d search documents in %.2fs", written, time.monotonic() - started)
+    return written
+
+
+def schedule_search_document_refresh(entity: str, pk: int) -> None:
+    """Queue recomputing the search documents of the items mentioning an entity that changed."""
+    from footycollect.collection.tasks import update_search_documents_for_entity_task
+
+    try:
+        update_search_documents_for_entity_task.delay(entity, pk)
+    except Exception:
+        logger.exception("Could not queue search document refresh for %s %s", entity, pk)
+
+
+def search_filter(query: str, prefix: str = "") -> Q:
+    """
+    Build the condition matching items for a free-text query.
+
+    Args:
+        query: Text typed by the user
+        prefix: Lookup path from the filtered model to BaseItem, e.g. ``"base_item__"``
+
+    Returns:
+        Q object; empty when the query is blank
+    """
+    query = query.strip()
+    if not query:
+        return Q()
+    if _uses_postgres():
+        from django.contrib.postgres.search import SearchQuery
+
+        search_query = SearchQuery(query, config=SEARCH_CONFIG, search_type="websearch")
+        return Q(**{f"{prefix}search_document": search_query}) | Q(
+            **{f"{prefix}search_text__trigram_word_similar": query}
+        )
+    condition = Q()
+    for word in query.split():
+        condition &= Q(**{f"{prefix}search_text__icontains": word}) | Q(**{f"{prefix}description__icontains": word})
+    return condition
+
+
+def matching_item_ids(query: str) -> QuerySet[BaseItem]:
+    """Return a subquery of the ids of items matching ``query``, for ``pk__in`` style filters."""
+    return BaseItem.objects.filter(search_filter(query)).values("pk")
+
+
+def order_by_relevance(queryset: QuerySet[BaseItem], query: str, *ordering: str) -> QuerySet[BaseItem]:
+    """
+    Order matches of ``query`` best first: full-text rank plus trigram similarity.
+
+    ``ordering`` breaks ties, and is the whole ordering where results are not ranked.
+    """
+    if not _uses_postgres() or not query.strip():
+        return queryset.order_by(*ordering)
+    from django.contrib.postgres.search import SearchQuery, SearchRank, TrigramWordSimilarity
+
+    query = query.strip()
+    search_query = SearchQuery(query, config=SEARCH_CONFIG, search_type="websearch")
+    queryset = queryset.annotate(
+        search_rank=SearchRank(F("search_document"), search_query) + TrigramWordSimilarity(query, "search_text"),
+    )
+    return queryset.order_by(F("search_rank").desc(nulls_last=True), *ordering)
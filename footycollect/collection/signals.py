@@ -1,8 +1,49 @@
-from django.db.models.signals import post_delete, post_save
+import threading
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
 from django.dispatch import receiver
 
-from footycollect.collection.cache_utils import invalidate_item_list_cache_for_user
+from footycollect.collection.cache_utils import bump_feed_page_cache_version, invalidate_item_list_cache_for_user
 from footycollect.collection.models import BaseItem, Jersey, Photo
+from footycollect.collection.services.facet_service import schedule_feed_facet_rebuild
+from footycollect.collection.services.feed_entry_service import schedule_feed_entry_refresh, sync_feed_entries
+from footycollect.collection.services.search_service import schedule_search_document_refresh, update_search_documents
+from footycollect.core.models import Brand, Club, Kit, Season, TypeK
+
+# Entity model -> ENTITY_LOOKUPS key of feed_entry_service and search_service
+FEED_ENTITY_MODELS = {Club: "club", Brand: "brand", Season: "season", Kit: "kit", TypeK: "kit_type"}
+
+
+class CommitBatch(threading.local):
+    """
+    Item ids changed in the current transaction, handled once after it commits.
+
+    A jersey save also saves its base item, and M2M edits follow; each adds
+    its ids here and the handler runs once for all of them.
+    Outside a transaction ``on_commit`` runs at once, so each save is handled
+    on its own. Ids left by a rolled back transaction are handled with the next
+    batch, which only re-reads their current state.
+    """
+
+    def __init__(self, handler):
+        self.handler = handler
+        self.ids = set()
+
+    def add(self, ids) -> None:
+        self.ids.update(int(pk) for pk in ids if pk is not None)
+        # Cheap to register repeatedly: the first flush takes every id, later ones find none
+        transaction.on_commit(self.flush)
+
+    def flush(self) -> None:
+        ids, self.ids = self.ids, set()
+        if ids:
+            self.handler(ids)
+
+
+feed_entry_batch = CommitBatch(sync_feed_entries)
+search_document_batch = CommitBatch(update_search_documents)
 
 
 @receiver(post_save, sender=BaseItem)
@@ -32,3 +73,65 @@ def invalidate_item_list_cache_for_photo(sender, instance, **kwargs):
 
     if user_id:
         invalidate_item_list_cache_for_user(user_id)
+
+
+@receiver(post_save, sender=BaseItem)
+@receiver(post_delete, sender=BaseItem)
+@receiver(post_save, sender=Jersey)
+@receiver(post_delete, sender=Jersey)
+@receiver(m2m_changed, sender=BaseItem.competitions.through)
+def schedule_feed_facet_rebuild_for_item(sender, instance, **kwargs):
+    transaction.on_commit(schedule_feed_facet_rebuild)
+
+
+@receiver(post_save, sender=BaseItem)
+@receiver(post_save, sender=Jersey)
+def sync_feed_entry_for_item(sender, instance, **kwargs):
+    # Deleting the item or jersey deletes its entry through the foreign key
+    feed_entry_batch.add([instance.pk])
+
+
+@receiver(post_delete, sender=BaseItem)
+@receiver(post_delete, sender=Jersey)
+def bump_feed_page_cache_for_deleted_item(sender, instance, **kwargs):
+    # The entry goes with the item through the foreign key, without a sync to bump the version
+    transaction.on_commit(bump_feed_page_cache_version)
+
+
+@receiver(post_save, sender=BaseItem)
+@receiver(post_save, sender=Jersey)
+def update_search_document_for_item(sender, instance, **kwargs):
+    search_document_batch.add([instance.pk])
+
+
+@receiver(post_save, sender=Photo)
+@receiver(post_delete, sender=Photo)
+def bump_feed_page_cache_for_photo(sender, instance, **kwargs):
+    # Feed entries hold no photo data, but cached feed pages show the photos
+    if not instance.content_type_id or not instance.object_id:
+        return
+    if ContentType.objects.get_for_id(instance.content_type_id).model_class() not in (BaseItem, Jersey):
+        return
+    if BaseItem.objects.filter(pk=instance.object_id, is_private=False, is_draft=False).exists():
+        transaction.on_commit(bump_feed_page_cache_version)
+
+
+@receiver(m2m_changed, sender=BaseItem.competitions.through)
+@receiver(m2m_changed, sender=BaseItem.secondary_colors.through)
+def sync_feed_entry_for_item_relations(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    feed_entry_batch.add((pk_set or []) if reverse else [instance.pk])
+
+
+@receiver(post_save, sender=Club)
+@receiver(post_save, sender=Brand)
+@receiver(post_save, sender=Season)
+@receiver(post_save, sender=Kit)
+@receiver(post_save, sender=TypeK)
+def schedule_feed_entry_refresh_for_entity(sender, instance, created, **kwargs):
+    if created:
+        return
+    entity = FEED_ENTITY_MODELS[sender]
+    transaction.on_commit(lambda: schedule_feed_entry_refresh(entity, instance.pk))
+    transaction.on_commit(lambda: schedule_search_document_refresh(entity, instance.pk))
@@ -12,6 +12,7 @@ import requests
 from celery import shared_task
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
 from django.core.files import File
 from django.core.management import call_command
 from django.core.management.base import CommandError
@@ -309,3 +310,64 @@ def check_item_photo_processing(item_id):
         logger.warning("Item %s does not exist", item_id)
     except Exception:
         logger.exception("Error checking photo processing for item %s", item_id)
+
+
+@shared_task
+def rebuild_feed_facet_counts_task():
+    from footycollect.collection.services.facet_service import FACET_REBUILD_PENDING_KEY, rebuild_feed_facet_counts
+
+    cache.delete(FACET_REBUILD_PENDING_KEY)
+    try:
+        rows = rebuild_feed_facet_counts()
+    except OperationalError:
+        logger.exception("Error rebuilding feed facet counts")
+        raise
+    return f"Rebuilt {rows} feed facet rows"
+
+
+@shared_task
+def reshuffle_feed_task():
+    from footycollect.collection.services.feed_service import reshuffle_feed_keys
+
+    try:
+        items = reshuffle_feed_keys()
+    except OperationalError:
+        logger.exception("Error reshuffling the feed")
+        raise
+    return f"Reshuffled {items} feed items"
+
+
+@shared_task
+def rebuild_feed_entries_task():
+    from footycollect.collection.services.feed_entry_service import rebuild_feed_entries
+
+    try:
+        entries = rebuild_feed_entries()
+    except OperationalError:
+        logger.exception("Error rebuilding feed entries")
+        raise
+    return f"Rebuilt {entries} feed entries"
+
+
+@shared_task
+def sync_feed_entries_for_entity_task(entity, pk):
+    from footycollect.collection.services.feed_entry_service import sync_feed_entries_for_entity
+
+    try:
+        entries = sync_feed_entries_for_entity(entity, pk)
+    except OperationalError:
+        logger.exception("Error syncing feed entries for %s %s", entity, pk)
+        raise
+    return f"Synced {entries} feed entries for {entity} {pk}"
+
+
+@shared_task
+def update_search_documents_for_entity_task(entity, pk):
+    from footycollect.collection.services.search_service import update_search_documents_for_entity
+
+    try:
+        items = update_search_documents_for_entity(entity, pk)
+    except OperationalError:
+        logger.exception("Error updating search documents for %s %s", entity, pk)
+        raise
+    return f"Updated {items} search documents for {entity} {pk}"
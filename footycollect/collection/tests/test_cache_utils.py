@@ -77,3 +77,22 @@ class TestCacheUtils(TestCase):
         cache.delete(cache_utils.ITEM_LIST_CACHE_METRICS_HITS_KEY)
         cache_utils.increment_item_list_cache_metric(is_hit=True)
         assert cache.get(cache_utils.ITEM_LIST_CACHE_METRICS_HITS_KEY) == 1
+
+    def test_feed_page_cache_key_separates_fragments_and_languages(self):
+        club_page = {"filters": {"club": "1"}, "sort": "newest", "offset": 0, "position": None}
+        key = cache_utils.get_feed_page_cache_key(club_page, "en")
+
+        assert key.startswith("feed_page:v0:page:en:")
+        assert cache_utils.get_feed_page_cache_key(dict(club_page), "en") == key
+        assert cache_utils.get_feed_page_cache_key(club_page, "es") != key
+        assert cache_utils.get_feed_page_cache_key(club_page, "en", fragment=True) != key
+        assert cache_utils.get_feed_page_cache_key({**club_page, "position": (0, ["x", 1])}, "en") != key
+
+    def test_bump_feed_page_cache_version_changes_keys(self):
+        random_page = {"filters": {}, "sort": "random", "offset": 7, "position": None}
+        before = cache_utils.get_feed_page_cache_key(random_page, "en")
+
+        cache_utils.bump_feed_page_cache_version()
+
+        assert cache_utils.get_feed_page_cache_key(random_page, "en") != before
+        assert cache.get(cache_utils.FEED_PAGE_CACHE_VERSION_KEY) == 1
@@ -0,0 +1,135 @@
+"""
+Tests for FeedFacetService and the FeedFacetCount table.
+"""
+
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import TestCase
+
+from footycollect.collection.factories import (
+    BrandFactory,
+    ClubFactory,
+    CompetitionFactory,
+    JerseyFactory,
+    KitFactory,
+    SeasonFactory,
+)
+from footycollect.collection.models import FeedFacetCount
+from footycollect.collection.services.facet_service import (
+    FACET_REBUILD_PENDING_KEY,
+    FeedFacetService,
+    rebuild_feed_facet_counts,
+    schedule_feed_facet_rebuild,
+)
+
+NIKE_ITEMS = 3
+NIKE_SPANISH_ITEMS = 2
+LEAGUE_ITEMS = 2
+
+
+class FacetTestMixin:
+    def setUp(self):
+        cache.clear()
+        self.service = FeedFacetService()
+        self.nike = BrandFactory(name="Nike")
+        self.adidas = BrandFactory(name="Adidas")
+        self.spanish_club = ClubFactory(name="Sevilla", country="ES")
+        self.english_club = ClubFactory(name="Fulham", country="GB")
+        self.league = CompetitionFactory(name="League")
+        self.cup = CompetitionFactory(name="Cup")
+        season = SeasonFactory(year="2023-24")
+        kit = KitFactory()
+
+        JerseyFactory(
+            base_item__brand=self.nike,
+            base_item__club=self.spanish_club,
+            base_item__season=season,
+            kit=kit,
+            competitions=[self.league, self.cup],
+        )
+        JerseyFactory(base_item__brand=self.nike, base_item__club=self.spanish_club, competitions=[self.league])
+        JerseyFactory(base_item__brand=self.nike, base_item__club=self.english_club)
+        JerseyFactory(base_item__brand=self.adidas, base_item__club=self.english_club)
+        JerseyFactory(base_item__brand=self.adidas, base_item__club=self.english_club, base_item__is_private=True)
+
+    def _counts(self, facet, filters):
+        return {option["name"]: option["count"] for option in self.service.get_facet_counts(facet, filters)}
+
+
+class TestFeedFacetServiceLive(FacetTestMixin, TestCase):
+    def test_brand_counts_skip_private_items(self):
+        assert self._counts("brand", {}) == {"Nike": NIKE_ITEMS, "Adidas": 1}
+
+    def test_counts_are_conditioned_on_other_filters(self):
+        assert self._counts("brand", {"country": "ES"}) == {"Nike": NIKE_SPANISH_ITEMS}
+
+    def test_own_filter_is_ignored(self):
+        assert self._counts("brand", {"brand": str(self.nike.id)}) == {"Nike": NIKE_ITEMS, "Adidas": 1}
+
+    def test_results_are_cached_per_filter_set(self):
+        self.service.get_facet_counts("brand", {})
+        with self.assertNumQueries(0):
+            self.service.get_facet_counts("brand", {})
+
+
+class TestFeedFacetServiceTable(FacetTestMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        rebuild_feed_facet_counts()
+
+    def test_table_counts_match_live_counts(self):
+        with patch.object(FeedFacetService, "_count_live") as mock_live:
+            assert self._counts("brand", {}) == {"Nike": NIKE_ITEMS, "Adidas": 1}
+            assert self._counts("brand", {"country": "ES"}) == {"Nike": NIKE_SPANISH_ITEMS}
+            assert self._counts("club", {"brand": str(self.nike.id)}) == {"Sevilla": NIKE_SPANISH_ITEMS, "Fulham": 1}
+            assert self._counts("competition", {}) == {"League": LEAGUE_ITEMS, "Cup": 1}
+            assert self._counts("brand", {"competition": [self.league.id]}) == {"Nike": LEAGUE_ITEMS}
+            assert sum(self._counts("season", {"brand": str(self.nike.id)}).values()) == NIKE_ITEMS
+        mock_live.assert_not_called()
+
+    def test_multi_item_competition_counts_each_item_once(self):
+        assert self._counts("club", {}) == {"Sevilla": NIKE_SPANISH_ITEMS, "Fulham": 2}
+
+    def test_unsupported_filters_use_live_counts(self):
+        with patch.object(FeedFacetService, "_count_from_table") as mock_table:
+            assert self._counts("brand", {"has_nameset": True}) == {}
+            assert self._counts("brand", {"competition": [self.league.id, self.cup.id]}) == {"Nike": LEAGUE_ITEMS}
+        mock_table.assert_not_called()
+
+    def test_rebuild_bumps_cache_version(self):
+        assert self._counts("brand", {}) == {"Nike": NIKE_ITEMS, "Adidas": 1}
+        JerseyFactory(base_item__brand=self.adidas)
+        rebuild_feed_facet_counts()
+        assert self._counts("brand", {}) == {"Nike": NIKE_ITEMS, "Adidas": 2}
+
+    def test_rebuild_replaces_rows(self):
+        rows = FeedFacetCount.objects.count()
+        assert rebuild_feed_facet_counts() == rows
+        assert FeedFacetCount.objects.count() == rows
+
+
+class TestScheduleFeedFacetRebuild(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    @patch("footycollect.collection.tasks.rebuild_feed_facet_counts_task.apply_async")
+    def test_schedules_one_rebuild_per_delay(self, mock_apply_async):
+        schedule_feed_facet_rebuild()
+        schedule_feed_facet_rebuild()
+
+        mock_apply_async.assert_called_once()
+        assert cache.get(FACET_REBUILD_PENDING_KEY)
+
+    @patch("footycollect.collection.tasks.rebuild_feed_facet_counts_task.apply_async", side_effect=OSError)
+    def test_clears_pending_flag_when_queueing_fails(self, mock_apply_async):
+        schedule_feed_facet_rebuild()
+
+        assert cache.get(FACET_REBUILD_PENDING_KEY) is None
+
+    @patch("footycollect.collection.signals.schedule_feed_facet_rebuild")
+    def test_item_changes_schedule_rebuild_on_commit(self, mock_schedule):
+        with self.captureOnCommitCallbacks(execute=True):
+            JerseyFactory()
+
+        mock_schedule.assert_called()
@@ -0,0 +1,227 @@
+"""
+Tests for the FeedEntry read model and its sync.
+"""
+
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from footycollect.collection.factories import (
+    ClubFactory,
+    CompetitionFactory,
+    JerseyFactory,
+    PhotoFactory,
+    SeasonFactory,
+)
+from footycollect.collection.models import Color, FeedEntry
+from footycollect.collection.services.feed_entry_service import (
+    hydrate_feed_entries,
+    rebuild_feed_entries,
+    sync_feed_entries,
+    sync_feed_entries_for_entity,
+)
+from footycollect.collection.services.feed_service import FeedFilterService
+from footycollect.collection.signals import feed_entry_batch
+
+PUBLIC = {"base_item__is_private": False, "base_item__is_draft": False}
+
+
+class TestFeedEntrySync(TestCase):
+    def test_public_jersey_gets_entry(self):
+        club = ClubFactory(name="Sevilla", country="ES")
+        season = SeasonFactory(year="2023-24")
+        with self.captureOnCommitCallbacks(execute=True):
+            jersey = JerseyFactory(base_item__club=club, base_item__season=season, has_nameset=True, **PUBLIC)
+
+        entry = FeedEntry.objects.get(jersey=jersey)
+
+        assert entry.club_id == club.pk
+        assert entry.club_country == "ES"
+        assert entry.season_year == "2023-24"
+        assert entry.brand_id == jersey.base_item.brand_id
+        assert entry.has_nameset is True
+        assert entry.shuffle_key == jersey.base_item.shuffle_key
+        assert entry.created_at == jersey.base_item.created_at
+
+    def test_private_and_draft_jerseys_have_no_entry(self):
+        private = JerseyFactory(base_item__is_private=True, base_item__is_draft=False)
+        draft = JerseyFactory(base_item__is_private=False, base_item__is_draft=True)
+
+        assert not FeedEntry.objects.filter(jersey__in=[private, draft]).exists()
+
+    def test_making_item_private_removes_entry(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            jersey = JerseyFactory(**PUBLIC)
+        assert FeedEntry.objects.filter(jersey=jersey).exists()
+
+        jersey.base_item.is_private = True
+        with self.captureOnCommitCallbacks(execute=True):
+            jersey.base_item.save()
+
+        assert not FeedEntry.objects.filter(jersey=jersey).exists()
+
+    def test_deleting_item_removes_entry(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            jersey = JerseyFactory(**PUBLIC)
+        jersey.base_item.delete()
+
+        assert not FeedEntry.objects.exists()
+
+    def test_competitions_and_secondary_colors_are_stored_as_ids(self):
+        league = CompetitionFactory()
+        cup = CompetitionFactory()
+        color = Color.objects.create(name="RED", hex_value="#FF0000")
+        with self.captureOnCommitCallbacks(execute=True):
+            jersey = JerseyFactory(competitions=[cup, league], **PUBLIC)
+            jersey.base_item.secondary_colors.add(color)
+
+        entry = FeedEntry.objects.get(jersey=jersey)
+        assert entry.competition_ids == sorted([league.pk, cup.pk])
+        assert entry.secondary_color_ids == [color.pk]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            jersey.base_item.competitions.remove(cup)
+        entry.refresh_from_db()
+        assert entry.competition_ids == [league.pk]
+
+    def test_photo_on_public_item_renders_cached_pages_again(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            jersey = JerseyFactory(**PUBLIC)
+
+        with (
+            patch("footycollect.collection.signals.bump_feed_page_cache_version") as mock_bump,
+            patch.object(feed_entry_batch, "handler") as mock_sync,
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            PhotoFactory(content_object=jersey.base_item)
+
+        mock_bump.assert_called_once_with()
+        mock_sync.assert_not_called()
+
+    def test_sync_feed_entries_ignores_unknown_ids(self):
+        assert sync_feed_entries([None, 999999]) == 0
+
+    def test_changes_in_one_transaction_sync_once(self):
+        with patch.object(feed_entry_batch, "handler") as mock_sync, self.captureOnCommitCallbacks(execute=True):
+            jersey = JerseyFactory(**PUBLIC)
+            jersey.base_item.competitions.add(CompetitionFactory())
+            jersey.save()
+
+        mock_sync.assert_called_once_with({jersey.pk})
+
+    @patch("footycollect.collection.signals.schedule_feed_entry_refresh")
+    def test_entity_change_schedules_refresh_on_commit(self, mock_schedule):
+        club = ClubFactory()
+        with self.captureOnCommitCallbacks(execute=True):
+            club.name = "Renamed"
+            club.save()
+
+        mock_schedule.assert_called_once_with("club", club.pk)
+
+    def test_sync_for_entity_updates_copied_columns(self):
+        club = ClubFactory(country="ES")
+        with self.captureOnCommitCallbacks(execute=True):
+            jersey = JerseyFactory(base_item__club=club, **PUBLIC)
+        club.country = "PT"
+        with patch("footycollect.collection.signals.schedule_feed_entry_refresh"):
+            club.save()
+
+        assert sync_feed_entries_for_entity("club", club.pk) == 1
+        assert FeedEntry.objects.get(jersey=jersey).club_country == "PT"
+
+
+class TestRebuildFeedEntries(TestCase):
+    def test_rebuild_restores_missing_and_drops_stale_entries(self):
+        public = JerseyFactory(**PUBLIC)
+        private = JerseyFactory(base_item__is_private=True, base_item__is_draft=False)
+        FeedEntry.objects.all().delete()
+        FeedEntry.objects.create(
+            jersey=private,
+            user_id=private.base_item.user_id,
+            brand_id=private.base_item.brand_id,
+            created_at=private.base_item.created_at,
+            shuffle_key=0,
+        )
+
+        assert rebuild_feed_entries(batch_size=1) == 1
+        assert list(FeedEntry.objects.values_list("jersey_id", flat=True)) == [public.pk]
+
+    def test_command_rebuilds_entries(self):
+        JerseyFactory.create_batch(2, **PUBLIC)
+        FeedEntry.objects.all().delete()
+        out = StringIO()
+
+        call_command("rebuild_feed_entries", stdout=out)
+
+        assert FeedEntry.objects.count() == 2  # noqa: PLR2004
+        assert "Rebuilt 2 feed entries" in out.getvalue()
+
+    def test_command_if_empty_skips_built_table(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            JerseyFactory.create_batch(2, **PUBLIC)
+        FeedEntry.objects.first().delete()
+        out = StringIO()
+
+        call_command("rebuild_feed_entries", "--if-empty", stdout=out)
+
+        assert FeedEntry.objects.count() == 1
+        assert "skipping" in out.getvalue()
+
+    def test_hydrate_keeps_entry_order(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            first, second = JerseyFactory.create_batch(2, **PUBLIC)
+        entries = [FeedEntry.objects.get(jersey=second), FeedEntry.objects.get(jersey=first)]
+
+        assert [jersey.pk for jersey in hydrate_feed_entries(entries)] == [second.pk, first.pk]
+
+
+class TestFeedFilterServiceFilterEntries(TestCase):
+    def setUp(self):
+        self.service = FeedFilterService()
+
+    def _filtered_ids(self, filters):
+        return set(self.service.filter_entries(FeedEntry.objects.all(), filters).values_list("jersey_id", flat=True))
+
+    def test_filter_by_any_of_several_competitions(self):
+        league = CompetitionFactory()
+        cup = CompetitionFactory()
+        with self.captureOnCommitCallbacks(execute=True):
+            in_league = JerseyFactory(competitions=[league], **PUBLIC)
+            in_both = JerseyFactory(competitions=[league, cup], **PUBLIC)
+            JerseyFactory(**PUBLIC)
+
+        assert self._filtered_ids({"competition": [league.pk, cup.pk]}) == {in_league.pk, in_both.pk}
+
+    def test_filter_by_secondary_color_string(self):
+        red = Color.objects.create(name="RED", hex_value="#FF0000")
+        with self.captureOnCommitCallbacks(execute=True):
+            jersey = JerseyFactory(**PUBLIC)
+            jersey.base_item.secondary_colors.add(red)
+            JerseyFactory(**PUBLIC)
+
+        assert self._filtered_ids({"secondary_color": f"{red.pk}"}) == {jersey.pk}
+
+    def test_filter_by_season_and_search(self):
+        season = SeasonFactory(year="1998-99")
+        with self.captureOnCommitCallbacks(execute=True):
+            jersey = JerseyFactory(base_item__season=season, base_item__name="Treble shirt", **PUBLIC)
+            JerseyFactory(**PUBLIC)
+
+        assert self._filtered_ids({"season": "1998-99"}) == {jersey.pk}
+        assert self._filtered_ids({"q": "treble"}) == {jersey.pk}
+
+    def test_filter_by_club_slug(self):
+        club = ClubFactory(slug="sevilla-fc")
+        with self.captureOnCommitCallbacks(execute=True):
+            jersey = JerseyFactory(base_item__club=club, **PUBLIC)
+            JerseyFactory(**PUBLIC)
+
+        assert self._filtered_ids({"club": "sevilla-fc"}) == {jersey.pk}
+
+    def test_sort_entries_orders_by_shuffle_key_or_newest(self):
+        queryset = FeedEntry.objects.all()
+
+        assert self.service.sort_entries(queryset, "random").query.order_by == ("shuffle_key", "jersey_id")
+        assert self.service.sort_entries(queryset, "newest").query.order_by == ("-created_at", "-jersey_id")
@@ -0,0 +1,77 @@
+"""
+Tests for keyset pagination of the global kits feed.
+"""
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from footycollect.collection.factories import JerseyFactory
+from footycollect.collection.models import Jersey
+from footycollect.collection.services.feed_pagination import FeedCursorPaginator
+from footycollect.collection.services.feed_service import FeedFilterService
+
+ITEM_COUNT = 7
+PAGE_SIZE = 3
+
+
+class TestFeedCursorPaginator(TestCase):
+    def setUp(self):
+        JerseyFactory.create_batch(ITEM_COUNT, base_item__is_private=False, base_item__is_draft=False)
+        self.service = FeedFilterService()
+        self.paginator = FeedCursorPaginator(PAGE_SIZE)
+
+    def _walk(self, queryset, rotation=0):
+        ids, cursor = [], None
+        while True:
+            page = self.paginator.paginate(queryset, cursor, rotation=rotation)
+            ids.extend(item.pk for item in page.items)
+            if not page.has_next:
+                return ids
+            cursor = page.next_cursor
+
+    def test_newest_pages_follow_the_full_ordering(self):
+        queryset = self.service.apply_sorting(Jersey.objects.all(), "newest")
+
+        assert self._walk(queryset) == list(queryset.values_list("pk", flat=True))
+
+    def test_random_pages_follow_the_shuffle_order(self):
+        queryset = self.service.apply_sorting(Jersey.objects.all(), "random")
+
+        assert self._walk(queryset) == list(queryset.values_list("pk", flat=True))
+
+    def test_rotated_random_pages_wrap_around_once(self):
+        queryset = self.service.apply_sorting(Jersey.objects.all(), "random")
+        ordered = list(queryset.values_list("pk", "base_item__shuffle_key"))
+        rotation = ordered[ITEM_COUNT // 2][1]
+        expected = [pk for pk, key in ordered if key >= rotation] + [pk for pk, key in ordered if key < rotation]
+
+        assert self._walk(queryset, rotation=rotation) == expected
+
+    def test_pages_do_not_count(self):
+        queryset = self.service.apply_sorting(Jersey.objects.all(), "newest")
+        cursor = self.paginator.paginate(queryset).next_cursor
+
+        with CaptureQueriesContext(connection) as queries:
+            self.paginator.paginate(queryset, cursor)
+
+        assert len(queries) == 1
+        assert "COUNT(" not in queries[0]["sql"].upper()
+        assert "OFFSET" not in queries[0]["sql"].upper()
+
+    def test_invalid_or_foreign_cursor_returns_first_page(self):
+        newest = self.service.apply_sorting(Jersey.objects.all(), "newest")
+        random = self.service.apply_sorting(Jersey.objects.all(), "random")
+        first_page = [item.pk for item in self.paginator.paginate(newest).items]
+        random_cursor = self.paginator.paginate(random).next_cursor
+
+        for cursor in ("garbage", random_cursor):
+            assert [item.pk for item in self.paginator.paginate(newest, cursor).items] == first_page
+
+    def test_unkeyed_order_has_no_next_cursor(self):
+        queryset = Jersey.objects.order_by("?")
+
+        page = self.paginator.paginate(queryset)
+
+        assert len(page.items) == PAGE_SIZE
+        assert page.next_cursor is None
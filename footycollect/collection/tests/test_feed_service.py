@@ -9,13 +9,14 @@ from django.test import TestCase
 from footycollect.collection.factories import (
     BrandFactory,
     ClubFactory,
+    CompetitionFactory,
     JerseyFactory,
     KitFactory,
     SeasonFactory,
     TypeKFactory,
 )
-from footycollect.collection.models import Jersey
-from footycollect.collection.services.feed_service import FeedFilterService
+from footycollect.collection.models import SHUFFLE_KEY_SPACE, BaseItem, FeedEntry, Jersey
+from footycollect.collection.services.feed_service import FeedFilterService, reshuffle_feed_keys
 
 
 class TestFeedFilterServiceApplyFilters(TestCase):
@@ -97,7 +98,8 @@ class TestFeedFilterServiceApplyFilters(TestCase):
 
     def test_apply_filters_search_q(self):
         brand = BrandFactory(name="UniqueBrandName")
-        j = JerseyFactory(base_item__brand=brand, base_item__name="UniqueBrandName Jersey")
+        with self.captureOnCommitCallbacks(execute=True):
+            j = JerseyFactory(base_item__brand=brand, base_item__name="UniqueBrandName Jersey")
         filtered = self.service.apply_filters(self.base_qs, {"q": "UniqueBrandName"})
         assert j in filtered
 
@@ -118,6 +120,19 @@ class TestFeedFilterServiceApplyFilters(TestCase):
         filtered = self.service.apply_filters(self.base_qs, {"main_color": str(color.id)})
         assert j in filtered
 
+    def test_apply_filters_competitions_use_semi_join_without_distinct(self):
+        league = CompetitionFactory()
+        cup = CompetitionFactory()
+        in_both = JerseyFactory(competitions=[league, cup])
+        JerseyFactory()
+
+        filtered = self.service.apply_filters(self.base_qs, {"competition": [league.id, cup.id]})
+
+        sql = str(filtered.query).upper()
+        assert "EXISTS" in sql
+        assert "DISTINCT" not in sql
+        assert list(filtered) == [in_both]
+
     def test_apply_filters_secondary_color_list(self):
         from footycollect.collection.models import Color
 
@@ -175,22 +190,34 @@ class TestFeedFilterServiceApplySorting(TestCase):
         result = self.service.apply_sorting(self.qs, sort_type="newest")
         assert "base_item__created_at" in str(result.query.order_by)
 
-    def test_apply_sorting_random_with_seed_uses_annotate(self):
-        result = self.service.apply_sorting(self.qs, sort_type="random", seed=42)
-        assert "random_order" in str(result.query)
-
-    def test_apply_sorting_random_without_seed_orders_by_random(self):
+    def test_apply_sorting_random_orders_by_shuffle_key(self):
         result = self.service.apply_sorting(self.qs, sort_type="random")
-        assert "?" in str(result.query.order_by) or "random" in str(result.query).lower()
+        assert result.query.order_by == ("base_item__shuffle_key", "base_item_id")
+
+    def test_apply_sorting_popular_without_view_count_uses_random_order(self):
+        result = self.service.apply_sorting(self.qs, sort_type="popular")
+        assert result.query.order_by == ("base_item__shuffle_key", "base_item_id")
+
+    def test_shuffle_offset_wraps_seed_into_key_space(self):
+        assert self.service.shuffle_offset(42) == 42  # noqa: PLR2004
+        assert 0 <= self.service.shuffle_offset(99999999999) < SHUFFLE_KEY_SPACE
+
+    def test_shuffle_offset_invalid_seed_starts_at_zero(self):
+        assert self.service.shuffle_offset("not-a-number") == 0
+        assert self.service.shuffle_offset(None) == 0
+
 
-    def test_apply_sorting_invalid_seed_coerced_to_none(self):
-        result = self.service.apply_sorting(self.qs, sort_type="random", seed="not-a-number")
-        # Should behave like random without seed
-        assert "?" in str(result.query.order_by) or "random" in str(result.query).lower()
+class TestReshuffleFeedKeys(TestCase):
+    def test_reshuffle_assigns_new_keys(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            jerseys = JerseyFactory.create_batch(3, base_item__is_private=False, base_item__is_draft=False)
+        private = JerseyFactory(base_item__is_private=True, base_item__is_draft=False)
+        BaseItem.objects.update(shuffle_key=0)
 
-    def test_apply_sorting_seed_modulo(self):
-        result = self.service.apply_sorting(self.qs, sort_type="random", seed=99999999999)
-        assert "random_order" in str(result.query) or "?" in str(result.query)
+        assert reshuffle_feed_keys(batch_size=2) == len(jerseys)
+        assert list(BaseItem.objects.filter(shuffle_key=0).values_list("pk", flat=True)) == [private.pk]
+        for entry in FeedEntry.objects.select_related("jersey__base_item"):
+            assert entry.shuffle_key == entry.jersey.base_item.shuffle_key
 
 
 class TestFeedFilterServiceParseFiltersFromRequest(TestCase):
@@ -17,6 +17,7 @@ from django.test import TestCase
 from footycollect.collection.management.commands.cleanup_orphaned_photos import (
     Command as CleanupOrphanedPhotosCommand,
 )
+from footycollect.collection.management.commands.explain_feed_queries import find_sequential_scans
 from footycollect.collection.management.commands.fetch_home_kits import (
     Command as FetchHomeKitsCommand,
 )
@@ -533,3 +534,47 @@ class TestFetchHomeKitsCommandIntegration:
         call_command("fetch_home_kits", stdout=out)
         output = out.getvalue()
         assert "Failed to fetch" in output
+
+
+EXPLAIN_SEED_ITEMS = 30
+
+
+class TestExplainFeedQueriesCommand(TestCase):
+    def test_find_sequential_scans_flags_only_large_tables(self):
+        postgres_plan = (
+            "Limit\n  ->  Seq Scan on collection_feedentry\n  ->  Seq Scan on core_brand\n"
+            "  ->  Index Scan using baseitem_public_created_idx on collection_baseitem"
+        )
+        sqlite_plan = "SCAN collection_baseitem\nSCAN collection_feedentry USING INDEX feedentry_newest_idx"
+
+        assert find_sequential_scans(postgres_plan, "postgresql") == ["collection_feedentry"]
+        assert find_sequential_scans(sqlite_plan, "sqlite") == ["collection_baseitem"]
+        assert find_sequential_scans(postgres_plan, "mysql") == []
+
+    def test_seeded_run_explains_every_query_and_rolls_back(self):
+        from footycollect.collection.models import BaseItem, FeedEntry
+
+        out = StringIO()
+        call_command("explain_feed_queries", "--seed", str(EXPLAIN_SEED_ITEMS), stdout=out)
+
+        output = out.getvalue()
+        for name in ("feed newest", "feed random by brand", "feed by competition", "user collection"):
+            assert f"{name}:" in output
+        assert not BaseItem.objects.exists()
+        assert not FeedEntry.objects.exists()
+
+    def test_compare_distinct_reports_both_variants(self):
+        out = StringIO()
+        call_command(
+            "explain_feed_queries",
+            "--seed",
+            str(EXPLAIN_SEED_ITEMS),
+            "--compare-distinct",
+            "--repeat",
+            "1",
+            stdout=out,
+        )
+
+        output = out.getvalue()
+        assert "semi-join: median" in output
+        assert "join + distinct: median" in output
@@ -116,7 +116,8 @@ class TestItemRepositoryClean(TestCase):
         self.jersey.is_draft = False
         self.jersey.is_private = False
         self.jersey.description = "Test jersey description"
-        self.jersey.save()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.jersey.save()
 
         items = self.repository.search_items("Test")
 
@@ -227,12 +228,12 @@ class TestItemRepositoryClean(TestCase):
         self.jersey.description = "Shared search text"
         self.jersey.is_draft = False
         self.jersey.is_private = False
-        self.jersey.save()
-
         self.other_jersey.description = "Shared search text"
         self.other_jersey.is_draft = False
         self.other_jersey.is_private = False
-        self.other_jersey.save()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.jersey.save()
+            self.other_jersey.save()
 
         items_for_user = self.repository.search_items("Shared", user=self.user)
 
@@ -0,0 +1,130 @@
+"""
+Tests for item search documents and free-text search.
+"""
+
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.db.models import Q
+from django.test import TestCase
+
+from footycollect.collection.factories import (
+    ClubFactory,
+    JerseyFactory,
+    KitFactory,
+    SeasonFactory,
+    TypeKFactory,
+)
+from footycollect.collection.models import BaseItem, FeedEntry, Jersey
+from footycollect.collection.repositories import ItemRepository
+from footycollect.collection.services.feed_service import FeedFilterService
+from footycollect.collection.services.search_service import (
+    build_search_parts,
+    rebuild_search_documents,
+    search_filter,
+    update_search_documents,
+    update_search_documents_for_entity,
+)
+
+PUBLIC = {"base_item__is_private": False, "base_item__is_draft": False}
+
+
+class TestSearchDocuments(TestCase):
+    def test_saving_jersey_writes_search_text(self):
+        club = ClubFactory(name="Sevilla")
+        season = SeasonFactory(year="2023-24")
+        kit = KitFactory(type=TypeKFactory(name="Away"))
+        with self.captureOnCommitCallbacks(execute=True):
+            jersey = JerseyFactory(
+                base_item__name="Centenary shirt",
+                base_item__club=club,
+                base_item__season=season,
+                kit=kit,
+                player_name="Navas",
+            )
+
+        text = BaseItem.objects.get(pk=jersey.pk).search_text
+        for word in ("Centenary", "Navas", "Sevilla", jersey.base_item.brand.name, "2023-24", "Away"):
+            assert word in text
+
+    def test_update_writes_several_items_in_one_query(self):
+        jerseys = JerseyFactory.create_batch(3)
+        BaseItem.objects.update(search_text="")
+
+        # One SELECT for the items, one UPDATE for all of them
+        with self.assertNumQueries(2):
+            assert update_search_documents([jersey.pk for jersey in jerseys]) == len(jerseys)
+
+        for jersey in jerseys:
+            assert jersey.base_item.name in BaseItem.objects.get(pk=jersey.pk).search_text
+
+    def test_search_parts_are_weighted_by_field(self):
+        jersey = JerseyFactory(base_item__description="Worn once", player_name="Navas")
+
+        parts = build_search_parts(BaseItem.objects.get(pk=jersey.pk))
+
+        assert "Navas" in parts["A"]
+        assert jersey.base_item.brand.name in parts["B"]
+        assert parts["D"] == "Worn once"
+
+    def test_update_for_entity_picks_up_renamed_club(self):
+        club = ClubFactory(name="Old name")
+        jersey = JerseyFactory(base_item__club=club)
+        club.name = "New name"
+        with (
+            patch("footycollect.collection.signals.schedule_feed_entry_refresh"),
+            patch("footycollect.collection.signals.schedule_search_document_refresh") as mock_schedule,
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            club.save()
+
+        mock_schedule.assert_called_once_with("club", club.pk)
+        assert update_search_documents_for_entity("club", club.pk) == 1
+        assert "New name" in BaseItem.objects.get(pk=jersey.pk).search_text
+
+    def test_rebuild_missing_only_skips_indexed_items(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            indexed, missing = JerseyFactory.create_batch(2)
+        BaseItem.objects.filter(pk=missing.pk).update(search_text="")
+        out = StringIO()
+
+        call_command("rebuild_search_documents", "--missing-only", stdout=out)
+
+        assert "Rebuilt 1 search documents" in out.getvalue()
+        assert BaseItem.objects.get(pk=missing.pk).search_text
+        assert rebuild_search_documents() == BaseItem.objects.count()
+
+
+class TestSearchFilter(TestCase):
+    def test_every_word_must_match_some_field(self):
+        club = ClubFactory(name="Sevilla")
+        season = SeasonFactory(year="2023-24")
+        with self.captureOnCommitCallbacks(execute=True):
+            match = JerseyFactory(base_item__club=club, base_item__season=season)
+            JerseyFactory(base_item__club=club, base_item__season=None)
+
+        matches = Jersey.objects.filter(search_filter("sevilla 2023", prefix="base_item__"))
+
+        assert set(matches.values_list("pk", flat=True)) == {match.pk}
+
+    def test_blank_query_adds_no_condition(self):
+        assert search_filter("   ") == Q()
+
+    def test_repository_search_matches_club_name(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            jersey = JerseyFactory(base_item__club=ClubFactory(name="Fulham"), **PUBLIC)
+            JerseyFactory(**PUBLIC)
+
+        items = ItemRepository().search_items("fulham")
+
+        assert [item.pk for item in items] == [jersey.pk]
+
+    def test_feed_entries_filter_by_search(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            jersey = JerseyFactory(player_name="Navas", **PUBLIC)
+            JerseyFactory(**PUBLIC)
+
+        entries = FeedFilterService().filter_entries(FeedEntry.objects.all(), {"q": "navas"})
+
+        assert list(entries.values_list("jersey_id", flat=True)) == [jersey.pk]
@@ -1,11 +1,16 @@
 import json
 from unittest.mock import Mock, patch
 
-from django.test import RequestFactory, TestCase
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import RequestFactory, TestCase, override_settings
 from django.urls import reverse
 
-from footycollect.collection.factories import BrandFactory, ClubFactory, JerseyFactory
+from footycollect.collection.cache_utils import FEED_PAGE_CSRF_PLACEHOLDER, bump_feed_page_cache_version
+from footycollect.collection.factories import BrandFactory, ClubFactory, CompetitionFactory, JerseyFactory
 from footycollect.collection.models import Jersey
+from footycollect.collection.services.feed_pagination import FEED_PAGE_SIZE
+from footycollect.collection.services.feed_service import FALLBACK_RANDOM_SEED, FeedFilterService
 from footycollect.collection.views.feed_views import (
     FeedView,
     _build_autocomplete_initial_data,
@@ -31,60 +36,49 @@ class TestFeedViewGetQueryset(TestCase):
 
     @patch("footycollect.collection.views.feed_views.FeedFilterService")
     def test_get_queryset_excludes_private_and_draft_items(self, mock_service_cls):
-        public_jersey = JerseyFactory(base_item__is_private=False, base_item__is_draft=False)
-        private_jersey = JerseyFactory(base_item__is_private=True, base_item__is_draft=False)
-        draft_jersey = JerseyFactory(base_item__is_private=False, base_item__is_draft=True)
+        with self.captureOnCommitCallbacks(execute=True):
+            public_jersey = JerseyFactory(base_item__is_private=False, base_item__is_draft=False)
+            private_jersey = JerseyFactory(base_item__is_private=True, base_item__is_draft=False)
+            draft_jersey = JerseyFactory(base_item__is_private=False, base_item__is_draft=True)
 
         mock_service = mock_service_cls.return_value
         mock_service.parse_filters_from_request.return_value = {}
-        mock_service.apply_filters.side_effect = lambda qs, filters: qs
-        mock_service.apply_sorting.side_effect = lambda qs, sort_type, seed=None: qs
+        mock_service.filter_entries.side_effect = lambda qs, filters: qs
+        mock_service.sort_entries.side_effect = lambda qs, sort_type: qs
 
         self._set_request(SORT_NEWEST)
 
-        queryset = self.view.get_queryset()
+        entry_ids = set(self.view.get_queryset().values_list("jersey_id", flat=True))
 
-        assert public_jersey in queryset
-        assert private_jersey not in queryset
-        assert draft_jersey not in queryset
+        assert public_jersey.pk in entry_ids
+        assert private_jersey.pk not in entry_ids
+        assert draft_jersey.pk not in entry_ids
 
         mock_service.parse_filters_from_request.assert_called_once_with(self.view.request)
 
-    @patch("footycollect.collection.views.feed_views.FeedFilterService")
-    def test_get_queryset_random_uses_stable_session_seed(self, mock_service_cls):
+    def test_get_queryset_random_derives_seed_without_session(self):
         JerseyFactory()
 
-        mock_service = mock_service_cls.return_value
-        mock_service.parse_filters_from_request.return_value = {}
-        mock_service.apply_filters.side_effect = lambda qs, filters: qs
-
-        captured = {}
-
-        def fake_apply_sorting(qs, sort_type, seed=None):
-            captured["seed"] = seed
-            return qs
+        # No session on the request: any access would raise AttributeError
+        self.view.request = self.factory.get(self.url, {"sort": SORT_RANDOM})
 
-        mock_service.apply_sorting.side_effect = fake_apply_sorting
+        queryset = self.view.get_queryset()
 
-        request = self.factory.get(self.url, {"sort": SORT_RANDOM})
-        request.session = {}
-        self.view.request = request
+        assert queryset.query.order_by == ("shuffle_key", "jersey_id")
+        seed = FeedFilterService.random_seed({}, SORT_RANDOM)
+        assert self.view.shuffle_offset == FeedFilterService.shuffle_offset(seed)
 
+        offset = self.view.shuffle_offset
         self.view.get_queryset()
 
-        assert "seed" in captured
-        seed_value = captured["seed"]
-        assert isinstance(seed_value, int)
+        assert self.view.shuffle_offset == offset
 
-        seed_keys = [key for key in request.session if key.startswith("feed_random_seed_")]
-        assert len(seed_keys) == 1
-        assert request.session[seed_keys[0]] == seed_value
+    def test_get_queryset_random_uses_seed_parameter(self):
+        self.view.request = self.factory.get(self.url, {"sort": SORT_RANDOM, "seed": "4242"})
 
-        captured.clear()
         self.view.get_queryset()
 
-        assert captured["seed"] == seed_value
-        assert request.session[seed_keys[0]] == seed_value
+        assert self.view.shuffle_offset == FeedFilterService.shuffle_offset(4242)
 
 
 class TestFeedViewContext(TestCase):
@@ -141,6 +135,144 @@ class TestFeedViewContext(TestCase):
         assert json.loads(context["autocomplete_initial_data"]) == autocomplete_initial
 
 
+class TestFeedViewPagination(TestCase):
+    def test_feed_pages_by_cursor(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            JerseyFactory.create_batch(FEED_PAGE_SIZE + 1, base_item__is_private=False, base_item__is_draft=False)
+        url = reverse(FEED_URL_NAME)
+
+        first = self.client.get(url, {"sort": SORT_NEWEST})
+        assert first.context["has_next"] is True
+        assert "page_obj" not in first.context
+
+        second = self.client.get(url, {"sort": SORT_NEWEST, "cursor": first.context["next_cursor"]})
+        first_ids = {item.pk for item in first.context["items"]}
+        second_ids = {item.pk for item in second.context["items"]}
+        assert len(first_ids) == FEED_PAGE_SIZE
+        assert len(second_ids) == 1
+        assert not first_ids & second_ids
+        assert second.context["has_next"] is False
+
+    def test_feed_filters_by_competition(self):
+        competition = CompetitionFactory()
+        with self.captureOnCommitCallbacks(execute=True):
+            in_competition = JerseyFactory(
+                base_item__is_private=False, base_item__is_draft=False, competitions=[competition]
+            )
+            JerseyFactory(base_item__is_private=False, base_item__is_draft=False)
+
+        response = self.client.get(reverse(FEED_URL_NAME), {"sort": SORT_NEWEST, "competition": competition.pk})
+
+        assert [item.pk for item in response.context["items"]] == [in_competition.pk]
+
+
+    def test_shuffle_button_only_for_random_order(self):
+        url = reverse(FEED_URL_NAME)
+
+        random_page = self.client.get(url, {"sort": SORT_RANDOM}).content.decode()
+        newest_page = self.client.get(url, {"sort": SORT_NEWEST}).content.decode()
+
+        assert 'onclick="shuffleFeed()"' in random_page
+        assert 'onclick="shuffleFeed()"' not in newest_page
+
+
+@override_settings(FEED_PAGE_CACHE_TIMEOUT=300)
+class TestFeedViewPageCache(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        self.url = reverse(FEED_URL_NAME)
+        with self.captureOnCommitCallbacks(execute=True):
+            JerseyFactory(base_item__name="Cached shirt", base_item__is_private=False, base_item__is_draft=False)
+
+    def tearDown(self) -> None:
+        cache.clear()
+
+    def test_anonymous_page_is_served_from_cache(self):
+        first = self.client.get(self.url, {"sort": SORT_NEWEST})
+        JerseyFactory(base_item__name="Later shirt", base_item__is_private=False, base_item__is_draft=False)
+
+        second = self.client.get(self.url, {"sort": SORT_NEWEST})
+
+        assert first.context is not None
+        assert second.context is None
+        assert "Cached shirt" in second.content.decode()
+        assert "Later shirt" not in second.content.decode()
+
+    def test_version_bump_renders_page_again(self):
+        self.client.get(self.url, {"sort": SORT_NEWEST})
+        with self.captureOnCommitCallbacks(execute=True):
+            JerseyFactory(base_item__name="Later shirt", base_item__is_private=False, base_item__is_draft=False)
+
+        bump_feed_page_cache_version()
+        response = self.client.get(self.url, {"sort": SORT_NEWEST})
+
+        assert response.context is not None
+        assert "Later shirt" in response.content.decode()
+
+    def test_cached_page_gets_visitor_csrf_token(self):
+        self.client.get(self.url, {"sort": SORT_NEWEST})
+
+        response = self.client.get(self.url, {"sort": SORT_NEWEST})
+
+        content = response.content.decode()
+        assert FEED_PAGE_CSRF_PLACEHOLDER not in content
+        assert "csrfmiddlewaretoken" in content
+
+    def test_cached_page_keeps_headers_and_is_private(self):
+        first = self.client.get(self.url, {"sort": SORT_NEWEST})
+
+        second = self.client.get(self.url, {"sort": SORT_NEWEST})
+
+        assert second.context is None
+        assert second["Content-Type"] == first["Content-Type"]
+        assert "Cookie" in second["Vary"]
+        assert "private" in second["Cache-Control"]
+
+    def test_infinite_scroll_fragment_is_cached_separately(self):
+        fragment = self.client.get(self.url, {"sort": SORT_NEWEST}, HTTP_X_REQUESTED_WITH="XMLHttpRequest")
+        page = self.client.get(self.url, {"sort": SORT_NEWEST})
+
+        assert 'id="items-grid"' in fragment.content.decode()
+        assert "<html" not in fragment.content.decode()
+        assert page.context is not None
+        assert "<html" in page.content.decode()
+
+    def test_forged_cursor_and_explicit_seed_bypass_cache(self):
+        for params in ({"sort": SORT_NEWEST, "cursor": "forged"}, {"sort": SORT_RANDOM, "seed": "12345"}):
+            self.client.get(self.url, params)
+            response = self.client.get(self.url, params)
+
+            assert response.context is not None
+
+    def test_signed_cursor_pages_are_cached(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            JerseyFactory.create_batch(FEED_PAGE_SIZE, base_item__is_private=False, base_item__is_draft=False)
+        cursor = self.client.get(self.url, {"sort": SORT_NEWEST}).context["next_cursor"]
+
+        self.client.get(self.url, {"sort": SORT_NEWEST, "cursor": cursor})
+        response = self.client.get(self.url, {"sort": SORT_NEWEST, "cursor": cursor})
+
+        assert response.context is None
+
+    def test_authenticated_pages_are_not_cached(self):
+        user = get_user_model().objects.create_user(username="viewer", password="testpass123")  # NOSONAR
+        self.client.force_login(user)
+
+        self.client.get(self.url, {"sort": SORT_NEWEST})
+        response = self.client.get(self.url, {"sort": SORT_NEWEST})
+
+        assert response.context is not None
+
+    def test_public_item_change_bumps_version(self):
+        self.client.get(self.url, {"sort": SORT_NEWEST})
+        with self.captureOnCommitCallbacks(execute=True):
+            JerseyFactory(base_item__name="Later shirt", base_item__is_private=False, base_item__is_draft=False)
+
+        response = self.client.get(self.url, {"sort": SORT_NEWEST})
+
+        assert "Later shirt" in response.content.decode()
+
+
 class TestFeedViewHelpers(TestCase):
     def test_build_filter_display_names_includes_colors_and_nameset(self):
         with (
@@ -266,26 +398,20 @@ class TestFeedViewHelperFunctions(TestCase):
     def test_feed_random_sort_seed_hash_zero_uses_fallback_seed(self):
         import hashlib
 
-        self.factory = RequestFactory()
-        self.url = reverse(FEED_URL_NAME)
-        request = self.factory.get(self.url, {"sort": SORT_RANDOM})
-        request.session = {}
-        request.user = None
-        view = FeedView()
-        view.request = request
         mock_hex = "0" * 8 + "a" * 56
         mock_sha = Mock()
         mock_sha.hexdigest.return_value = mock_hex
 
-        with (
-            patch("footycollect.collection.views.feed_views.FeedFilterService") as mock_svc,
-            patch.object(hashlib, "sha256", return_value=mock_sha),
-        ):
-            mock_svc.return_value.parse_filters_from_request.return_value = {}
-            mock_svc.return_value.apply_filters.return_value = Jersey.objects.none()
-            mock_svc.return_value.apply_sorting.return_value = Jersey.objects.none()
-            view.get_queryset()
-        assert request.session["feed_random_seed_00000000"] == 123456789  # noqa: PLR2004
+        with patch.object(hashlib, "sha256", return_value=mock_sha):
+            seed = FeedFilterService.random_seed({}, SORT_RANDOM)
+
+        assert seed == FALLBACK_RANDOM_SEED
+
+    def test_feed_random_sort_ignores_invalid_seed_parameter(self):
+        derived = FeedFilterService.random_seed({}, SORT_RANDOM)
+
+        assert FeedFilterService.random_seed({}, SORT_RANDOM, "abc") == derived
+        assert FeedFilterService.random_seed({}, SORT_RANDOM, "-5") == derived
 
     def test_get_context_data_when_not_ajax(self):
         self.factory = RequestFactory()
@@ -4,10 +4,24 @@ Feed views for displaying global kits feed with filtering capabilities.
 
 import json
 
+from django.conf import settings
+from django.contrib.messages import get_messages
+from django.core.cache import cache
 from django.db.models import QuerySet
+from django.http import HttpResponse
+from django.middleware.csrf import get_token
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from django.utils.translation import get_language
 from django.views.generic import ListView
 
-from footycollect.collection.models import Jersey
+from footycollect.collection.cache_utils import (
+    FEED_PAGE_CACHE_TIMEOUT,
+    FEED_PAGE_CSRF_PLACEHOLDER,
+    get_feed_page_cache_key,
+)
+from footycollect.collection.models import FeedEntry, Jersey
+from footycollect.collection.services.feed_entry_service import hydrate_feed_entries
+from footycollect.collection.services.feed_pagination import FEED_PAGE_SIZE, FeedCursorPaginator
 from footycollect.collection.services.feed_service import FeedFilterService
 
 
@@ -99,69 +113,139 @@ def _build_autocomplete_initial_data(filters):
 
 
 class FeedView(ListView):
-    """View for displaying global kits feed with advanced filtering."""
+    """
+    View for displaying global kits feed with advanced filtering.
+
+    Anonymous visitors with the same filters, sort, seed, cursor and language
+    get the same HTML, so their pages (and the items grid fragments fetched by
+    infinite scroll) are rendered once and shared through the cache. Keys carry
+    the feed page cache version, bumped whenever the public feed changes.
+    """
 
     model = Jersey
     template_name = "collection/feed.html"
+    fragment_template_name = "collection/_feed_items_grid.html"
     context_object_name = "items"
-    paginate_by = 20
+    # Paged by cursor in get_context_data; ListView's offset pagination stays off
+    page_size = FEED_PAGE_SIZE
+    # Where the random order starts for this URL, set by get_queryset
+    shuffle_offset = 0
+    # Shared cache key of this response, set by get for anonymous visitors
+    page_cache_key = None
+
+    def get(self, request, *args, **kwargs):
+        """Serve anonymous visitors from the shared feed page cache."""
+        self.page_cache_key = self._get_page_cache_key()
+        if self.page_cache_key is None:
+            return super().get(request, *args, **kwargs)
+
+        cached = cache.get(self.page_cache_key)
+        if cached is None:
+            response = super().get(request, *args, **kwargs)
+            response.render()
+            cached = {
+                "status": response.status_code,
+                "headers": dict(response.items()),
+                "content": response.content.decode(response.charset),
+            }
+            cache.set(self.page_cache_key, cached, self._page_cache_timeout())
+
+        # Each visitor gets a token matching their own CSRF cookie, so the
+        # response itself must not be shared by browsers or proxies
+        response = HttpResponse(
+            cached["content"].replace(FEED_PAGE_CSRF_PLACEHOLDER, get_token(request)),
+            status=cached["status"],
+            headers=cached["headers"],
+        )
+        patch_vary_headers(response, ("Cookie",))
+        patch_cache_control(response, private=True)
+        return response
+
+    def _page_cache_timeout(self) -> int:
+        return getattr(settings, "FEED_PAGE_CACHE_TIMEOUT", FEED_PAGE_CACHE_TIMEOUT)
+
+    def _is_fragment_request(self) -> bool:
+        return self.request.headers.get("X-Requested-With") == "XMLHttpRequest"
+
+    def _get_page_cache_key(self) -> str | None:
+        """
+        Return the shared cache key of this request, or None when it is rendered for the visitor alone.
 
-    def get_queryset(self) -> QuerySet[Jersey]:
+        Only URLs the feed itself links to are shared: an explicit ``seed`` or a
+        cursor that fails its signature check would let any client add cache
+        entries at will, so those requests are rendered without the cache.
+        """
+        request = self.request
+        if not self._page_cache_timeout() or request.user.is_authenticated or len(get_messages(request)):
+            return None
+        if request.GET.get("seed"):
+            return None
+        filter_service = FeedFilterService()
+        filters = filter_service.parse_filters_from_request(request)
+        sort_type = request.GET.get("sort", "random")
+        position = None
+        cursor = request.GET.get("cursor")
+        if cursor:
+            paginator = FeedCursorPaginator(self.page_size)
+            keys = paginator.get_sort_keys(filter_service.sort_entries(FeedEntry.objects.none(), sort_type))
+            position = paginator.decode_cursor(cursor, keys) if keys else None
+            if position is None:
+                return None
+        page = {
+            "filters": filters,
+            "sort": sort_type,
+            "offset": self._get_shuffle_offset(filter_service, filters, sort_type),
+            "position": position,
+        }
+        return get_feed_page_cache_key(page, get_language(), fragment=self._is_fragment_request())
+
+    def _get_shuffle_offset(self, filter_service: FeedFilterService, filters: dict, sort_type: str) -> int:
+        # "popular" falls back to the random order while items have no view count.
+        # The seed comes from the URL, not the session, so anonymous pages stay cacheable;
+        # without one the order is shared per filter set (see FeedFilterService.random_seed).
+        if sort_type not in ("random", "popular"):
+            return 0
+        seed = filter_service.random_seed(filters, sort_type, self.request.GET.get("seed"))
+        return filter_service.shuffle_offset(seed)
+
+    def get_template_names(self):
+        """Return only the items grid for infinite scroll requests."""
+        if self._is_fragment_request():
+            return [self.fragment_template_name]
+        return super().get_template_names()
+
+    def get_queryset(self) -> QuerySet[FeedEntry]:
         """
-        Get queryset of public jerseys with optimizations.
+        Get the filtered and sorted feed entries of public jerseys.
+
+        The page's jerseys are loaded in get_context_data.
 
         Returns:
-            QuerySet of public Jersey objects
+            QuerySet of FeedEntry objects
         """
-        queryset = (
-            Jersey.objects.filter(base_item__is_private=False, base_item__is_draft=False)
-            .select_related(
-                "base_item",
-                "base_item__user",
-                "base_item__club",
-                "base_item__season",
-                "base_item__brand",
-                "base_item__main_color",
-                "size",
-                "kit",
-                "kit__type",
-            )
-            .prefetch_related(
-                "base_item__competitions",
-                "base_item__photos",
-                "base_item__secondary_colors",
-            )
-        )
+        # Only the keys needed to page and load the jerseys; index-only where the filters allow
+        queryset = FeedEntry.objects.only("jersey_id", "created_at", "shuffle_key")
 
         filter_service = FeedFilterService()
         filters = filter_service.parse_filters_from_request(self.request)
-        queryset = filter_service.apply_filters(queryset, filters)
+        queryset = filter_service.filter_entries(queryset, filters)
 
         sort_type = self.request.GET.get("sort", "random")
 
-        if sort_type == "random":
-            import hashlib
-
-            filter_str = str(sorted(filters.items())) + str(sort_type)
-            seed_hash = int(hashlib.sha256(filter_str.encode()).hexdigest()[:8], 16) % 2147483647
-            if seed_hash == 0:
-                seed_hash = 123456789
-
-            seed_key = f"feed_random_seed_{hashlib.sha256(filter_str.encode()).hexdigest()[:8]}"
-
-            if not self.request.session.get(seed_key):
-                self.request.session[seed_key] = seed_hash
-                session_seed = seed_hash
-            else:
-                session_seed = self.request.session[seed_key]
-
-            return filter_service.apply_sorting(queryset, sort_type, seed=session_seed)
-
-        return filter_service.apply_sorting(queryset, sort_type)
+        self.shuffle_offset = self._get_shuffle_offset(filter_service, filters, sort_type)
+        return filter_service.sort_entries(queryset, sort_type)
 
     def get_context_data(self, **kwargs):
-        """Add filter state and other context data."""
+        """Add the current feed page, filter state and other context data."""
+        page = FeedCursorPaginator(self.page_size).paginate(
+            self.object_list,
+            self.request.GET.get("cursor"),
+            rotation=self.shuffle_offset,
+        )
+        kwargs.setdefault("object_list", hydrate_feed_entries(page.items))
         context = super().get_context_data(**kwargs)
+        context["next_cursor"] = page.next_cursor
+        context["has_next"] = page.has_next
         if self.request.headers.get("X-Requested-With") == "XMLHttpRequest":
             context["is_ajax"] = True
 
@@ -183,4 +267,7 @@ class FeedView(ListView):
         context["filter_display_names"] = _build_filter_display_names(filters)
         context["autocomplete_initial_data"] = json.dumps(_build_autocomplete_initial_data(filters))
 
+        if self.page_cache_key is not None:
+            context["csrf_token"] = FEED_PAGE_CSRF_PLACEHOLDER
+
         return context
@@ -6,6 +6,16 @@ def _media_storage(settings, tmpdir) -> None:
     settings.MEDIA_ROOT = tmpdir.strpath
 
 
+@pytest.fixture(autouse=True)
+def _fkapi_shared_state() -> None:
+    """Give every test a full FKAPI token bucket and a closed circuit breaker."""
+    from footycollect.api.circuit_breaker import CircuitBreaker
+    from footycollect.api.rate_limit import reset_local_buckets
+
+    reset_local_buckets()
+    CircuitBreaker().record_success()
+
+
 @pytest.fixture
 def user(db):
     """Create a test user."""
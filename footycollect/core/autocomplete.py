@@ -1,15 +1,25 @@
+import hashlib
 import logging
 
 from dal import autocomplete
+from django.conf import settings
+from django.core.cache import cache
 from django.utils.html import escape, format_html
-from django_countries import countries
 
+from .country_index import get_country_index
+from .entity_sync import sync_fkapi_search
 from .models import Brand, Club, Competition, Season
+from .search import DEFAULT_RESULT_LIMIT, in_order, search_entities, search_seasons
+from .season_resolution import resolve_seasons, upsert_seasons
 
 logger = logging.getLogger(__name__)
 
-DEFAULT_LOGO_URL = "https://www.footballkitarchive.com/static/logos/not_found.png"
-SEASON_PARTS_LENGTH = 2
+# Local-first autocomplete: FKAPI is called inline only when the local tables
+# return fewer than LOCAL_MIN_RESULTS matches; otherwise it is queried in the
+# background, at most once per ENRICH_INTERVAL for the same query.
+AUTOCOMPLETE_LOCAL_MIN_RESULTS = 5
+AUTOCOMPLETE_ENRICH_INTERVAL = 60 * 60
+
 AUTOCOMPLETE_LOGO_IMG = (
     '<img src="{}" alt="{}" '
     'style="width: 20px; height: 20px; margin-right: 8px; '
@@ -17,85 +27,6 @@ AUTOCOMPLETE_LOGO_IMG = (
 )
 
 
-def _logos_from_api(api_entity):
-    if isinstance(api_entity, dict):
-        logo = api_entity.get("logo") or ""
-        logo_dark = api_entity.get("logo_dark") or ""
-    else:
-        logo = logo_dark = ""
-    return logo or DEFAULT_LOGO_URL, logo_dark or DEFAULT_LOGO_URL
-
-
-def _update_brand_from_api_data(brand, brand_name, slug, logo, logo_dark):
-    """Update all brand fields from API data when the brand already exists."""
-    update_fields = []
-    if not brand.name:
-        brand.name = brand_name
-        update_fields.append("name")
-    if not brand.slug:
-        brand.slug = slug
-        update_fields.append("slug")
-    if not brand.logo or brand.logo == DEFAULT_LOGO_URL:
-        brand.logo = logo
-        update_fields.append("logo")
-    if not brand.logo_dark or brand.logo_dark == DEFAULT_LOGO_URL:
-        brand.logo_dark = logo_dark
-        update_fields.append("logo_dark")
-    if update_fields:
-        brand.save(update_fields=update_fields)
-
-
-def _update_brand_logos_from_api(brand, logo, logo_dark):
-    """Update only logo fields from API data when the brand already exists."""
-    update_fields = []
-    if not brand.logo or brand.logo == DEFAULT_LOGO_URL:
-        brand.logo = logo
-        update_fields.append("logo")
-    if not brand.logo_dark or brand.logo_dark == DEFAULT_LOGO_URL:
-        brand.logo_dark = logo_dark
-        update_fields.append("logo_dark")
-    if update_fields:
-        brand.save(update_fields=update_fields)
-
-
-def _get_or_create_brand_from_api(api_brand):
-    from django.utils.text import slugify
-
-    brand_name = api_brand.get("name") if isinstance(api_brand, dict) else api_brand
-    if not brand_name:
-        return None
-    logo, logo_dark = _logos_from_api(api_brand)
-    id_fka = api_brand.get("id") if isinstance(api_brand, dict) else None
-    slug = slugify(brand_name)
-
-    if id_fka is not None:
-        brand, created = Brand.objects.get_or_create(
-            id_fka=id_fka,
-            defaults={
-                "name": brand_name,
-                "slug": slug,
-                "logo": logo,
-                "logo_dark": logo_dark,
-            },
-        )
-        if not created:
-            _update_brand_from_api_data(brand, brand_name, slug, logo, logo_dark)
-        return brand
-
-    brand, created = Brand.objects.get_or_create(
-        name=brand_name,
-        defaults={
-            "slug": slug,
-            "logo": logo,
-            "logo_dark": logo_dark,
-            "id_fka": id_fka,
-        },
-    )
-    if not created:
-        _update_brand_logos_from_api(brand, logo, logo_dark)
-    return brand
-
-
 class Select2HtmlResultsMixin:
     def get_results(self, context):
         results = []
@@ -112,26 +43,53 @@ class Select2HtmlResultsMixin:
         return results
 
 
-class BrandAutocomplete(Select2HtmlResultsMixin, autocomplete.Select2QuerySetView):
-    """Autocomplete for brands using FKAPI external database."""
+def _local_min_results():
+    return getattr(settings, "AUTOCOMPLETE_LOCAL_MIN_RESULTS", AUTOCOMPLETE_LOCAL_MIN_RESULTS)
+
+
+def _schedule_enrichment(model, query):
+    """Queue a background FKAPI lookup for ``query`` unless one ran recently."""
+    from .tasks import enrich_autocomplete_task
+
+    query_hash = hashlib.sha256(query.lower().encode()).hexdigest()
+    key = f"autocomplete_enrich:{model._meta.label_lower}:{query_hash}"
+    interval = getattr(settings, "AUTOCOMPLETE_ENRICH_INTERVAL", AUTOCOMPLETE_ENRICH_INTERVAL)
+    if not cache.add(key, 1, interval):
+        return
+    try:
+        enrich_autocomplete_task.delay(model._meta.label, query)
+    except Exception:
+        logger.exception("Could not queue autocomplete enrichment for %s", model._meta.label)
+        cache.delete(key)
+
+
+class LocalFirstAutocompleteMixin:
+    """
+    Serve matches from the local table, using FKAPI only as a fallback.
+
+    With enough local matches the response is built from the database alone
+    and FKAPI is queried in the background to pick up new entities. With too
+    few, FKAPI is queried inline and its results follow the local ones.
+    """
 
     MIN_QUERY_LENGTH = 2
+    model = None
 
     def get_queryset(self):
-        from footycollect.api.client import FKAPIClient
-
         if not self.q or len(self.q) < self.MIN_QUERY_LENGTH:
-            return Brand.objects.none()
-        client = FKAPIClient()
-        api_results = client.search_brands(self.q)
-        brand_ids = []
-        for api_brand in api_results:
-            brand = _get_or_create_brand_from_api(api_brand)
-            if brand:
-                brand_ids.append(brand.id)
-        if not brand_ids:
-            return Brand.objects.none()
-        return Brand.objects.filter(id__in=brand_ids).order_by("name")
+            return self.model.objects.none()
+        ids = search_entities(self.model, self.q)
+        if len(ids) >= _local_min_results():
+            _schedule_enrichment(self.model, self.q)
+        else:
+            ids = list(dict.fromkeys(ids + sync_fkapi_search(self.model, self.q)))[:DEFAULT_RESULT_LIMIT]
+        return in_order(self.model, ids)
+
+
+class BrandAutocomplete(LocalFirstAutocompleteMixin, Select2HtmlResultsMixin, autocomplete.Select2QuerySetView):
+    """Autocomplete for brands, local first with FKAPI as fallback."""
+
+    model = Brand
 
     def get_result_label(self, item):
         """Return HTML with logo and name."""
@@ -161,25 +119,11 @@ class BrandAutocomplete(Select2HtmlResultsMixin, autocomplete.Select2QuerySetVie
 
 class CountryAutocomplete(autocomplete.Select2ListView):
     def get_list(self):
-        countries_list = list(countries)
-
-        if self.q:
-            countries_list = [(code, name) for code, name in countries_list if self.q.lower() in str(name).lower()]
-
-        return self.get_countries_list(countries_list)
-
-    def get_countries_list(self, countries_list):
-        return [
-            (
-                code,
-                format_html(
-                    '<i class="fi fi-{code}"></i> {name}',
-                    code=escape(code.lower()),
-                    name=escape(str(name)),
-                ),
-            )
-            for code, name in countries_list
-        ]
+        return get_country_index().search(self.q or "")
+
+    def autocomplete_results(self, results):
+        """Results are already filtered and ranked by the country index."""
+        return results
 
     def get_result_value(self, item):
         """Extract the primary value (country code) from Select2ListView items, which may be
@@ -195,72 +139,10 @@ class CountryAutocomplete(autocomplete.Select2ListView):
         return super().get(request, *args, **kwargs)
 
 
-def _country_code_from_api_club(api_club):
-    if not isinstance(api_club, dict):
-        return None
-    country = api_club.get("country")
-    if isinstance(country, dict):
-        return country.get("code") or country.get("name")
-    if isinstance(country, str):
-        return country
-    return None
-
-
-def _get_or_create_club_from_api(api_club):
-    from django.utils.text import slugify
-
-    club_name = api_club.get("name") if isinstance(api_club, dict) else api_club
-    if not club_name:
-        return None
-    logo, logo_dark = _logos_from_api(api_club)
-    country_code = _country_code_from_api_club(api_club)
-    id_fka = api_club.get("id") if isinstance(api_club, dict) else None
-    club, created = Club.objects.get_or_create(
-        name=club_name,
-        defaults={
-            "slug": slugify(club_name),
-            "logo": logo,
-            "logo_dark": logo_dark,
-            "id_fka": id_fka,
-            "country": country_code,
-        },
-    )
-    if not created:
-        updated = False
-        if not club.logo or club.logo == DEFAULT_LOGO_URL:
-            club.logo = logo
-            updated = True
-        if not club.logo_dark or club.logo_dark == DEFAULT_LOGO_URL:
-            club.logo_dark = logo_dark
-            updated = True
-        if not club.country and country_code:
-            club.country = country_code
-            updated = True
-        if updated:
-            club.save(update_fields=["logo", "logo_dark", "country"])
-    return club
-
-
-class ClubAutocomplete(Select2HtmlResultsMixin, autocomplete.Select2QuerySetView):
-    """Autocomplete for clubs using FKAPI external database."""
-
-    MIN_QUERY_LENGTH = 2
-
-    def get_queryset(self):
-        from footycollect.api.client import FKAPIClient
+class ClubAutocomplete(LocalFirstAutocompleteMixin, Select2HtmlResultsMixin, autocomplete.Select2QuerySetView):
+    """Autocomplete for clubs, local first with FKAPI as fallback."""
 
-        if not self.q or len(self.q) < self.MIN_QUERY_LENGTH:
-            return Club.objects.none()
-        client = FKAPIClient()
-        api_results = client.search_clubs(self.q)
-        club_ids = []
-        for api_club in api_results:
-            club = _get_or_create_club_from_api(api_club)
-            if club:
-                club_ids.append(club.id)
-        if not club_ids:
-            return Club.objects.none()
-        return Club.objects.filter(id__in=club_ids).order_by("name")
+    model = Club
 
     def get_result_label(self, item):
         """Return HTML with logo and name."""
@@ -273,135 +155,42 @@ class ClubAutocomplete(Select2HtmlResultsMixin, autocomplete.Select2QuerySetView
         return item.id
 
 
-def _parse_season_year_parts(season_year):
-    parts = season_year.split("-")
-    first_year = parts[0]
-    second_year = parts[1] if len(parts) == SEASON_PARTS_LENGTH else ""
-    return first_year, second_year
-
-
-def _season_info_from_season_data(season_data):
-    if isinstance(season_data, dict):
-        season_year = season_data.get("year")
-        season_id_fka = season_data.get("id")
-    else:
-        season_year = str(season_data) if season_data else None
-        season_id_fka = None
-    if not season_year:
-        return None
-    first_year, second_year = _parse_season_year_parts(season_year)
-    return {"year": season_year, "first_year": first_year, "second_year": second_year, "id_fka": season_id_fka}
-
-
-def _build_seasons_dict_from_kits(api_kits):
-    out = {}
-    for kit in api_kits:
-        season_data = kit.get("season") if isinstance(kit, dict) else None
-        if not season_data:
-            continue
-        info = _season_info_from_season_data(season_data)
-        if info and info["year"] not in out:
-            out[info["year"]] = info
-    return out
-
-
-def _add_club_seasons_to_dict(client, api_clubs, seasons_dict, limit=5):
-    for club in api_clubs[:limit]:
-        if not isinstance(club, dict) or not club.get("id"):
-            continue
-        for season_data in client.get_club_seasons(club.get("id")):
-            info = _season_info_from_season_data(season_data) if isinstance(season_data, dict) else None
-            if info and info["year"] not in seasons_dict:
-                seasons_dict[info["year"]] = info
-
-
 class SeasonAutocomplete(autocomplete.Select2QuerySetView):
-    """Autocomplete for seasons using FKAPI external database."""
+    """Autocomplete for seasons, local first with FKAPI as fallback."""
 
     MIN_QUERY_LENGTH = 2
+    CLUB_LIMIT = 5
 
     def get_queryset(self):
-        from footycollect.api.client import FKAPIClient
-
         if not self.q or len(self.q) < self.MIN_QUERY_LENGTH:
             return Season.objects.none()
+        local_ids = search_seasons(self.q)
+        if len(local_ids) >= _local_min_results():
+            return Season.objects.filter(id__in=local_ids).order_by("-first_year", "-second_year")
+        return self._get_fkapi_queryset(local_ids)
+
+    def _get_fkapi_queryset(self, local_ids):
         try:
-            client = FKAPIClient()
-            seasons_dict = _build_seasons_dict_from_kits(client.search_kits(self.q))
-            _add_club_seasons_to_dict(client, client.search_clubs(self.q), seasons_dict)
-            season_ids = []
-            for season_info in seasons_dict.values():
-                season, _ = Season.objects.get_or_create(
-                    year=season_info["year"],
-                    defaults={
-                        "first_year": season_info["first_year"],
-                        "second_year": season_info["second_year"],
-                        "id_fka": season_info["id_fka"],
-                    },
-                )
-                season_ids.append(season.id)
-            if not season_ids:
-                return Season.objects.none()
-            return Season.objects.filter(id__in=season_ids).order_by("-first_year", "-second_year")
+            season_ids = local_ids + upsert_seasons(resolve_seasons(self.q, self.CLUB_LIMIT))
         except Exception as e:
             logger.exception(
                 "Season autocomplete: FKAPI request failed (%s)",
                 type(e).__name__,
             )
+            season_ids = local_ids
+        if not season_ids:
             return Season.objects.none()
+        return Season.objects.filter(id__in=season_ids).order_by("-first_year", "-second_year")
 
     def get_result_value(self, item):
         """Return the value for the result."""
         return item.id
 
 
-def _get_or_create_competition_from_api(api_comp):
-    from django.utils.text import slugify
-
-    comp_name = api_comp.get("name") if isinstance(api_comp, dict) else api_comp
-    if not comp_name:
-        return None
-    logo, logo_dark = _logos_from_api(api_comp)
-    id_fka = api_comp.get("id") if isinstance(api_comp, dict) else None
-    competition, created = Competition.objects.get_or_create(
-        name=comp_name,
-        defaults={"slug": slugify(comp_name), "logo": logo, "logo_dark": logo_dark, "id_fka": id_fka},
-    )
-    if not created:
-        updated = False
-        if not competition.logo or competition.logo == DEFAULT_LOGO_URL:
-            competition.logo = logo
-            updated = True
-        if not competition.logo_dark or competition.logo_dark == DEFAULT_LOGO_URL:
-            competition.logo_dark = logo_dark
-            updated = True
-        if updated:
-            competition.save(update_fields=["logo", "logo_dark"])
-    return competition
-
-
-class CompetitionAutocomplete(Select2HtmlResultsMixin, autocomplete.Select2QuerySetView):
-    """Autocomplete for competitions using FKAPI external database."""
-
-    MIN_QUERY_LENGTH = 2
+class CompetitionAutocomplete(LocalFirstAutocompleteMixin, Select2HtmlResultsMixin, autocomplete.Select2QuerySetView):
+    """Autocomplete for competitions, local first with FKAPI as fallback."""
 
-    def get_queryset(self):
-        from footycollect.api.client import FKAPIClient
-
-        if not self.q or len(self.q) < self.MIN_QUERY_LENGTH:
-            return Competition.objects.none()
-        client = FKAPIClient()
-        api_results = client.search_competitions(self.q)
-        competition_ids = []
-        for api_comp in api_results:
-            comp = _get_or_create_competition_from_api(api_comp)
-            if comp:
-                competition_ids.append(comp.id)
-
-        # Return queryset with found/created competitions
-        if competition_ids:
-            return Competition.objects.filter(id__in=competition_ids).order_by("name")
-        return Competition.objects.none()
+    model = Competition
 
     def get_result_label(self, item):
         """Return HTML with logo and name."""
@@ -0,0 +1,111 @@
+"""
+In-memory country index for the country autocomplete.
+
+The autocomplete fires on every keystroke, so instead of listing, lowercasing
+and rendering all ~250 django-countries entries per request, each process
+builds one index per active language on first use and reuses it:
+
+- names are casefolded and accent-folded ("cote" finds "Côte d'Ivoire")
+- a prefix map looks up name-prefix matches without scanning; word-start and
+  substring matches still take one pass over the precomputed folded names
+- the label HTML (flag icon + name) is rendered once
+
+Matches on the start of the name rank before matches on the start of a later
+word, which rank before other substring matches; ties keep alphabetical order.
+"""
+
+import threading
+import unicodedata
+from dataclasses import dataclass
+
+from django.utils.html import escape, format_html
+from django.utils.translation import get_language
+from django_countries import countries
+
+# Length of the prefix map keys; longer queries filter the bucket of their first characters
+PREFIX_KEY_LENGTH = 3
+
+
+def fold(text: str) -> str:
+    """Casefold ``text`` and strip accents."""
+    decomposed = unicodedata.normalize("NFKD", str(text).casefold())
+    return "".join(char for char in decomposed if not unicodedata.combining(char))
+
+
+@dataclass(frozen=True)
+class CountryEntry:
+    code: str
+    name: str
+    folded: str
+    label: str
+    word_starts: tuple[str, ...]  # folded name from each later word onwards
+
+
+def _word_starts(folded: str) -> tuple[str, ...]:
+    return tuple(folded[i:] for i in range(1, len(folded)) if not folded[i - 1].isalnum() and folded[i].isalnum())
+
+
+class CountryIndex:
+    """Precomputed, searchable list of countries for one language."""
+
+    def __init__(self, country_list):
+        self.entries = tuple(
+            CountryEntry(
+                code=code,
+                name=str(name),
+                folded=fold(name),
+                word_starts=_word_starts(fold(name)),
+                label=format_html(
+                    '<i class="fi fi-{code}"></i> {name}',
+                    code=escape(code.lower()),
+                    name=escape(str(name)),
+                ),
+            )
+            for code, name in country_list
+        )
+        self.choices = [(entry.code, entry.label) for entry in self.entries]
+        self._prefixes: dict[str, list[CountryEntry]] = {}
+        for entry in self.entries:
+            for length in range(1, PREFIX_KEY_LENGTH + 1):
+                if len(entry.folded) >= length:
+                    self._prefixes.setdefault(entry.folded[:length], []).append(entry)
+
+    def search(self, query: str) -> list[tuple[str, str]]:
+        """Return ``(code, label_html)`` pairs matching ``query``, best match first."""
+        folded_query = fold(query).strip()
+        if not folded_query:
+            return self.choices
+
+        prefix_candidates = self._prefixes.get(folded_query[:PREFIX_KEY_LENGTH], [])
+        prefix = [entry for entry in prefix_candidates if entry.folded.startswith(folded_query)]
+        word_start, substring = [], []
+        for entry in self.entries:
+            if folded_query not in entry.folded or entry.folded.startswith(folded_query):
+                continue
+            if any(rest.startswith(folded_query) for rest in entry.word_starts):
+                word_start.append(entry)
+            else:
+                substring.append(entry)
+        return [(entry.code, entry.label) for entry in (*prefix, *word_start, *substring)]
+
+
+_indexes: dict[str, CountryIndex] = {}
+_lock = threading.Lock()
+
+
+def get_country_index() -> CountryIndex:
+    """Return the index for the active language, building it on first use."""
+    language = get_language() or ""
+    index = _indexes.get(language)
+    if index is None:
+        with _lock:
+            index = _indexes.get(language)
+            if index is None:
+                index = _indexes[language] = CountryIndex(countries)
+    return index
+
+
+def clear_country_indexes() -> None:
+    """Drop built indexes (e.g. after changing COUNTRIES_* settings)."""
+    with _lock:
+        _indexes.clear()
@@ -0,0 +1,166 @@
+"""
+Batched sync of FKAPI search results into Brand, Club and Competition rows.
+
+Autocomplete views receive up to a few dozen entities per keystroke. Instead
+of one ``get_or_create`` (plus an optional ``save``) per result, a batch is
+synced with a fixed number of queries:
+
+1. one SELECT matching existing rows by ``id_fka``, name or slug
+2. one ``bulk_create(ignore_conflicts=True)`` for new rows, and one SELECT to
+   read their ids back (``ignore_conflicts`` does not return primary keys)
+3. one ``bulk_update`` back-filling blank fields and placeholder logos
+"""
+
+from dataclasses import dataclass
+
+from django.db.models import Model, Q
+from django.utils.text import slugify
+
+DEFAULT_LOGO_URL = "https://www.footballkitarchive.com/static/logos/not_found.png"
+# Fields written on create and back-filled on existing rows (when the model has them)
+SYNC_FIELDS = ("name", "slug", "logo", "logo_dark", "id_fka", "country")
+LOGO_FIELDS = ("logo", "logo_dark")
+# FKAPIClient search method for each model synced from FKAPI
+FKAPI_SEARCH_METHODS = {
+    "core.Brand": "search_brands",
+    "core.Club": "search_clubs",
+    "core.Competition": "search_competitions",
+}
+
+
+@dataclass
+class ApiEntity:
+    """Fields of one FKAPI brand, club or competition result."""
+
+    name: str
+    slug: str
+    logo: str
+    logo_dark: str
+    id_fka: int | None = None
+    country: str | None = None
+
+
+def logos_from_api(api_entity) -> tuple[str, str]:
+    if isinstance(api_entity, dict):
+        logo = api_entity.get("logo") or ""
+        logo_dark = api_entity.get("logo_dark") or ""
+    else:
+        logo = logo_dark = ""
+    return logo or DEFAULT_LOGO_URL, logo_dark or DEFAULT_LOGO_URL
+
+
+def _country_code_from_api(api_entity) -> str | None:
+    if not isinstance(api_entity, dict):
+        return None
+    country = api_entity.get("country")
+    if isinstance(country, dict):
+        return country.get("code") or country.get("name")
+    if isinstance(country, str):
+        return country
+    return None
+
+
+def entity_from_api(api_entity) -> ApiEntity | None:
+    """Build an ApiEntity from an FKAPI result (dict, or a bare name)."""
+    name = api_entity.get("name") if isinstance(api_entity, dict) else api_entity
+    if not name:
+        return None
+    logo, logo_dark = logos_from_api(api_entity)
+    return ApiEntity(
+        name=name,
+        slug=slugify(name),
+        logo=logo,
+        logo_dark=logo_dark,
+        id_fka=api_entity.get("id") if isinstance(api_entity, dict) else None,
+        country=_country_code_from_api(api_entity),
+    )
+
+
+def _is_placeholder_logo(value: str) -> bool:
+    return not value or value == DEFAULT_LOGO_URL
+
+
+def _needs_backfill(field: str, current, new) -> bool:
+    if field in LOGO_FIELDS:
+        return _is_placeholder_logo(current) and not _is_placeholder_logo(new)
+    return current in (None, "") and new not in (None, "")
+
+
+def _backfill(instance: Model, entity: ApiEntity, fields: tuple[str, ...]) -> set[str]:
+    """Fill blank fields and placeholder logos on an existing row; return changed fields."""
+    changed = set()
+    for field in fields:
+        new = getattr(entity, field)
+        if _needs_backfill(field, getattr(instance, field), new):
+            setattr(instance, field, new)
+            changed.add(field)
+    return changed
+
+
+def sync_api_entities(model: type[Model], entities: list[ApiEntity]) -> list[int]:
+    """
+    Create or update ``model`` rows for FKAPI results.
+
+    Existing rows are matched by ``id_fka`` first, then name, then slug, so a
+    result never collides with a row that already owns its slug.
+
+    Returns:
+        list: primary keys in the order the entities were given, without duplicates
+    """
+    if not entities:
+        return []
+
+    model_fields = {field.name for field in model._meta.concrete_fields}
+    fields = tuple(field for field in SYNC_FIELDS if field in model_fields)
+    ids_fka = {entity.id_fka for entity in entities if entity.id_fka is not None}
+    names = {entity.name for entity in entities}
+    slugs = {entity.slug for entity in entities}
+    existing = model.objects.filter(Q(id_fka__in=ids_fka) | Q(name__in=names) | Q(slug__in=slugs)).order_by("pk")
+
+    by_id_fka: dict[int, Model] = {}
+    by_name: dict[str, Model] = {}
+    by_slug: dict[str, Model] = {}
+    for row in existing:
+        if row.id_fka is not None:
+            by_id_fka.setdefault(row.id_fka, row)
+        by_name.setdefault(row.name, row)
+        by_slug[row.slug] = row
+
+    matched: list[Model | str] = []  # a row, or the slug of a row to create
+    to_create: dict[str, Model] = {}
+    to_update: dict[int, Model] = {}
+    update_fields: set[str] = set()
+    for entity in entities:
+        row = (
+            (by_id_fka.get(entity.id_fka) if entity.id_fka is not None else None)
+            or by_name.get(entity.name)
+            or by_slug.get(entity.slug)
+        )
+        if row is None:
+            if entity.slug not in to_create:
+                to_create[entity.slug] = model(**{field: getattr(entity, field) for field in fields})
+            matched.append(entity.slug)
+            continue
+        if changed := _backfill(row, entity, fields):
+            to_update[row.pk] = row
+            update_fields |= changed
+        matched.append(row)
+
+    if to_create:
+        model.objects.bulk_create(to_create.values(), ignore_conflicts=True)
+        by_slug.update(model.objects.filter(slug__in=to_create).in_bulk(field_name="slug"))
+    if to_update:
+        model.objects.bulk_update(to_update.values(), sorted(update_fields))
+
+    rows = (by_slug.get(item) if isinstance(item, str) else item for item in matched)
+    return list(dict.fromkeys(row.pk for row in rows if row is not None))
+
+
+def sync_fkapi_search(model: type[Model], query: str) -> list[int]:
+    """Search FKAPI for ``query`` and sync the results into ``model``; return their ids."""
+    from footycollect.api.client import FKAPIClient
+
+    method = FKAPI_SEARCH_METHODS[model._meta.label]
+    api_results = getattr(FKAPIClient(), method)(query)
+    entities = [entity for api_entity in api_results if (entity := entity_from_api(api_entity))]
+    return sync_api_entities(model, entities)
@@ -20,6 +20,24 @@ DEFAULTS = [
         "every": 1,
         "period": IntervalSchedule.DAYS,
     },
+    {
+        "name": "rebuild_feed_facet_counts",
+        "task": "footycollect.collection.tasks.rebuild_feed_facet_counts_task",
+        "every": 1,
+        "period": IntervalSchedule.HOURS,
+    },
+    {
+        "name": "rebuild_feed_entries",
+        "task": "footycollect.collection.tasks.rebuild_feed_entries_task",
+        "every": 1,
+        "period": IntervalSchedule.DAYS,
+    },
+    {
+        "name": "reshuffle_feed",
+        "task": "footycollect.collection.tasks.reshuffle_feed_task",
+        "every": 1,
+        "period": IntervalSchedule.DAYS,
+    },
 ]
 
 
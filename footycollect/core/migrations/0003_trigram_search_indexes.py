@@ -0,0 +1,45 @@
+from django.db import migrations
+
+# Trigram GIN indexes for local-first autocomplete (footycollect.core.search).
+# name: similarity (%) ranking, UPPER(name): icontains/istartswith as generated
+# by the ORM, slug/year: case-sensitive contains/startswith.
+TRIGRAM_INDEXES = [
+    ('core_club_name_trgm', 'core_club', 'name'),
+    ('core_club_name_upper_trgm', 'core_club', 'UPPER(name)'),
+    ('core_club_slug_trgm', 'core_club', 'slug'),
+    ('core_brand_name_trgm', 'core_brand', 'name'),
+    ('core_brand_name_upper_trgm', 'core_brand', 'UPPER(name)'),
+    ('core_brand_slug_trgm', 'core_brand', 'slug'),
+    ('core_competition_name_trgm', 'core_competition', 'name'),
+    ('core_competition_name_upper_trgm', 'core_competition', 'UPPER(name)'),
+    ('core_competition_slug_trgm', 'core_competition', 'slug'),
+    ('core_season_year_trgm', 'core_season', 'year'),
+]
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm;')
+    for name, table, expression in TRIGRAM_INDEXES:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {name} ON {table} USING gin (({expression}) gin_trgm_ops);'
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name, _table, _expression in TRIGRAM_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {name};')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0002_alter_typek_options_brand_logo_dark_file_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
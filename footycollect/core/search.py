@@ -0,0 +1,64 @@
+"""
+Local search over Club, Brand, Competition and Season for autocomplete.
+
+On PostgreSQL the lookups are served by the pg_trgm GIN indexes created in
+``core.migrations.0003_trigram_search_indexes``: substring matches on name
+and slug, plus trigram similarity so small typos still match. Other
+databases (SQLite in tests) fall back to plain ``icontains`` / ``contains``.
+
+Results are ranked prefix matches first, then by similarity, then by name.
+"""
+
+from django.db import connection
+from django.db.models import Case, IntegerField, Model, Q, QuerySet, Value, When
+from django.utils.text import slugify
+
+from .models import Season
+
+DEFAULT_RESULT_LIMIT = 20
+
+
+def _uses_trigrams() -> bool:
+    return connection.vendor == "postgresql"
+
+
+def search_entities(model: type[Model], query: str, limit: int = DEFAULT_RESULT_LIMIT) -> list[int]:
+    """Return ids of ``model`` rows whose name or slug matches ``query``, best match first."""
+    query = query.strip()
+    if not query:
+        return []
+    slug_query = slugify(query)
+
+    matches = Q(name__icontains=query)
+    if slug_query:
+        matches |= Q(slug__contains=slug_query)
+    qs = model.objects.annotate(
+        prefix_rank=Case(When(name__istartswith=query, then=Value(0)), default=Value(1), output_field=IntegerField()),
+    )
+    ordering = ["prefix_rank", "name"]
+
+    if _uses_trigrams():
+        from django.contrib.postgres.search import TrigramSimilarity
+
+        matches |= Q(name__trigram_similar=query)
+        qs = qs.annotate(similarity=TrigramSimilarity("name", query))
+        ordering = ["prefix_rank", "-similarity", "name"]
+
+    return list(qs.filter(matches).order_by(*ordering).values_list("pk", flat=True)[:limit])
+
+
+def search_seasons(query: str, limit: int = DEFAULT_RESULT_LIMIT) -> list[int]:
+    """Return ids of seasons whose year starts with ``query`` (e.g. "2023" or "2023-2"), newest first."""
+    query = query.strip()
+    if not query or not query[0].isdigit():
+        return []
+    qs = Season.objects.filter(year__startswith=query).order_by("-first_year", "-second_year")
+    return list(qs.values_list("pk", flat=True)[:limit])
+
+
+def in_order(model: type[Model], ids: list[int]) -> QuerySet:
+    """Return a queryset of ``ids`` that keeps their order."""
+    if not ids:
+        return model.objects.none()
+    position = Case(*[When(pk=pk, then=Value(i)) for i, pk in enumerate(ids)], output_field=IntegerField())
+    return model.objects.filter(pk__in=ids).order_by(position)
@@ -0,0 +1,132 @@
+"""
+Season lookup for free-text queries, shared by the season autocomplete and
+the ``/api/seasons/search/`` endpoint.
+
+FKAPI has no season search, so seasons are gathered from kit search results
+and from the season lists of the clubs matching the query
+(``fetch_season_sources`` runs those requests concurrently). The merged,
+de-duplicated list is cached per normalized query: seasons change rarely, so
+repeated and similar queries do not reach FKAPI again until the entry expires.
+Empty results, and results missing a source FKAPI did not answer, are only
+kept for a few minutes.
+"""
+
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .models import Season
+
+SEASON_PARTS_LENGTH = 2
+SEASON_SEARCH_CACHE_VERSION = 1
+SEASON_SEARCH_CACHE_TIMEOUT = 60 * 60 * 24
+# Empty or incomplete results
+SEASON_SEARCH_SHORT_CACHE_TIMEOUT = 60 * 10
+
+
+def _parse_season_year_parts(season_year):
+    parts = season_year.split("-")
+    first_year = parts[0]
+    second_year = parts[1] if len(parts) == SEASON_PARTS_LENGTH else ""
+    return first_year, second_year
+
+
+def _season_info_from_season_data(season_data):
+    if isinstance(season_data, dict):
+        season_year = season_data.get("year")
+        season_id_fka = season_data.get("id")
+    else:
+        season_year = str(season_data) if season_data else None
+        season_id_fka = None
+    if not season_year:
+        return None
+    first_year, second_year = _parse_season_year_parts(season_year)
+    return {"year": season_year, "first_year": first_year, "second_year": second_year, "id_fka": season_id_fka}
+
+
+def merge_season_sources(api_kits: list[dict], club_seasons: list[list[dict]]) -> list[dict]:
+    """Merge kit and club seasons into one list of season infos, unique by year, kit seasons first."""
+    seasons: dict[str, dict] = {}
+    for kit in api_kits:
+        season_data = kit.get("season") if isinstance(kit, dict) else None
+        info = _season_info_from_season_data(season_data) if season_data else None
+        if info:
+            seasons.setdefault(info["year"], info)
+    for club_season_list in club_seasons:
+        for season_data in club_season_list:
+            info = _season_info_from_season_data(season_data) if isinstance(season_data, dict) else None
+            if info:
+                seasons.setdefault(info["year"], info)
+    return list(seasons.values())
+
+
+def normalize_season_query(query: str) -> str:
+    return " ".join(query.split()).casefold()
+
+
+def _cache_key(query: str, club_limit: int) -> str:
+    digest = hashlib.sha256(query.encode()).hexdigest()[:16]
+    return f"season_search:v{SEASON_SEARCH_CACHE_VERSION}:{club_limit}:{digest}"
+
+
+def resolve_seasons(query: str, club_limit: int) -> list[dict]:
+    """
+    Return season infos (year, first_year, second_year, id_fka) for ``query``.
+
+    Served from the cache when the normalized query was resolved before;
+    otherwise fetched from FKAPI with the query as typed and cached.
+    """
+    from footycollect.api.async_client import fetch_season_sources
+
+    cache_key = _cache_key(normalize_season_query(query), club_limit)
+    seasons = cache.get(cache_key)
+    if seasons is None:
+        sources = fetch_season_sources(query, club_limit)
+        seasons = merge_season_sources(sources.kits, sources.club_seasons)
+        if seasons and sources.complete:
+            timeout = getattr(settings, "SEASON_SEARCH_CACHE_TIMEOUT", SEASON_SEARCH_CACHE_TIMEOUT)
+        else:
+            timeout = SEASON_SEARCH_SHORT_CACHE_TIMEOUT
+        cache.set(cache_key, seasons, timeout)
+    return seasons
+
+
+def upsert_seasons(seasons: list[dict]) -> list[int]:
+    """
+    Create missing ``Season`` rows for season infos and fill in missing FKAPI ids.
+
+    Runs a fixed number of queries however many seasons are given.
+
+    Returns:
+        list: Season primary keys, in the order given
+    """
+    if not seasons:
+        return []
+    years = [info["year"] for info in seasons]
+    existing = Season.objects.in_bulk(years, field_name="year")
+
+    missing = [
+        Season(
+            year=info["year"],
+            first_year=info["first_year"],
+            second_year=info["second_year"],
+            id_fka=info["id_fka"],
+        )
+        for info in seasons
+        if info["year"] not in existing
+    ]
+    if missing:
+        Season.objects.bulk_create(missing, ignore_conflicts=True)
+        existing.update(Season.objects.in_bulk([season.year for season in missing], field_name="year"))
+
+    to_update = []
+    for info in seasons:
+        season = existing.get(info["year"])
+        if season is not None and season.id_fka is None and info["id_fka"] is not None:
+            season.id_fka = info["id_fka"]
+            to_update.append(season)
+    if to_update:
+        Season.objects.bulk_update(to_update, ["id_fka"])
+
+    return [existing[year].pk for year in years if year in existing]
@@ -0,0 +1,20 @@
+import logging
+
+from celery import shared_task
+from django.apps import apps
+
+from .entity_sync import sync_fkapi_search
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task
+def enrich_autocomplete_task(model_label: str, query: str):
+    """Pull FKAPI search results for an autocomplete query into the local table."""
+    model = apps.get_model(model_label)
+    try:
+        ids = sync_fkapi_search(model, query)
+    except Exception:
+        logger.exception("Error enriching %s autocomplete from FKAPI", model_label)
+        raise
+    return len(ids)
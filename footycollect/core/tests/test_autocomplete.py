@@ -1,17 +1,25 @@
 """Tests for core autocomplete views."""
 
+import json
 from unittest.mock import MagicMock, patch
 
-from django.test import RequestFactory, TestCase
+from django.core.cache import cache
+from django.test import RequestFactory, TestCase, override_settings
 
+from footycollect.api.async_client import SeasonSources
 from footycollect.core.autocomplete import (
-    DEFAULT_LOGO_URL,
     BrandAutocomplete,
     ClubAutocomplete,
     CountryAutocomplete,
-    _logos_from_api,
+    SeasonAutocomplete,
 )
-from footycollect.core.models import Brand, Club
+from footycollect.core.entity_sync import DEFAULT_LOGO_URL, logos_from_api
+from footycollect.core.models import Brand, Club, Season
+
+CLUB_SEARCH_RESULTS = 20
+# local search + FKAPI sync (select, insert, re-select)
+CLUB_SYNC_QUERIES = 4
+LOCAL_MIN_RESULTS = 3
 
 
 class TestBrandAutocomplete(TestCase):
@@ -83,12 +91,122 @@ class TestClubAutocomplete(TestCase):
         assert qs.count() == 1
         assert qs.first().name == "FC Test"
 
+    @patch("footycollect.api.client.FKAPIClient")
+    def test_get_queryset_syncs_results_in_one_batch(self, mock_client_class):
+        mock_client = MagicMock()
+        mock_client.search_clubs.return_value = [
+            {"name": f"Batch Club {i}", "id": i, "logo": "https://club.png", "country": "SE"}
+            for i in range(CLUB_SEARCH_RESULTS)
+        ]
+        mock_client_class.return_value = mock_client
+        view_obj = ClubAutocomplete()
+        view_obj.request = RequestFactory().get("/", {"q": "batch"})
+        view_obj.q = "batch"
+
+        with self.assertNumQueries(CLUB_SYNC_QUERIES):
+            qs = view_obj.get_queryset()
+
+        assert qs.count() == CLUB_SEARCH_RESULTS
+
     def test_get_result_value_returns_id(self):
         view_obj = ClubAutocomplete()
         club = Club.objects.create(name="C", slug="c", country="ES", logo="")
         assert view_obj.get_result_value(club) == club.id
 
 
+@override_settings(AUTOCOMPLETE_LOCAL_MIN_RESULTS=LOCAL_MIN_RESULTS)
+class TestLocalFirstAutocomplete(TestCase):
+    def setUp(self):
+        cache.clear()
+        for name in ("Real Madrid", "Real Sociedad", "Real Betis", "Unreal FC"):
+            Club.objects.create(name=name, slug=name.lower().replace(" ", "-"), country="ES")
+
+    def _view(self, q):
+        view_obj = ClubAutocomplete()
+        view_obj.request = RequestFactory().get("/", {"q": q})
+        view_obj.q = q
+        return view_obj
+
+    @patch("footycollect.core.tasks.enrich_autocomplete_task.delay")
+    @patch("footycollect.api.client.FKAPIClient")
+    def test_enough_local_results_skip_fkapi_and_queue_enrichment(self, mock_client_class, mock_delay):
+        qs = self._view("real").get_queryset()
+
+        mock_client_class.assert_not_called()
+        mock_delay.assert_called_once_with("core.Club", "real")
+        names = list(qs.values_list("name", flat=True))
+        assert names[-1] == "Unreal FC"
+        assert set(names[:3]) == {"Real Madrid", "Real Sociedad", "Real Betis"}
+
+    @patch("footycollect.core.tasks.enrich_autocomplete_task.delay")
+    @patch("footycollect.api.client.FKAPIClient")
+    def test_enrichment_is_queued_once_per_interval(self, mock_client_class, mock_delay):
+        self._view("real").get_queryset()
+        self._view("REAL").get_queryset()
+
+        mock_delay.assert_called_once()
+
+    @patch("footycollect.core.tasks.enrich_autocomplete_task.delay")
+    @patch("footycollect.api.client.FKAPIClient")
+    def test_few_local_results_fall_back_to_fkapi(self, mock_client_class, mock_delay):
+        mock_client = MagicMock()
+        mock_client.search_clubs.return_value = [
+            {"name": "Betis Deportivo", "id": 7, "logo": "https://club.png", "country": "ES"},
+        ]
+        mock_client_class.return_value = mock_client
+
+        qs = self._view("betis").get_queryset()
+
+        mock_client.search_clubs.assert_called_once_with("betis")
+        mock_delay.assert_not_called()
+        assert list(qs.values_list("name", flat=True)) == ["Real Betis", "Betis Deportivo"]
+
+
+@override_settings(AUTOCOMPLETE_LOCAL_MIN_RESULTS=1)
+class TestSeasonAutocomplete(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    @patch("footycollect.api.async_client.fetch_season_sources")
+    def test_local_seasons_skip_fkapi(self, mock_fetch):
+        season = Season.objects.create(year="2023-24", first_year="2023", second_year="24")
+        view_obj = SeasonAutocomplete()
+        view_obj.q = "2023"
+
+        qs = view_obj.get_queryset()
+
+        mock_fetch.assert_not_called()
+        assert list(qs) == [season]
+
+    @patch("footycollect.api.async_client.fetch_season_sources")
+    def test_no_local_seasons_query_fkapi(self, mock_fetch):
+        mock_fetch.return_value = SeasonSources([], [], complete=True)
+        view_obj = SeasonAutocomplete()
+        view_obj.q = "1999"
+
+        qs = view_obj.get_queryset()
+
+        mock_fetch.assert_called_once_with("1999", SeasonAutocomplete.CLUB_LIMIT)
+        assert qs.count() == 0
+
+    @patch("footycollect.api.async_client.fetch_season_sources")
+    def test_fkapi_seasons_are_upserted_and_cached(self, mock_fetch):
+        mock_fetch.return_value = SeasonSources(
+            [{"season": {"year": "1998-99", "id": 9}}],
+            [[{"year": "1999-00", "id": 10}]],
+            complete=True,
+        )
+        view_obj = SeasonAutocomplete()
+        view_obj.q = "1999"
+
+        first = list(view_obj.get_queryset().values_list("year", flat=True))
+        view_obj.q = " 1999 "
+        second = list(view_obj.get_queryset().values_list("year", flat=True))
+
+        assert first == second == ["1999-00", "1998-99"]
+        mock_fetch.assert_called_once()
+
+
 class TestCountryAutocomplete(TestCase):
     def test_get_list_filters_by_query(self):
         view_obj = CountryAutocomplete()
@@ -124,14 +242,19 @@ class TestCountryAutocomplete(TestCase):
         result_item = ("ES", "Spain")
         assert view_obj.get_result_value(result_item) == "ES"
 
+    def test_get_returns_accent_folded_matches(self):
+        response = CountryAutocomplete.as_view()(RequestFactory().get("/", {"q": "cote"}))
+        results = json.loads(response.content)["results"]
+        assert [result["id"] for result in results] == ["CI"]
+
 
 class TestLogosFromApi(TestCase):
     def test_logos_from_api_dict_and_non_dict(self):
         api_entity = {"logo": "https://logo.png", "logo_dark": ""}
-        logo, logo_dark = _logos_from_api(api_entity)
+        logo, logo_dark = logos_from_api(api_entity)
         assert logo == "https://logo.png"
         assert logo_dark == DEFAULT_LOGO_URL
 
-        logo2, logo_dark2 = _logos_from_api("not-a-dict")
+        logo2, logo_dark2 = logos_from_api("not-a-dict")
         assert logo2 == DEFAULT_LOGO_URL
         assert logo_dark2 == DEFAULT_LOGO_URL
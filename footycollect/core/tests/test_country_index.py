@@ -0,0 +1,62 @@
+"""Tests for the in-memory country autocomplete index."""
+
+from django.test import SimpleTestCase
+from django.utils import translation
+
+from footycollect.core.country_index import CountryIndex, clear_country_indexes, fold, get_country_index
+
+COUNTRIES = [
+    ("AT", "Austria"),
+    ("AU", "Australia"),
+    ("CI", "Côte d'Ivoire"),
+    ("KN", "Saint Kitts and Nevis"),
+    ("US", "United States of America"),
+]
+
+
+class TestFold(SimpleTestCase):
+    def test_strips_accents_and_case(self):
+        assert fold("Côte d'Ivoire") == "cote d'ivoire"
+        assert fold("ÅLAND") == "aland"
+
+
+class TestCountryIndex(SimpleTestCase):
+    def setUp(self):
+        self.index = CountryIndex(COUNTRIES)
+
+    def _codes(self, query):
+        return [code for code, _label in self.index.search(query)]
+
+    def test_prefix_matches_rank_before_substring_matches(self):
+        assert self._codes("u") == ["US", "AT", "AU"]
+
+    def test_word_start_matches_rank_before_inner_substrings(self):
+        assert self._codes("st") == ["US", "AT", "AU"]
+        assert self._codes("a") == ["AT", "AU", "KN", "US"]
+
+    def test_accent_folded_query(self):
+        assert self._codes("COTE") == ["CI"]
+        assert self._codes("côte") == ["CI"]
+
+    def test_long_query_uses_prefix_map(self):
+        assert self._codes("australia") == ["AU"]
+
+    def test_blank_query_returns_everything(self):
+        assert self._codes("") == [code for code, _name in COUNTRIES]
+
+    def test_labels_are_prerendered_and_escaped(self):
+        _code, label = self.index.search("cote")[0]
+        assert label == '<i class="fi fi-ci"></i> Côte d&#x27;Ivoire'
+
+
+class TestGetCountryIndex(SimpleTestCase):
+    def tearDown(self):
+        clear_country_indexes()
+
+    def test_index_is_built_once_per_language(self):
+        with translation.override("en"):
+            english = get_country_index()
+            assert get_country_index() is english
+        with translation.override("es"):
+            spanish = get_country_index()
+        assert spanish is not english
@@ -0,0 +1,74 @@
+"""Tests for batched FKAPI entity sync."""
+
+from django.test import TestCase
+
+from footycollect.core.entity_sync import DEFAULT_LOGO_URL, ApiEntity, sync_api_entities
+from footycollect.core.models import Brand, Club, Competition
+
+CLUB_BATCH_SIZE = 20
+# SELECT existing, INSERT new, SELECT new ids
+NEW_BATCH_QUERIES = 3
+HAMMARBY_ID_FKA = 893
+
+
+def _entity(name, slug=None, **kwargs):
+    defaults = {"logo": f"https://logos.example/{name}.png", "logo_dark": DEFAULT_LOGO_URL}
+    return ApiEntity(name=name, slug=slug or name.lower().replace(" ", "-"), **{**defaults, **kwargs})
+
+
+class TestSyncApiEntities(TestCase):
+    def test_creates_new_rows_in_fixed_number_of_queries(self):
+        entities = [_entity(f"Club {i}", id_fka=i, country="ES") for i in range(CLUB_BATCH_SIZE)]
+
+        with self.assertNumQueries(NEW_BATCH_QUERIES):
+            ids = sync_api_entities(Club, entities)
+
+        assert len(ids) == CLUB_BATCH_SIZE
+        clubs = Club.objects.in_bulk(ids)
+        assert [clubs[pk].name for pk in ids] == [entity.name for entity in entities]
+        assert all(club.country == "ES" for club in clubs.values())
+
+    def test_backfills_existing_rows_with_one_update(self):
+        existing = Club.objects.create(name="Hammarby", slug="hammarby", logo=DEFAULT_LOGO_URL)
+
+        ids = sync_api_entities(Club, [_entity("Hammarby", id_fka=HAMMARBY_ID_FKA, country="SE")])
+
+        existing.refresh_from_db()
+        assert ids == [existing.pk]
+        assert existing.logo == "https://logos.example/Hammarby.png"
+        assert existing.id_fka == HAMMARBY_ID_FKA
+        assert existing.country == "SE"
+
+    def test_does_not_overwrite_real_values(self):
+        existing = Brand.objects.create(name="Nike", slug="nike", logo="https://own/nike.png", id_fka=1)
+
+        with self.assertNumQueries(1):
+            ids = sync_api_entities(Brand, [_entity("Nike", id_fka=2)])
+
+        existing.refresh_from_db()
+        assert ids == [existing.pk]
+        assert existing.logo == "https://own/nike.png"
+        assert existing.id_fka == 1
+
+    def test_matches_existing_slug_instead_of_conflicting(self):
+        existing = Competition.objects.create(name="J League", slug="j-league")
+
+        ids = sync_api_entities(Competition, [_entity("J-League", slug="j-league")])
+
+        assert ids == [existing.pk]
+        assert Competition.objects.count() == 1
+
+    def test_returns_ids_in_api_order_without_duplicates(self):
+        first = Brand.objects.create(name="Adidas", slug="adidas")
+
+        ids = sync_api_entities(
+            Brand,
+            [_entity("Puma", id_fka=3), _entity("Adidas"), _entity("Puma", id_fka=3)],
+        )
+
+        puma = Brand.objects.get(name="Puma")
+        assert ids == [puma.pk, first.pk]
+
+    def test_empty_batch_runs_no_queries(self):
+        with self.assertNumQueries(0):
+            assert sync_api_entities(Club, []) == []
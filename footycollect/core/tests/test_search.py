@@ -0,0 +1,54 @@
+"""Tests for local autocomplete search."""
+
+from django.test import TestCase
+
+from footycollect.core.models import Brand, Club, Season
+from footycollect.core.search import in_order, search_entities, search_seasons
+
+RESULT_LIMIT = 2
+
+
+class TestSearchEntities(TestCase):
+    def setUp(self):
+        for name in ("Athletic Club", "Club Brugge", "Atlético Madrid"):
+            Club.objects.create(name=name, slug=name.lower().replace(" ", "-"), country="ES")
+
+    def test_prefix_matches_rank_first(self):
+        ids = search_entities(Club, "club")
+        names = list(in_order(Club, ids).values_list("name", flat=True))
+        assert names == ["Club Brugge", "Athletic Club"]
+
+    def test_matches_slug(self):
+        club = Club.objects.create(name="Borussia Mönchengladbach", slug="borussia-monchengladbach", country="DE")
+        assert search_entities(Club, "monchengladbach") == [club.pk]
+
+    def test_respects_limit(self):
+        Brand.objects.create(name="Adidas", slug="adidas")
+        Brand.objects.create(name="Adidas Originals", slug="adidas-originals")
+        Brand.objects.create(name="Le Coq Adidas", slug="le-coq-adidas")
+        assert len(search_entities(Brand, "adidas", limit=RESULT_LIMIT)) == RESULT_LIMIT
+
+    def test_blank_query_returns_nothing(self):
+        assert search_entities(Club, "  ") == []
+
+
+class TestSearchSeasons(TestCase):
+    def test_matches_year_prefix_newest_first(self):
+        older = Season.objects.create(year="2022-23", first_year="2022", second_year="23")
+        newer = Season.objects.create(year="2023-24", first_year="2023", second_year="24")
+        Season.objects.create(year="1999-00", first_year="1999", second_year="00")
+        assert search_seasons("202") == [newer.pk, older.pk]
+
+    def test_non_numeric_query_returns_nothing(self):
+        Season.objects.create(year="2023-24", first_year="2023", second_year="24")
+        assert search_seasons("ab") == []
+
+
+class TestInOrder(TestCase):
+    def test_keeps_given_order(self):
+        first = Brand.objects.create(name="A", slug="a")
+        second = Brand.objects.create(name="B", slug="b")
+        assert list(in_order(Brand, [second.pk, first.pk])) == [second, first]
+
+    def test_empty_ids(self):
+        assert not in_order(Brand, []).exists()
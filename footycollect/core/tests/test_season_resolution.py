@@ -0,0 +1,81 @@
+"""Tests for season resolution from FKAPI search results."""
+
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import TestCase
+
+from footycollect.api.async_client import SeasonSources
+from footycollect.core.models import Season
+from footycollect.core.season_resolution import (
+    SEASON_SEARCH_SHORT_CACHE_TIMEOUT,
+    merge_season_sources,
+    resolve_seasons,
+    upsert_seasons,
+)
+
+CLUB_LIMIT = 3
+UPSERT_QUERIES = 4  # select, insert, re-select, backfill
+
+
+class TestMergeSeasonSources(TestCase):
+    def test_dedupes_by_year_kit_seasons_first(self):
+        seasons = merge_season_sources(
+            [{"season": {"year": "2023-24", "id": 1}}, {"season": "2022-23"}, {"name": "no season"}],
+            [[{"year": "2023-24", "id": 99}, {"year": "2021", "id": 3}], ["not-a-dict"]],
+        )
+        assert [(info["year"], info["id_fka"]) for info in seasons] == [
+            ("2023-24", 1),
+            ("2022-23", None),
+            ("2021", 3),
+        ]
+        assert seasons[2]["first_year"] == "2021"
+        assert seasons[2]["second_year"] == ""
+
+
+class TestResolveSeasons(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    @patch("footycollect.api.async_client.fetch_season_sources")
+    def test_caches_per_normalized_query(self, mock_fetch):
+        mock_fetch.return_value = SeasonSources([{"season": {"year": "2023-24", "id": 1}}], [], complete=True)
+
+        first = resolve_seasons("Real  Madrid", CLUB_LIMIT)
+        second = resolve_seasons(" real madrid", CLUB_LIMIT)
+
+        assert first == second
+        # Only the cache key is normalized; FKAPI gets the query as typed
+        mock_fetch.assert_called_once_with("Real  Madrid", CLUB_LIMIT)
+
+    @patch("footycollect.core.season_resolution.cache.set")
+    @patch("footycollect.api.async_client.fetch_season_sources")
+    def test_incomplete_sources_are_cached_briefly(self, mock_fetch, mock_set):
+        mock_fetch.return_value = SeasonSources([], [[{"year": "2023-24", "id": 1}]], complete=False)
+
+        assert [season["year"] for season in resolve_seasons("Betis", CLUB_LIMIT)] == ["2023-24"]
+
+        assert mock_set.call_args.args[2] == SEASON_SEARCH_SHORT_CACHE_TIMEOUT
+
+
+class TestUpsertSeasons(TestCase):
+    def test_creates_missing_and_backfills_ids_in_fixed_queries(self):
+        existing = Season.objects.create(year="2022-23", first_year="2022", second_year="23")
+        infos = merge_season_sources(
+            [],
+            [[{"year": "2023-24", "id": 1}, {"year": "2022-23", "id": 2}, {"year": "2021-22", "id": 3}]],
+        )
+
+        with self.assertNumQueries(UPSERT_QUERIES):
+            ids = upsert_seasons(infos)
+
+        assert ids == [
+            Season.objects.get(year="2023-24").pk,
+            existing.pk,
+            Season.objects.get(year="2021-22").pk,
+        ]
+        existing.refresh_from_db()
+        assert existing.id_fka == 2  # noqa: PLR2004
+
+    def test_empty_input(self):
+        assert upsert_seasons([]) == []
@@ -100,6 +100,14 @@ class TestUserItemListView(TestCase):
         assert len(response.context["items"]) == 1
         assert response.context["current_filters"]["competition"] == self.league.slug
 
+    def test_user_items_view_competition_filter_excludes_other_competitions(self):
+        Competition.objects.create(name="Cup B", slug="cup-b")
+        self.client.force_login(self.other_user)
+        response = self.client.get(self._get_url(competition="cup-b"), follow=True)
+
+        assert response.status_code == HTTPStatus.OK
+        assert len(response.context["items"]) == 0
+
     def test_user_items_view_filters_by_brand(self):
         self.client.force_login(self.other_user)
         response = self.client.get(self._get_url(brand=self.brand.slug), follow=True)
@@ -11,6 +11,7 @@ from django.utils.translation import gettext_lazy as _
 from django.views.generic import DetailView, ListView, RedirectView, UpdateView
 
 from footycollect.collection.models import Jersey
+from footycollect.collection.services.feed_service import item_relation_exists
 from footycollect.collection.services.item_service import ItemService
 from footycollect.users.forms import UserUpdateForm
 from footycollect.users.models import User
@@ -92,7 +93,7 @@ class UserItemListView(LoginRequiredMixin, ListView):
 
         competition_slug = self.request.GET.get("competition")
         if competition_slug:
-            queryset = queryset.filter(base_item__competitions__slug=competition_slug).distinct()
+            queryset = queryset.filter(item_relation_exists("competitions", competition__slug=competition_slug))
             self.filter_params["competition"] = competition_slug
 
         color_id = self._get_color_filter_value()